@@ -0,0 +1 @@
+"""Benchmarks module - Performance measurements (run with python -m benchmarks.<name>)"""
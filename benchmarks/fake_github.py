@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GitHub REST API
+
+Implements the repository, contents and git data endpoints GitHubClient
+uses on one in-memory repository, with configurable latency and randomly
+injected 429 / 400 responses.
+
+Usage:
+    python -m benchmarks.fake_github [--port 8082] [--owner me] [--repo leetcode-solutions]
+
+Point github.api_url at the printed URL.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+STATS_PATH = "/_bench/stats"  # GET: request counters as JSON
+RESET_PATH = "/_bench/reset"  # POST: zero the counters
+
+
+def blob_sha(data: bytes) -> str:
+    """Git blob SHA-1 of file content"""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class Repository:
+    """
+    In-memory git repository
+    
+    Trees are stored flat (path -> blob SHA); subtree SHAs are derived on
+    demand for listings.
+    """
+    
+    def __init__(self, branch: str = "main"):
+        """
+        Create a repository with an empty initial commit
+        
+        Args:
+            branch: Default branch name
+        """
+        self.branch = branch
+        self.blobs: Dict[str, bytes] = {}
+        self.trees: Dict[str, Dict[str, str]] = {}
+        self.commits: Dict[str, Dict[str, Any]] = {}
+        self.refs: Dict[str, str] = {}
+        self.lock = threading.RLock()
+        self.refs[branch] = self.put_commit("Initial commit", self.put_tree({}), [])
+    
+    @staticmethod
+    def tree_sha(flat: Dict[str, str]) -> str:
+        """SHA identifying a flat tree"""
+        return hashlib.sha1(b"tree" + json.dumps(sorted(flat.items())).encode()).hexdigest()
+    
+    def put_tree(self, flat: Dict[str, str]) -> str:
+        """Store a flat tree and its subtrees, returning its SHA"""
+        sha = self.tree_sha(flat)
+        if sha in self.trees:
+            return sha
+        self.trees[sha] = dict(flat)
+        for sub in self.subtrees(flat).values():
+            self.put_tree(sub)
+        return sha
+    
+    @staticmethod
+    def subtrees(flat: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+        """Top-level directories of a flat tree and their contents"""
+        children: Dict[str, Dict[str, str]] = {}
+        for path, sha in flat.items():
+            if "/" in path:
+                directory, rest = path.split("/", 1)
+                children.setdefault(directory, {})[rest] = sha
+        return children
+    
+    def put_commit(self, message: str, tree: str, parents: List[str]) -> str:
+        """Store a commit, returning its SHA"""
+        sha = hashlib.sha1(f"{message}{tree}{parents}{time.time()}{len(self.commits)}".encode()).hexdigest()
+        self.commits[sha] = {"message": message, "tree": tree, "parents": parents}
+        return sha
+    
+    def head_tree(self) -> Dict[str, str]:
+        """Flat tree of the default branch"""
+        return self.trees[self.commits[self.refs[self.branch]]["tree"]]
+    
+    def files(self) -> Dict[str, str]:
+        """Files on the default branch (path -> text)"""
+        return {path: self.blobs[sha].decode() for path, sha in self.head_tree().items()}
+    
+    def commit_file(self, path: str, data: bytes, message: str) -> Tuple[str, str]:
+        """Commit one file to the default branch, returning (blob SHA, commit SHA)"""
+        with self.lock:
+            flat = dict(self.head_tree())
+            sha = blob_sha(data)
+            self.blobs[sha] = data
+            flat[path] = sha
+            commit = self.put_commit(message, self.put_tree(flat), [self.refs[self.branch]])
+            self.refs[self.branch] = commit
+            return sha, commit
+    
+    def descends_from(self, commit: str, ancestor: str) -> bool:
+        """Check if a commit has another in its history"""
+        seen, stack = set(), [commit]
+        while stack:
+            sha = stack.pop()
+            if sha == ancestor:
+                return True
+            if sha not in seen and sha in self.commits:
+                seen.add(sha)
+                stack.extend(self.commits[sha]["parents"])
+        return False
+
+
+class FakeGitHub:
+    """Threaded HTTP server exposing one Repository through the GitHub REST API"""
+    
+    def __init__(self, owner: str = "me", repo: str = "leetcode-solutions", branch: str = "main",
+                 port: int = 0, latency: float = 0.0, error_429: float = 0.0, error_400: float = 0.0,
+                 retry_after: int = 1, truncate_over: Optional[int] = None, seed: int = 7):
+        """
+        Create the server (call start() to serve)
+        
+        Args:
+            owner: Repository owner (also the authenticated user)
+            repo: Repository name
+            branch: Default branch name
+            port: Port to listen on (0 = any free port)
+            latency: Seconds added to every response
+            error_429: Probability of answering a request with 429 Too Many Requests
+            error_400: Probability of answering a request with 400 Bad Request
+            retry_after: Retry-After seconds sent with injected 429s
+            truncate_over: Truncate recursive tree listings longer than this
+            seed: Random seed for error injection
+        """
+        self.owner = owner
+        self.repo_name = repo
+        self.repo = Repository(branch)
+        self.latency = latency
+        self.error_429 = error_429
+        self.error_400 = error_400
+        self.retry_after = retry_after
+        self.truncate_over = truncate_over
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+    
+    @property
+    def url(self) -> str:
+        """REST API root"""
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+    
+    def start(self) -> "FakeGitHub":
+        """Serve from a daemon thread"""
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+    
+    def stop(self):
+        """Stop serving"""
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def count(self, key: str, amount: int = 1):
+        """Add to a request counter"""
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + amount
+    
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the request counters"""
+        with self._lock:
+            return dict(self.stats)
+    
+    def reset(self):
+        """Zero the request counters"""
+        with self._lock:
+            self.stats.clear()
+    
+    def inject(self) -> Optional[int]:
+        """Pick an injected error status for a request, if any"""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.error_429:
+            return 429
+        if roll < self.error_429 + self.error_400:
+            return 400
+        return None
+    
+    def _handler(self):
+        """Build the request handler class bound to this server"""
+        fake = self
+        store = self.repo
+        base = f"/repos/{self.owner}/{self.repo_name}"
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def log_message(self, *args):
+                pass
+            
+            def _send(self, status: int, body: Any = None, headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(body if body is not None else {}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+                fake.count("bytes sent", len(data))
+            
+            def _body(self) -> Dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length)) if length else {}
+            
+            def _url(self, path: str) -> str:
+                return f"http://{self.headers.get('Host')}{path}"
+            
+            def _begin(self, body: bool = False) -> Tuple[bool, Dict[str, Any]]:
+                """Count the request and apply latency and injected errors"""
+                payload = self._body() if body else {}
+                fake.count("requests")
+                if fake.latency:
+                    time.sleep(fake.latency)
+                status = fake.inject()
+                if status == 429:
+                    fake.count("injected 429")
+                    self._send(429, {"message": "API rate limit exceeded"},
+                               {"Retry-After": str(fake.retry_after)})
+                    return False, payload
+                if status == 400:
+                    fake.count("injected 400")
+                    self._send(400, {"message": "Problems parsing JSON"})
+                    return False, payload
+                return True, payload
+            
+            def _tree_json(self, sha: str, recursive: bool) -> Dict[str, Any]:
+                flat = store.trees[sha]
+                entries = []
+                if recursive:
+                    directories = set()
+                    for path, blob in sorted(flat.items()):
+                        parts = path.split("/")
+                        directories.update("/".join(parts[:i]) for i in range(1, len(parts)))
+                        entries.append({"path": path, "mode": "100644", "type": "blob",
+                                        "sha": blob, "size": len(store.blobs[blob])})
+                    for directory in sorted(directories):
+                        prefix = f"{directory}/"
+                        sub = {p[len(prefix):]: s for p, s in flat.items() if p.startswith(prefix)}
+                        entries.append({"path": directory, "mode": "040000", "type": "tree",
+                                        "sha": store.tree_sha(sub)})
+                else:
+                    for path, blob in sorted(flat.items()):
+                        if "/" not in path:
+                            entries.append({"path": path, "mode": "100644", "type": "blob",
+                                            "sha": blob, "size": len(store.blobs[blob])})
+                    for directory, sub in sorted(store.subtrees(flat).items()):
+                        entries.append({"path": directory, "mode": "040000", "type": "tree",
+                                        "sha": store.tree_sha(sub)})
+                truncated = bool(recursive and fake.truncate_over and len(entries) > fake.truncate_over)
+                if truncated:
+                    entries = entries[:fake.truncate_over]
+                return {"sha": sha, "url": self._url(f"{base}/git/trees/{sha}"),
+                        "tree": entries, "truncated": truncated}
+            
+            def _commit_json(self, sha: str) -> Dict[str, Any]:
+                commit = store.commits[sha]
+                return {"sha": sha, "url": self._url(f"{base}/git/commits/{sha}"),
+                        "message": commit["message"],
+                        "tree": {"sha": commit["tree"], "url": self._url(f"{base}/git/trees/{commit['tree']}")},
+                        "parents": [{"sha": parent, "url": self._url(f"{base}/git/commits/{parent}")}
+                                    for parent in commit["parents"]]}
+            
+            def _ref_json(self, name: str) -> Dict[str, Any]:
+                sha = store.refs[name]
+                return {"ref": f"refs/heads/{name}", "url": self._url(f"{base}/git/refs/heads/{name}"),
+                        "object": {"sha": sha, "type": "commit",
+                                   "url": self._url(f"{base}/git/commits/{sha}")}}
+            
+            def _content_json(self, path: str, sha: str) -> Dict[str, Any]:
+                data = store.blobs[sha]
+                return {"type": "file", "encoding": "base64", "size": len(data),
+                        "name": path.rsplit("/", 1)[-1], "path": path, "sha": sha,
+                        "content": base64.b64encode(data).decode(),
+                        "url": self._url(f"{base}/contents/{path}")}
+            
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path, query = parsed.path, parse_qs(parsed.query)
+                if path == STATS_PATH:
+                    return self._send(200, fake.snapshot())
+                
+                ok, _ = self._begin()
+                if not ok:
+                    return
+                
+                if path == "/user":
+                    fake.count("GET user")
+                    return self._send(200, {"login": fake.owner, "url": self._url("/user")})
+                if path == base:
+                    fake.count("GET repo")
+                    return self._send(200, {"name": fake.repo_name, "full_name": f"{fake.owner}/{fake.repo_name}",
+                                            "url": self._url(base), "default_branch": store.branch,
+                                            "html_url": f"https://github.com/{fake.owner}/{fake.repo_name}"})
+                
+                match = re.match(rf"{base}/git/refs/heads/(.+)$", path)
+                if match:
+                    fake.count("GET ref")
+                    if match.group(1) not in store.refs:
+                        return self._send(404, {"message": "Not Found"})
+                    return self._send(200, self._ref_json(match.group(1)))
+                match = re.match(rf"{base}/git/commits/(\w+)$", path)
+                if match:
+                    fake.count("GET commit")
+                    return self._send(200, self._commit_json(match.group(1)))
+                match = re.match(rf"{base}/git/trees/(\w+)$", path)
+                if match:
+                    fake.count("GET tree")
+                    if match.group(1) not in store.trees:
+                        return self._send(404, {"message": "Not Found"})
+                    return self._send(200, self._tree_json(match.group(1), query.get("recursive") == ["1"]))
+                match = re.match(rf"{base}/git/blobs/(\w+)$", path)
+                if match:
+                    fake.count("GET blob")
+                    data = store.blobs[match.group(1)]
+                    return self._send(200, {"sha": match.group(1), "encoding": "base64", "size": len(data),
+                                            "content": base64.b64encode(data).decode(), "url": self._url(path)})
+                match = re.match(rf"{base}/contents/(.+)$", path)
+                if match:
+                    fake.count("GET contents")
+                    file_path = unquote(match.group(1))
+                    flat = store.head_tree()
+                    if file_path in flat:
+                        return self._send(200, self._content_json(file_path, flat[file_path]))
+                    return self._send(404, {"message": "Not Found"})
+                self._send(404, {"message": f"Unhandled GET {path}"})
+            
+            def do_POST(self):
+                path = urlparse(self.path).path
+                if path == RESET_PATH:
+                    self._body()
+                    fake.reset()
+                    return self._send(200, {})
+                
+                ok, body = self._begin(body=True)
+                if not ok:
+                    return
+                
+                if path == f"{base}/git/blobs":
+                    fake.count("POST blob")
+                    if body.get("encoding") == "utf-8":
+                        data = body["content"].encode()
+                    else:
+                        data = base64.b64decode(body["content"])
+                    sha = blob_sha(data)
+                    with store.lock:
+                        store.blobs[sha] = data
+                    return self._send(201, {"sha": sha, "url": self._url(f"{base}/git/blobs/{sha}")})
+                if path == f"{base}/git/trees":
+                    fake.count("POST tree")
+                    with store.lock:
+                        flat = dict(store.trees[body["base_tree"]]) if body.get("base_tree") else {}
+                        for entry in body["tree"]:
+                            if entry.get("sha") is None:
+                                flat.pop(entry["path"], None)
+                            else:
+                                flat[entry["path"]] = entry["sha"]
+                        sha = store.put_tree(flat)
+                    return self._send(201, self._tree_json(sha, False))
+                if path == f"{base}/git/commits":
+                    fake.count("POST commit")
+                    with store.lock:
+                        sha = store.put_commit(body["message"], body["tree"], body.get("parents", []))
+                    return self._send(201, self._commit_json(sha))
+                self._send(404, {"message": f"Unhandled POST {path}"})
+            
+            def do_PATCH(self):
+                path = urlparse(self.path).path
+                ok, body = self._begin(body=True)
+                if not ok:
+                    return
+                
+                match = re.match(rf"{base}/git/refs/heads/(.+)$", path)
+                if match:
+                    fake.count("PATCH ref")
+                    name = match.group(1)
+                    with store.lock:
+                        if not body.get("force") and not store.descends_from(body["sha"], store.refs[name]):
+                            return self._send(422, {"message": "Update is not a fast forward"})
+                        store.refs[name] = body["sha"]
+                    return self._send(200, self._ref_json(name))
+                self._send(404, {"message": f"Unhandled PATCH {path}"})
+            
+            def do_PUT(self):
+                path = urlparse(self.path).path
+                ok, body = self._begin(body=True)
+                if not ok:
+                    return
+                
+                match = re.match(rf"{base}/contents/(.+)$", path)
+                if match:
+                    fake.count("PUT contents")
+                    file_path = unquote(match.group(1))
+                    flat = store.head_tree()
+                    if file_path in flat and body.get("sha") != flat[file_path]:
+                        return self._send(409, {"message": "sha does not match"})
+                    if file_path not in flat and body.get("sha"):
+                        return self._send(404, {"message": "Not Found"})
+                    sha, commit = store.commit_file(file_path, base64.b64decode(body["content"]), body["message"])
+                    return self._send(200 if file_path in flat else 201,
+                                      {"content": self._content_json(file_path, sha),
+                                       "commit": self._commit_json(commit)})
+                self._send(404, {"message": f"Unhandled PUT {path}"})
+        
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the GitHub REST API")
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument("--owner", default="me", help="Repository owner")
+    parser.add_argument("--repo", default="leetcode-solutions", help="Repository name")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--error-429", type=float, default=0.0, help="Probability of a 429 response")
+    parser.add_argument("--error-400", type=float, default=0.0, help="Probability of a 400 response")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After of injected 429s (seconds)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    fake = FakeGitHub(args.owner, args.repo, port=args.port, latency=args.latency,
+                      error_429=args.error_429, error_400=args.error_400,
+                      retry_after=args.retry_after, seed=args.seed)
+    print(f"Serving {args.owner}/{args.repo} at {fake.url}")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the LeetCode GraphQL API
+
+Serves a synthetic account through the queries LeetCodeClient issues
+(submissionList, recentAcSubmissionList, batched submissionDetails and
+question lookups, userStatus), with configurable latency and randomly
+injected 429 / 400 responses. The account is generated from a seed, so
+repeated runs see the same history.
+
+Usage:
+    python -m benchmarks.fake_leetcode [--port 8081] [--submissions 1000] [--latency 0.05]
+
+Point leetcode.api_endpoint at the printed URL.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+TAGS = ["Database", "Array", "String", "Dynamic Programming", "Tree", "Graph", "Linked List",
+        "Binary Search", "Depth-First Search", "Breadth-First Search", "Backtracking", "Greedy",
+        "Two Pointers", "Math", "Bit Manipulation", "Stack", "Design", "Sorting",
+        "Hash Table", "Matrix", "Sliding Window", "Prefix Sum"]
+LANGUAGES = ["python3", "java", "cpp", "mysql", "javascript", "golang", "rust", "typescript"]
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+STATEMENT = "<p>Given an input, return the expected output.</p>\n<pre>Example: 1 -&gt; 1</pre>\n"
+
+STATS_PATH = "/_bench/stats"  # GET: request counters as JSON
+RESET_PATH = "/_bench/reset"  # POST: zero the counters
+
+# alias: submissionDetails(submissionId: $variable) / alias: question(titleSlug: $variable)
+ALIAS_PATTERN = re.compile(r"(\w+): (submissionDetails|question)\(\w+: \$(\w+)\)")
+
+
+class SyntheticAccount:
+    """
+    A deterministic LeetCode account
+    
+    Submission IDs run from 1 (oldest) to `submissions` (newest), one per
+    `interval` seconds ending a minute before the account was created.
+    """
+    
+    def __init__(self, submissions: int, problems: int, accepted_ratio: float = 0.7,
+                 code_size: int = 600, interval: int = 300, seed: int = 7):
+        """
+        Generate an account
+        
+        Args:
+            submissions: Number of submissions
+            problems: Number of distinct problems they are spread over
+            accepted_ratio: Share of submissions that are accepted
+            code_size: Approximate characters of code per submission
+            interval: Seconds between consecutive submissions
+            seed: Random seed
+        """
+        rng = random.Random(seed)
+        self.count = max(0, submissions)
+        self.code_size = code_size
+        self.newest = int(time.time()) - 60
+        self.interval = interval
+        
+        self.problems: List[Dict[str, Any]] = []
+        for i in range(max(1, problems)):
+            slug = f"synthetic-problem-{i + 1}"
+            self.problems.append({
+                "questionId": str(i + 1),
+                "title": f"Synthetic Problem {i + 1}",
+                "titleSlug": slug,
+                "difficulty": rng.choice(DIFFICULTIES),
+                "topicTags": [{"name": tag, "slug": tag.lower().replace(" ", "-")}
+                              for tag in rng.sample(TAGS, rng.randint(1, 3))]
+            })
+        self.by_slug = {problem["titleSlug"]: problem for problem in self.problems}
+        
+        # Index 0 is unused so submission IDs index the lists directly
+        self.problem_of = [0] + [rng.randrange(len(self.problems)) for _ in range(self.count)]
+        self.accepted = [False] + [rng.random() < accepted_ratio for _ in range(self.count)]
+        self.language = [""] + [rng.choice(LANGUAGES) for _ in range(self.count)]
+    
+    def timestamp(self, submission_id: int) -> int:
+        """Submission time of an ID"""
+        return self.newest - (self.count - submission_id) * self.interval
+    
+    def summary(self, submission_id: int) -> Dict[str, Any]:
+        """Submission list entry"""
+        problem = self.problems[self.problem_of[submission_id]]
+        return {
+            "id": str(submission_id),
+            "title": problem["title"],
+            "titleSlug": problem["titleSlug"],
+            "timestamp": str(self.timestamp(submission_id)),
+            "statusDisplay": "Accepted" if self.accepted[submission_id] else "Wrong Answer"
+        }
+    
+    def detail(self, submission_id: int) -> Optional[Dict[str, Any]]:
+        """submissionDetails payload, or None for an unknown ID"""
+        if not 1 <= submission_id <= self.count:
+            return None
+        line = f"    step_{submission_id} = solve(step_{submission_id - 1})  # keep going\n"
+        return {
+            "id": str(submission_id),
+            "code": "def solve(data):\n" + line * max(1, self.code_size // len(line)),
+            "timestamp": self.timestamp(submission_id),
+            "lang": {"name": self.language[submission_id]},
+            "runtimeDisplay": f"{submission_id % 300} ms",
+            "memoryDisplay": f"{10 + submission_id % 50}.{submission_id % 10} MB",
+            "question": {"titleSlug": self.problems[self.problem_of[submission_id]]["titleSlug"]}
+        }
+    
+    def question(self, slug: str, with_content: bool) -> Optional[Dict[str, Any]]:
+        """question payload, or None for an unknown slug"""
+        problem = self.by_slug.get(slug)
+        if problem is None:
+            return None
+        if with_content:
+            return dict(problem, content=STATEMENT * 20)
+        return problem
+
+
+class FakeLeetCode:
+    """Threaded HTTP server answering LeetCode GraphQL queries for a SyntheticAccount"""
+    
+    def __init__(self, account: SyntheticAccount, port: int = 0, latency: float = 0.0,
+                 error_429: float = 0.0, error_400: float = 0.0, retry_after: int = 1,
+                 seed: int = 7):
+        """
+        Create the server (call start() to serve)
+        
+        Args:
+            account: Account to serve
+            port: Port to listen on (0 = any free port)
+            latency: Seconds added to every response
+            error_429: Probability of answering a request with 429 Too Many Requests
+            error_400: Probability of answering a request with 400 Bad Request
+            retry_after: Retry-After seconds sent with injected 429s
+            seed: Random seed for error injection
+        """
+        self.account = account
+        self.latency = latency
+        self.error_429 = error_429
+        self.error_400 = error_400
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+    
+    @property
+    def url(self) -> str:
+        """GraphQL endpoint URL"""
+        return f"http://127.0.0.1:{self.server.server_address[1]}/graphql"
+    
+    def start(self) -> "FakeLeetCode":
+        """Serve from a daemon thread"""
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+    
+    def stop(self):
+        """Stop serving"""
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def count(self, key: str, amount: int = 1):
+        """Add to a request counter"""
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + amount
+    
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the request counters"""
+        with self._lock:
+            return dict(self.stats)
+    
+    def reset(self):
+        """Zero the request counters"""
+        with self._lock:
+            self.stats.clear()
+    
+    def inject(self) -> Optional[int]:
+        """Pick an injected error status for a request, if any"""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.error_429:
+            return 429
+        if roll < self.error_429 + self.error_400:
+            return 400
+        return None
+    
+    def answer(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve a GraphQL request
+        
+        Args:
+            query: Query text
+            variables: Query variables
+        
+        Returns:
+            Response body
+        """
+        account = self.account
+        
+        if "submissionList(" in query:
+            self.count("submissionList")
+            offset, limit = variables["offset"], variables["limit"]
+            if offset and variables.get("lastKey") != f"key-{offset}":
+                return {"errors": [{"message": "invalid lastKey"}], "data": None}
+            newest = account.count - offset
+            ids = range(newest, max(0, newest - limit), -1)
+            return {"data": {"submissionList": {
+                "lastKey": f"key-{offset + limit}",
+                "hasNext": offset + limit < account.count,
+                "submissions": [account.summary(i) for i in ids]
+            }}}
+        
+        if "recentAcSubmissionList(" in query:
+            self.count("recentAcSubmissionList")
+            recent = []
+            for i in range(account.count, 0, -1):
+                if len(recent) >= variables.get("limit", 20):
+                    break
+                if account.accepted[i]:
+                    summary = account.summary(i)
+                    del summary["statusDisplay"]
+                    recent.append(summary)
+            return {"data": {"recentAcSubmissionList": recent}}
+        
+        if "userStatus" in query:
+            self.count("userStatus")
+            return {"data": {"userStatus": {"isSignedIn": True, "username": "benchmark"}}}
+        
+        with_content = re.search(r"\bcontent\b", query) is not None
+        lookups = ALIAS_PATTERN.findall(query)
+        if not lookups:
+            # Single lookup: the field name is the response key
+            if "submissionDetails(" in query:
+                lookups = [("submissionDetails", "submissionDetails", "submissionId")]
+            elif "question(" in query:
+                lookups = [("question", "question", "titleSlug")]
+            else:
+                self.count("unknown")
+                return {"errors": [{"message": "unsupported query"}], "data": None}
+        
+        data = {}
+        for alias, kind, variable in lookups:
+            if kind == "submissionDetails":
+                data[alias] = account.detail(int(variables[variable]))
+            else:
+                data[alias] = account.question(variables[variable], with_content)
+        self.count("submissionDetails" if lookups[0][1] == "submissionDetails" else "question")
+        self.count(f"{lookups[0][1]} lookups", len(lookups))
+        
+        missing = [alias for alias, value in data.items() if value is None]
+        if missing:
+            return {"data": data, "errors": [{"message": "not found", "path": [alias]} for alias in missing]}
+        return {"data": data}
+    
+    def _handler(self):
+        """Build the request handler class bound to this server"""
+        fake = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def log_message(self, *args):
+                pass
+            
+            def _send(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+                fake.count("bytes sent", len(data))
+            
+            def do_GET(self):
+                if self.path == STATS_PATH:
+                    return self._send(200, fake.snapshot())
+                self._send(404, {"message": "Not Found"})
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                
+                if self.path == RESET_PATH:
+                    fake.reset()
+                    return self._send(200, {})
+                
+                fake.count("requests")
+                if fake.latency:
+                    time.sleep(fake.latency)
+                
+                status = fake.inject()
+                if status == 429:
+                    fake.count("injected 429")
+                    return self._send(429, {"error": "Too Many Requests"},
+                                      {"Retry-After": str(fake.retry_after)})
+                if status == 400:
+                    fake.count("injected 400")
+                    return self._send(400, {"error": "Bad Request"})
+                
+                try:
+                    payload = json.loads(body)
+                    response = fake.answer(payload["query"], payload.get("variables") or {})
+                except (ValueError, KeyError, TypeError) as e:
+                    fake.count("malformed")
+                    return self._send(400, {"errors": [{"message": str(e)}]})
+                self._send(200, response)
+        
+        return Handler
+
+
+def default_problem_count(submissions: int) -> int:
+    """Distinct problems for an account size, roughly four submissions per problem"""
+    return max(1, min(3000, submissions // 4))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the LeetCode GraphQL API")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--submissions", type=int, default=1000)
+    parser.add_argument("--problems", type=int, default=0, help="Distinct problems (0 = submissions / 4, up to 3000)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--error-429", type=float, default=0.0, help="Probability of a 429 response")
+    parser.add_argument("--error-400", type=float, default=0.0, help="Probability of a 400 response")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After of injected 429s (seconds)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    problems = args.problems or default_problem_count(args.submissions)
+    account = SyntheticAccount(args.submissions, problems, seed=args.seed)
+    fake = FakeLeetCode(account, args.port, args.latency, args.error_429, args.error_400,
+                        args.retry_after, args.seed)
+    print(f"Serving {args.submissions} submissions over {problems} problems at {fake.url}")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
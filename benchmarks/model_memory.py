@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for Submission/Problem vs. their compact variants
+
+Loads a synthetic history the way SubmissionCache does (one JSON row per
+submission, referencing a shared problem by slug) and reports the memory retained by each model family, plus the
+cost of the derived properties the formatter and organizer read.
+
+Usage:
+    python -m benchmarks.model_memory [--count 100000] [--problems 3000] [--code-size 400]
+"""
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.models.compact import CompactProblem, CompactSubmission
+from src.models.problem import Problem
+from src.models.submission import Submission
+
+TAGS = ["Array", "Hash Table", "String", "Dynamic Programming", "Math", "Sorting", "Greedy",
+        "Depth-First Search", "Binary Search", "Database", "Breadth-First Search", "Tree",
+        "Matrix", "Two Pointers", "Bit Manipulation", "Stack", "Heap (Priority Queue)",
+        "Graph", "Prefix Sum", "Simulation", "Design", "Counting", "Backtracking",
+        "Sliding Window", "Union Find", "Linked List", "Trie", "Recursion", "Monotonic Stack"]
+LANGUAGES = ["python3", "java", "cpp", "mysql", "javascript", "golang", "rust"]
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+
+
+def build_rows(count: int, problems: int, code_size: int,
+               seed: int = 7) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Build JSON rows shaped like SubmissionCache payloads, and the problems they reference"""
+    rng = random.Random(seed)
+    catalog = [
+        {
+            "question_id": str(i + 1),
+            "title": f"Problem {i + 1}",
+            "title_slug": f"problem-{i + 1}",
+            "content": "",
+            "difficulty": rng.choice(DIFFICULTIES),
+            "tags": rng.sample(TAGS, rng.randint(1, 4))
+        }
+        for i in range(problems)
+    ]
+    
+    rows = []
+    base = 1_600_000_000
+    for i in range(count):
+        rows.append(json.dumps({
+            "id": str(100_000_000 + i),
+            "code": "".join(rng.choices("abcdefghij (){};\n", k=code_size)),
+            "timestamp": base + i * 97,
+            "status": "Accepted",
+            "language": rng.choice(LANGUAGES),
+            "runtime": f"{rng.randint(0, 300)} ms",
+            "memory": f"{rng.randint(10, 60)}.{rng.randint(0, 9)} MB",
+            "problem_slug": rng.choice(catalog)["title_slug"]
+        }))
+    return rows, catalog
+
+
+def measure(label: str, rows: List[str], load: Callable[[dict], object]) -> list:
+    """Load every row and report the memory the resulting models retain"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    
+    models = [load(json.loads(row)) for row in rows]
+    
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"{label:<20} {retained / 2**20:>10.1f} MiB {peak / 2**20:>10.1f} MiB "
+          f"{retained / len(rows):>10.0f} B {elapsed:>9.2f} s")
+    return models
+
+
+def time_derived(label: str, models: list):
+    """Time the derived properties read while organizing and formatting"""
+    started = time.perf_counter()
+    for submission in models:
+        submission.file_extension
+        submission.formatted_timestamp
+        submission.problem.has_tag("database")
+    print(f"{label:<20} {time.perf_counter() - started:>9.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="Submissions to load")
+    parser.add_argument("--problems", type=int, default=3_000, help="Distinct problems")
+    parser.add_argument("--code-size", type=int, default=400, help="Characters of code per submission")
+    args = parser.parse_args()
+    
+    print(f"Building {args.count} rows over {args.problems} problems...")
+    rows, catalog = build_rows(args.count, args.problems, args.code_size)
+    
+    print()
+    print(f"{'Model':<20} {'Retained':>14} {'Peak':>14} {'Per item':>12} {'Load':>11}")
+    print("-" * 75)
+    # Problems are loaded once, the way ProblemCache holds them
+    problems = {data["title_slug"]: Problem.from_dict(data) for data in catalog}
+    regular = measure("Submission", rows,
+                      lambda data: Submission.from_dict(data, problems[data["problem_slug"]]))
+    compact_problems = {data["title_slug"]: CompactProblem.from_dict(data) for data in catalog}
+    compact = measure("CompactSubmission", rows,
+                      lambda data: CompactSubmission.from_dict(data, compact_problems[data["problem_slug"]]))
+    
+    print()
+    print(f"{'Derived fields x2':<20} {'Time':>11}")
+    print("-" * 32)
+    for _ in range(2):
+        time_derived("Submission", regular)
+        time_derived("CompactSubmission", compact)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+End-to-end sync benchmark against local LeetCode and GitHub stand-ins
+
+For each account size, serves a synthetic account (benchmarks.fake_leetcode)
+and an empty repository (benchmarks.fake_github) from a separate process,
+then runs SyncService.sync in a fresh process with its own cache and state
+directories. The first run is cold; later runs sync the same account again
+with warm caches. Each run reports wall time, requests issued to each
+service, submissions per second and the peak RSS of the sync process.
+
+Usage:
+    python -m benchmarks.sync_throughput [--submissions 10 1000 10000] [--runs 2]
+        [--latency 0.02] [--github-latency 0.02] [--error-429 0.01] [--error-400 0.0]
+        [--pipelined] [--per-file] [--profile] [--json results.json]
+
+Servers are unthrottled and the LeetCode rate limiter is lifted unless
+--rate-limit is given, so the numbers reflect the client code rather than
+the pacing it applies to the real services.
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from queue import Empty
+from typing import Any, Dict, List
+
+import requests
+
+from benchmarks.fake_github import STATS_PATH as GITHUB_STATS_PATH, RESET_PATH as GITHUB_RESET_PATH, FakeGitHub
+from benchmarks.fake_leetcode import (
+    STATS_PATH as LEETCODE_STATS_PATH,
+    RESET_PATH as LEETCODE_RESET_PATH,
+    FakeLeetCode,
+    SyntheticAccount,
+    TAGS,
+    default_problem_count
+)
+
+GITHUB_OWNER = "benchmark"
+GITHUB_REPOSITORY = "leetcode-solutions"
+
+
+def serve_fakes(args: argparse.Namespace, submissions: int, conn):
+    """
+    Child process: serve both stand-ins until the parent closes the pipe
+    
+    Args:
+        args: Benchmark arguments
+        submissions: Account size
+        conn: Pipe end the URLs are sent through
+    """
+    problems = args.problems or default_problem_count(submissions)
+    account = SyntheticAccount(submissions, problems, code_size=args.code_size, seed=args.seed)
+    leetcode = FakeLeetCode(account, latency=args.latency, error_429=args.error_429,
+                            error_400=args.error_400, retry_after=args.retry_after, seed=args.seed).start()
+    github = FakeGitHub(GITHUB_OWNER, GITHUB_REPOSITORY, latency=args.github_latency,
+                        error_429=args.github_error_429, error_400=args.github_error_400,
+                        retry_after=args.retry_after, seed=args.seed).start()
+    conn.send((leetcode.url, github.url))
+    try:
+        conn.recv()
+    except EOFError:
+        pass
+    leetcode.stop()
+    github.stop()
+
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def fetch_stats(root: str, stats_path: str, reset_path: str) -> Dict[str, int]:
+    """
+    Read and reset a stand-in's request counters
+    
+    Args:
+        root: Server root URL
+        stats_path: Path of the counters
+        reset_path: Path that zeroes them
+    
+    Returns:
+        Counters by name
+    """
+    stats = requests.get(root + stats_path, timeout=10).json()
+    requests.post(root + reset_path, timeout=10)
+    return stats
+
+
+def run_syncs(args: argparse.Namespace, leetcode_url: str, github_url: str, queue):
+    """
+    Child process: run the syncs of one account size
+    
+    Args:
+        args: Benchmark arguments
+        leetcode_url: GraphQL endpoint of the LeetCode stand-in
+        github_url: API root of the GitHub stand-in
+        queue: Queue the run reports are put on
+    """
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+    
+    os.environ.setdefault("LEETCODE_SESSION", "benchmark")
+    os.environ.setdefault("GITHUB_TOKEN", "benchmark")
+    
+    from src.config.enums import SyncMode
+    from src.config.settings import Settings
+    from src.services.sync_service import SyncService
+    from src.utils.rate_limiter import RateLimiter
+    
+    leetcode_root = leetcode_url.rsplit("/", 1)[0]
+    
+    work_dir = tempfile.mkdtemp(prefix="sync-bench-")
+    for run in range(args.runs):
+        settings = Settings(args.config)
+        config = settings.config
+        config.setdefault("leetcode", {})["api_endpoint"] = leetcode_url
+        github = config.setdefault("github", {})
+        github.update(api_url=github_url, throttle=False, username=GITHUB_OWNER,
+                      repository=GITHUB_REPOSITORY, batch_commit=not args.per_file)
+        config.setdefault("storage", {})["backend"] = "github"
+        config.setdefault("cache", {})["directory"] = f"{work_dir}/cache"
+        sync = config.setdefault("sync_settings", {})
+        sync.update(state_file=f"{work_dir}/state.json", manifest_file=f"{work_dir}/manifest.json",
+                    pipelined=args.pipelined, only_accepted=True)
+        config["metrics"] = {"json_file": f"{work_dir}/metrics.json", "prometheus_file": ""}
+        config["profiling"] = {"enabled": args.profile, "directory": f"{work_dir}/profiles"}
+        if args.workers:
+            sync["detail_workers"] = args.workers
+        if args.batch_size:
+            sync["detail_batch_size"] = args.batch_size
+        if not args.config_tags:
+            settings.tag_mappings["active_tags"] = list(TAGS)
+            mappings = settings.tag_mappings.setdefault("tag_mappings", {})
+            for tag in TAGS:
+                mappings.setdefault(tag, tag.replace(" ", "-"))
+        
+        service = SyncService(settings)
+        if args.rate_limit:
+            limiter = RateLimiter(requests=args.rate_limit, period=1, max_requests=args.rate_limit)
+        else:
+            limiter = RateLimiter(requests=10**6, period=1, max_requests=10**6)
+        service.leetcode_client.rate_limiter = limiter
+        fetch_stats(leetcode_root, LEETCODE_STATS_PATH, LEETCODE_RESET_PATH)
+        fetch_stats(github_url, GITHUB_STATS_PATH, GITHUB_RESET_PATH)
+        
+        started = time.perf_counter()
+        result = service.sync(days_back=0, mode=SyncMode.FULL)
+        wall = time.perf_counter() - started
+        
+        leetcode_stats = fetch_stats(leetcode_root, LEETCODE_STATS_PATH, LEETCODE_RESET_PATH)
+        github_stats = fetch_stats(github_url, GITHUB_STATS_PATH, GITHUB_RESET_PATH)
+        queue.put({
+            "run": run + 1,
+            "wall_seconds": round(wall, 3),
+            "submissions": result.total_submissions,
+            "synced": result.filtered_submissions,
+            "submissions_per_second": round(result.total_submissions / wall, 1) if wall else 0.0,
+            "files_created": result.files_created,
+            "files_updated": result.files_updated,
+            "files_skipped": result.files_skipped,
+            "errors": len(result.errors),
+            "leetcode_requests": leetcode_stats.pop("requests", 0),
+            "github_requests": github_stats.pop("requests", 0),
+            "leetcode": leetcode_stats,
+            "github": github_stats,
+            "peak_rss_mib": round(peak_rss_mib(), 1),
+            "stages": result.metrics.to_dict()["stages"],
+            "profile": result.profile_directory
+        })
+    queue.put(None)
+
+
+def benchmark_size(args: argparse.Namespace, submissions: int) -> List[Dict[str, Any]]:
+    """
+    Run the syncs of one account size against fresh stand-ins
+    
+    Args:
+        args: Benchmark arguments
+        submissions: Account size
+    
+    Returns:
+        One report per run
+    """
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe()
+    fakes = context.Process(target=serve_fakes, args=(args, submissions, child_conn), daemon=True)
+    fakes.start()
+    leetcode_url, github_url = parent_conn.recv()
+    
+    queue = context.Queue()
+    runner = context.Process(target=run_syncs, args=(args, leetcode_url, github_url, queue))
+    runner.start()
+    
+    reports = []
+    try:
+        while True:
+            try:
+                report = queue.get(timeout=1)
+            except Empty:
+                if runner.is_alive():
+                    continue
+                print(f"Sync process exited with code {runner.exitcode}")
+                break
+            if report is None:
+                break
+            report["account_size"] = submissions
+            reports.append(report)
+            print_report(report, args.verbose)
+    finally:
+        runner.join()
+        parent_conn.send("stop")
+        fakes.join(timeout=10)
+    return reports
+
+
+def print_report(report: Dict[str, Any], verbose: bool):
+    """Print one run as a table row"""
+    print(f"{report['account_size']:>8} {report['run']:>4} {report['wall_seconds']:>9.2f} "
+          f"{report['submissions_per_second']:>10.1f} {report['leetcode_requests']:>8} "
+          f"{report['github_requests']:>8} {report['files_created'] + report['files_updated']:>7} "
+          f"{report['files_skipped']:>7} {report['errors']:>6} {report['peak_rss_mib']:>9.1f}")
+    if verbose:
+        print(f"{'':>14}leetcode: {report['leetcode']}")
+        print(f"{'':>14}github:   {report['github']}")
+        print(f"{'':>14}stages:   {report['stages']}")
+    if report["profile"]:
+        print(f"{'':>14}profile:  {report['profile']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end sync benchmark against local stand-ins")
+    parser.add_argument("--submissions", type=int, nargs="+", default=[10, 1000, 10000],
+                        help="Account sizes to benchmark (10 to 50000)")
+    parser.add_argument("--problems", type=int, default=0, help="Distinct problems (0 = submissions / 4, up to 3000)")
+    parser.add_argument("--code-size", type=int, default=600, help="Characters of code per submission")
+    parser.add_argument("--runs", type=int, default=2, help="Syncs per size; runs after the first are warm")
+    parser.add_argument("--latency", type=float, default=0.0, help="LeetCode response latency (seconds)")
+    parser.add_argument("--github-latency", type=float, default=0.0, help="GitHub response latency (seconds)")
+    parser.add_argument("--error-429", type=float, default=0.0, help="Probability of a LeetCode 429")
+    parser.add_argument("--error-400", type=float, default=0.0, help="Probability of a LeetCode 400")
+    parser.add_argument("--github-error-429", type=float, default=0.0, help="Probability of a GitHub 429")
+    parser.add_argument("--github-error-400", type=float, default=0.0, help="Probability of a GitHub 400")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After of injected 429s (seconds)")
+    parser.add_argument("--rate-limit", type=float, default=0, help="LeetCode requests per second (0 = unpaced)")
+    parser.add_argument("--workers", type=int, default=0, help="Detail workers (0 = config)")
+    parser.add_argument("--batch-size", type=int, default=0, help="Details per GraphQL request (0 = config)")
+    parser.add_argument("--pipelined", action="store_true", help="Use the pipelined sync")
+    parser.add_argument("--per-file", action="store_true", help="One commit per file instead of batch commits")
+    parser.add_argument("--profile", action="store_true", help="Profile each sync (see RunProfiler)")
+    parser.add_argument("--config", default="config/config.yaml", help="Base configuration")
+    parser.add_argument("--config-tags", action="store_true",
+                        help="Sync only the configured active tags (default: every synthetic tag)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="Also write the reports to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show sync logs and per-endpoint counts")
+    args = parser.parse_args()
+    
+    print(f"{'Size':>8} {'Run':>4} {'Wall (s)':>9} {'Subs/s':>10} {'LC reqs':>8} "
+          f"{'GH reqs':>8} {'Written':>7} {'Same':>7} {'Errors':>6} {'RSS (MiB)':>9}")
+    print("-" * 85)
+    
+    reports = []
+    for submissions in args.submissions:
+        reports.extend(benchmark_size(args, submissions))
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+        print(f"\nWrote {len(reports)} reports to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,26 @@
 """
 LeetCode to GitHub Sync
 Main entry point
+
+Run without arguments for the interactive prompts. Any of --yes, --json or
+--watch (or a stdin that is not a terminal) runs headless: nothing is
+asked, and the window, mode and output come from the flags or the config.
+--accounts syncs every account listed in the config, also headless.
 """
+import argparse
+import json
+import signal
 import sys
-from pathlib import Path
+from contextlib import redirect_stdout
+from typing import Optional, TextIO
 
+from src.config.enums import StorageBackend, SyncMode
 from src.config.settings import Settings
+from src.models.sync_result import SyncResult
+from src.services.multi_account_runner import MultiAccountRunner
 from src.services.sync_service import SyncService
-from src.utils.logger import setup_logging, get_logger
+from src.services.sync_watcher import SyncWatcher
+from src.utils.logger import setup_logging, get_logger, set_console_stream
 from src.utils.helpers import parse_date_range_choice
 
 
@@ -53,14 +66,320 @@ def get_user_input() -> int:
     return days
 
 
-def main():
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments
+    
+    Args:
+        argv: Arguments (None = sys.argv)
+    
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Sync LeetCode solutions to GitHub",
+        epilog="Headless runs exit with 1 if the sync recorded errors. "
+               "In watch mode, SIGINT or SIGTERM stops after the current sync."
+    )
+    parser.add_argument("--config", default="config/config.yaml", help="Configuration file")
+    
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument("--days", type=int, help="Sync submissions from the last N days (0 = all time)")
+    window.add_argument("--all-time", action="store_true", help="Sync every submission (same as --days 0)")
+    parser.add_argument("--mode", choices=[mode.value for mode in SyncMode],
+                        help="full = re-sync the whole window, incremental = only new submissions")
+    parser.add_argument("--output", choices=[backend.value for backend in StorageBackend],
+                        help="Where files are written (storage.backend)")
+    parser.add_argument("--export-path", help="Output of directory/tar/zip exports (storage.export_path)")
+    
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="Run headless: never prompt, proceed even if the connection test fails")
+    parser.add_argument("--create-repo", action="store_true",
+                        help="Create the repository without asking if it does not exist")
+    parser.add_argument("--json", action="store_true",
+                        help="Print each result as one line of JSON on stdout (messages and logs go to stderr)")
+    
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-sync on an interval, reusing connections and caches")
+    parser.add_argument("--interval", type=float, help="Seconds between syncs in watch mode (watch.interval)")
+    parser.add_argument("--jitter", type=float, help="Random fraction each interval may deviate by (watch.jitter)")
+    parser.add_argument("--max-runs", type=int, default=0, help="Stop watching after N syncs (0 = never)")
+    
+    parser.add_argument("--accounts", action="store_true",
+                        help="Sync every entry of the accounts list in config.yaml instead of the default account")
+    parser.add_argument("--max-concurrent", type=int,
+                        help="Accounts synced at the same time (multi_account.max_concurrent)")
+    
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile CPU time and memory allocations of the sync and write the reports "
+                             "under profiling.directory (default: .sync_state/profiles)")
+    args = parser.parse_args(argv)
+    if args.accounts and args.watch:
+        parser.error("--watch does not support --accounts")
+    return args
+
+
+def check_configuration(settings: Settings) -> bool:
+    """
+    Check that usernames and credentials are set
+    
+    Args:
+        settings: Application settings
+    
+    Returns:
+        True if a sync can be attempted
+    """
+    if not settings.leetcode_username:
+        print("⚠️  LeetCode username not set in config/config.yaml")
+        return False
+    
+    if not settings.leetcode_session:
+        print("⚠️  LEETCODE_SESSION not set in .env file")
+        print("   Please copy env.example to .env and fill in your credentials")
+        return False
+    
+    # Offline exports and git backends with their own remote need no GitHub account
+    if not settings.uses_github:
+        return True
+    
+    if not settings.github_username:
+        print("⚠️  GitHub username not set in config/config.yaml")
+        return False
+    
+    if not settings.github_token:
+        print("⚠️  GITHUB_TOKEN not set in .env file")
+        print("   Please copy env.example to .env and fill in your credentials")
+        return False
+    
+    return True
+
+
+def ensure_repository(sync_service: SyncService, settings: Settings, interactive: bool, create: bool) -> bool:
+    """
+    Check the repository exists, creating it if asked to
+    
+    Args:
+        sync_service: Sync service
+        settings: Application settings
+        interactive: Ask before creating a missing repository
+        create: Create a missing repository without asking
+    
+    Returns:
+        True if the repository exists
+    """
+    print("Checking GitHub repository...")
+    if sync_service.storage.repository_exists():
+        print(f"✓ Repository '{settings.github_repository}' found")
+        return True
+    
+    print(f"⚠️  Repository '{settings.github_repository}' not found.")
+    if not create:
+        if not interactive:
+            print("❌ Repository is required. Create it manually or pass --create-repo.")
+            return False
+        answer = input("Would you like to create it now? [Y/n]: ").strip().lower()
+        if answer and answer not in ['y', 'yes']:
+            print("❌ Repository is required. Please create it manually and try again.")
+            return False
+    
+    print(f"Creating repository '{settings.github_repository}'...")
+    description = f"🚀 LeetCode solutions automatically synced from my LeetCode account"
+    
+    if sync_service.storage.create_repository(description):
+        print(f"✅ Repository created: {sync_service.storage.get_repository_url()}")
+        return True
+    
+    print("❌ Failed to create repository. Please create it manually or check your GitHub token permissions.")
+    return False
+
+
+def print_result(result: SyncResult, sync_service: SyncService):
+    """
+    Print the outcome of a sync
+    
+    Args:
+        result: Result of the sync
+        sync_service: Service that ran it
+    """
+    print()
+    print("=" * 60)
+    print("Sync Results")
+    print("=" * 60)
+    print(f"Total submissions found: {result.total_submissions}")
+    print(f"Filtered submissions: {result.filtered_submissions}")
+    print(f"Files created: {result.files_created}")
+    print(f"Files updated: {result.files_updated}")
+    print(f"Files skipped: {result.files_skipped}")
+    print(f"Errors: {len(result.errors)}")
+    print(f"Duration: {result.duration:.2f} seconds")
+    print()
+    
+    if result.tag_counts:
+        print("Files by category:")
+        for tag, count in result.tag_counts.items():
+            print(f"  {tag}: {count} files")
+        print()
+    
+    if result.errors:
+        print("Errors encountered:")
+        for error in result.errors[:5]:  # Show first 5 errors
+            print(f"  - {error}")
+        if len(result.errors) > 5:
+            print(f"  ... and {len(result.errors) - 5} more")
+        print()
+    
+    if result.profile_directory:
+        print(f"Profile: {result.profile_directory}/hotspots.txt, allocations.txt, profile.pstats")
+        print()
+    
+    print(f"✅ Sync completed successfully!")
+    print(f"🔗 View your solutions: {sync_service.storage.get_repository_url()}")
+    print("=" * 60)
+
+
+def report(result: SyncResult, sync_service: SyncService, json_stream: Optional[TextIO]):
+    """Print a result as text, or as a line of JSON on json_stream"""
+    if json_stream is None:
+        print_result(result, sync_service)
+        return
+    json_stream.write(json.dumps(result.to_dict()) + "\n")
+    json_stream.flush()
+
+
+def watch(sync_service: SyncService, settings: Settings, args: argparse.Namespace, days_back: Optional[int],
+          json_stream: Optional[TextIO]) -> int:
+    """
+    Re-sync on an interval until stopped by a signal or --max-runs
+    
+    Args:
+        sync_service: Sync service kept for every run
+        settings: Application settings
+        args: Parsed arguments
+        days_back: Window of each sync
+        json_stream: Stream results are printed to as JSON (None = text on stdout)
+    
+    Returns:
+        Exit code
+    """
+    try:
+        watcher = SyncWatcher(
+            sync_service,
+            interval=args.interval if args.interval is not None else settings.watch_interval,
+            jitter=args.jitter if args.jitter is not None else settings.watch_jitter,
+            days_back=days_back,
+            mode=SyncMode(args.mode) if args.mode else None,
+            profile=args.profile or None,
+            on_result=lambda result: report(result, sync_service, json_stream)
+        )
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        return 1
+    
+    def request_stop(signum, frame):
+        if watcher.stopping:
+            raise KeyboardInterrupt  # Second signal: abort the current sync
+        print(f"\nStopping after the current sync ({signal.Signals(signum).name})...")
+        watcher.stop()
+    
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    
+    try:
+        watcher.run(max_runs=args.max_runs)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Sync interrupted by user")
+        return 130
+    return 0
+
+
+def run_accounts(settings: Settings, args: argparse.Namespace, json_stream: Optional[TextIO]) -> int:
+    """
+    Sync every configured account concurrently
+    
+    Args:
+        settings: Base settings
+        args: Parsed arguments
+        json_stream: Stream results are printed to as JSON (None = text on stdout)
+    
+    Returns:
+        Exit code (1 if any account recorded errors)
+    """
+    try:
+        runner = MultiAccountRunner(settings, max_concurrent=args.max_concurrent)
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        return 1
+    
+    if args.all_time:
+        days_back = 0
+    elif args.days is not None:
+        days_back = max(0, args.days)
+    else:
+        days_back = None  # Each account's own days_to_look_back
+    
+    print(f"Syncing {len(runner.accounts)} accounts, {runner.max_concurrent} at a time...")
+    results = runner.run(days_back=days_back, mode=SyncMode(args.mode) if args.mode else None,
+                         profile=args.profile)
+    
+    if json_stream is not None:
+        for name, result in results.items():
+            json_stream.write(json.dumps({"account": name, **result.to_dict()}) + "\n")
+        json_stream.flush()
+    else:
+        print()
+        print("=" * 60)
+        print("Sync Results")
+        print("=" * 60)
+        for name, result in results.items():
+            print(f"{name}: {result.files_created} created, {result.files_updated} updated, "
+                  f"{result.files_skipped} skipped, {len(result.errors)} errors in {result.duration:.2f}s")
+            for error in result.errors[:3]:
+                print(f"  - {error}")
+        print("=" * 60)
+    
+    return 1 if any(result.errors for result in results.values()) else 0
+
+
+def main(argv: Optional[list] = None):
     """Main function"""
+    args = parse_args(argv)
+    
+    if not args.json:
+        return run(args, json_stream=None)
+    
+    # stdout carries only the JSON results
+    json_stream = sys.stdout
+    set_console_stream(sys.stderr)
+    with redirect_stdout(sys.stderr):
+        return run(args, json_stream)
+
+
+def run(args: argparse.Namespace, json_stream: Optional[TextIO]) -> int:
+    """
+    Check the setup and run one sync, or keep syncing in watch mode
+    
+    Args:
+        args: Parsed arguments
+        json_stream: Stream results are printed to as JSON (None = text on stdout)
+    
+    Returns:
+        Exit code
+    """
+    interactive = not (args.yes or args.json or args.watch) and sys.stdin.isatty()
+    
     # Print banner
     print_banner()
     
     # Load settings
+    # Command-line options are merged in before the settings are validated
+    storage = {}
+    if args.output:
+        storage["backend"] = args.output
+    if args.export_path:
+        storage["export_path"] = args.export_path
+    
     try:
-        settings = Settings()
+        settings = Settings(args.config, overrides={"storage": storage} if storage else None)
     except Exception as e:
         print(f"❌ Error loading settings: {str(e)}")
         return 1
@@ -71,23 +390,11 @@ def main():
     
     logger.info("Starting LeetCode to GitHub Sync")
     
-    # Check if configuration is complete
-    if not settings.leetcode_username:
-        print("⚠️  LeetCode username not set in config/config.yaml")
-        return 1
+    if args.accounts:
+        return run_accounts(settings, args, json_stream)
     
-    if not settings.github_username:
-        print("⚠️  GitHub username not set in config/config.yaml")
-        return 1
-    
-    if not settings.leetcode_session:
-        print("⚠️  LEETCODE_SESSION not set in .env file")
-        print("   Please copy env.example to .env and fill in your credentials")
-        return 1
-    
-    if not settings.github_token:
-        print("⚠️  GITHUB_TOKEN not set in .env file")
-        print("   Please copy env.example to .env and fill in your credentials")
+    # Check if configuration is complete
+    if not check_configuration(settings):
         return 1
     
     # Initialize sync service
@@ -99,25 +406,8 @@ def main():
         return 1
     
     # Check and create repository if needed
-    print("Checking GitHub repository...")
-    if not sync_service.github_client.repository_exists():
-        print(f"⚠️  Repository '{settings.github_repository}' not found.")
-        create = input("Would you like to create it now? [Y/n]: ").strip().lower()
-        
-        if not create or create in ['y', 'yes']:
-            print(f"Creating repository '{settings.github_repository}'...")
-            description = f"🚀 LeetCode solutions automatically synced from my LeetCode account"
-            
-            if sync_service.github_client.create_repository(description):
-                print(f"✅ Repository created: https://github.com/{settings.github_username}/{settings.github_repository}")
-            else:
-                print("❌ Failed to create repository. Please create it manually or check your GitHub token permissions.")
-                return 1
-        else:
-            print("❌ Repository is required. Please create it manually and try again.")
-            return 1
-    else:
-        print(f"✓ Repository '{settings.github_repository}' found")
+    if not ensure_repository(sync_service, settings, interactive, args.create_repo):
+        return 1
     
     print()
     
@@ -128,7 +418,7 @@ def main():
     if not connections_ok:
         print("⚠️  Connection test had issues.")
         print()
-        proceed = input("Would you like to try syncing anyway? [Y/n]: ").strip().lower()
+        proceed = input("Would you like to try syncing anyway? [Y/n]: ").strip().lower() if interactive else ""
         
         if proceed and proceed not in ['y', 'yes']:
             print("❌ Sync cancelled. Please check your credentials.")
@@ -144,61 +434,45 @@ def main():
     
     print()
     
-    # Get user input for date range
-    days_back = get_user_input()
+    # Date range: flags, then the prompt, then the config
+    if args.all_time:
+        days_back = 0
+    elif args.days is not None:
+        days_back = max(0, args.days)
+    elif interactive:
+        days_back = max(0, get_user_input())
+    else:
+        days_back = settings.days_to_look_back
     
     # Confirm before proceeding
     print(f"Configuration:")
     print(f"  LeetCode User: {settings.leetcode_username}")
-    print(f"  GitHub Repo: {settings.github_username}/{settings.github_repository}")
+    print(f"  Output: {sync_service.storage.get_repository_url()}")
     print(f"  Active Tags: {', '.join(settings.active_tags)}")
-    print(f"  Date Range: {'All time' if days_back < 0 else f'Last {days_back} days'}")
+    print(f"  Date Range: {'All time' if days_back == 0 else f'Last {days_back} days'}")
+    print(f"  Mode: {args.mode or settings.sync_mode.value}")
     print()
     
-    confirm = input("Proceed with sync? [Y/n]: ").strip().lower()
-    if confirm and confirm not in ['y', 'yes']:
-        print("Sync cancelled.")
-        return 0
+    if interactive:
+        confirm = input("Proceed with sync? [Y/n]: ").strip().lower()
+        if confirm and confirm not in ['y', 'yes']:
+            print("Sync cancelled.")
+            return 0
+        
+        print()
     
-    print()
+    if args.watch:
+        return watch(sync_service, settings, args, days_back, json_stream)
     
     # Run sync
     try:
-        result = sync_service.sync(days_back=days_back if days_back >= 0 else 0)
-        
-        # Print results
-        print()
-        print("=" * 60)
-        print("Sync Results")
-        print("=" * 60)
-        print(f"Total submissions found: {result.total_submissions}")
-        print(f"Filtered submissions: {result.filtered_submissions}")
-        print(f"Files created/updated: {result.files_created}")
-        print(f"Files skipped: {result.files_skipped}")
-        print(f"Errors: {len(result.errors)}")
-        print(f"Duration: {result.duration:.2f} seconds")
-        print()
-        
-        if result.tag_counts:
-            print("Files by category:")
-            for tag, count in result.tag_counts.items():
-                print(f"  {tag}: {count} files")
-            print()
-        
-        if result.errors:
-            print("Errors encountered:")
-            for error in result.errors[:5]:  # Show first 5 errors
-                print(f"  - {error}")
-            if len(result.errors) > 5:
-                print(f"  ... and {len(result.errors) - 5} more")
-            print()
-        
-        print(f"✅ Sync completed successfully!")
-        print(f"🔗 View your solutions: {sync_service.github_client.get_repository_url()}")
-        print("=" * 60)
-        
-        return 0
+        result = sync_service.sync(days_back=days_back,
+                                   mode=SyncMode(args.mode) if args.mode else None,
+                                   profile=args.profile or None)
+        report(result, sync_service, json_stream)
         
+        return 1 if result.errors and not interactive else 0
+    
     except KeyboardInterrupt:
         print("\n\n⚠️  Sync interrupted by user")
         return 130
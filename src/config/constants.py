@@ -10,13 +10,86 @@ LEETCODE_PROBLEM_URL_TEMPLATE = "https://leetcode.com/problems/{slug}/"
 
 # Default values
 DEFAULT_SUBMISSION_LIMIT = 200
+SUBMISSION_PAGE_SIZE = 20  # submissionList returns at most 20 per page
 DEFAULT_DAYS_BACK = 30
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY = 2  # seconds
+DEFAULT_DETAIL_WORKERS = 1  # 1 = fetch submission details serially
+MAX_DETAIL_WORKERS = 16
+DEFAULT_DETAIL_BATCH_SIZE = 20  # submissionDetails lookups per GraphQL request
+MAX_DETAIL_BATCH_SIZE = 50
+DEFAULT_ASYNC_CONCURRENCY = 4  # In-flight requests per AsyncLeetCodeClient
+DEFAULT_ASYNC_POOL_SIZE = 10  # Pooled connections per AsyncLeetCodeClient
+DEFAULT_PIPELINE_QUEUE_SIZE = 64  # Items buffered between pipelined sync stages
 
-# Rate limiting
-RATE_LIMIT_REQUESTS = 10
+# Rate limiting (adaptive token bucket, see src/utils/rate_limiter.py)
+RATE_LIMIT_REQUESTS = 120  # Starting budget per period
 RATE_LIMIT_PERIOD = 60  # seconds
+RATE_LIMIT_MIN_REQUESTS = 6  # Floor after repeated backoffs
+RATE_LIMIT_MAX_REQUESTS = 600  # Ceiling while responses stay healthy
+RATE_LIMIT_BURST = 5  # Maximum tokens that can accumulate
+RATE_LIMIT_INCREASE_STEP = 0.05  # Requests/second added per healthy response
+RATE_LIMIT_DECREASE_FACTOR = 0.5  # Rate multiplier on 429 or slow response
+RATE_LIMIT_SLOW_RESPONSE = 10  # seconds
+
+# Local caches
+DEFAULT_CACHE_DIR = ".cache"
+SUBMISSION_CACHE_FILE = "submissions.sqlite3"
+SUBMISSION_CACHE_MAX_ENTRIES = 50000
+SUBMISSION_CACHE_SCHEMA_VERSION = 2  # Bump when the cached Submission layout changes
+PROBLEM_CACHE_FILE = "problems.sqlite3"
+PROBLEM_CACHE_MAX_ENTRIES = 5000  # In-memory LRU size
+PROBLEM_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds an on-disk entry stays valid
+PROBLEM_CACHE_SCHEMA_VERSION = 1
+RENDER_CACHE_FILE = "renders.sqlite3"
+RENDER_CACHE_MAX_ENTRIES = 50000
+RENDER_CACHE_SCHEMA_VERSION = 1
+RENDER_CACHE_WRITE_BATCH = 500  # Rendered files buffered before one SQLite transaction
+
+# Sync state (persisted between runs)
+DEFAULT_STATE_DIR = ".sync_state"
+DEFAULT_STATE_FILE = f"{DEFAULT_STATE_DIR}/state.json"
+DEFAULT_MANIFEST_FILE = f"{DEFAULT_STATE_DIR}/manifest.json"
+README_FILE = "README.md"  # Repository README and per-folder index name
+MANIFEST_REPO_PATH = ".leetcode-sync/manifest.json"  # Manifest location when kept in the repository
+DEFAULT_METRICS_JSON_FILE = f"{DEFAULT_STATE_DIR}/metrics.json"  # Metrics of the last run
+DEFAULT_METRICS_PROMETHEUS_FILE = f"{DEFAULT_STATE_DIR}/metrics.prom"  # Same, in Prometheus text format
+DEFAULT_PROFILE_DIR = f"{DEFAULT_STATE_DIR}/profiles"  # One subdirectory per profiled run
+
+# Sync metrics
+METRICS_PREFIX = "leetcode_sync"  # Prometheus metric name prefix
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.25, 0.35, 0.5,
+                           0.75, 1.0, 1.5, 2.5, 5.0, 10.0, 30.0)  # Histogram bounds (seconds)
+METRICS_QUANTILES = (0.5, 0.95, 0.99)  # Latency quantiles reported in the JSON export
+
+# Profiling (see src/utils/profiler.py)
+PROFILE_TOP_FUNCTIONS = 40  # Functions listed per ordering in the hotspot report
+PROFILE_TOP_ALLOCATIONS = 30  # Allocation sites listed in the memory report
+PROFILE_TRACEMALLOC_FRAMES = 10  # Stack depth recorded per allocation
+
+# Watch mode (see src/services/sync_watcher.py)
+DEFAULT_WATCH_INTERVAL = 600  # seconds between the starts of two syncs
+DEFAULT_WATCH_JITTER = 0.1  # Each interval is randomly stretched or shrunk by up to this fraction
+MIN_WATCH_INTERVAL = 10  # seconds
+MAX_WATCH_JITTER = 0.5
+
+# Multi-account sync (see src/services/multi_account_runner.py)
+DEFAULT_ACCOUNTS_DIR = f"{DEFAULT_STATE_DIR}/accounts"  # Per-account state, caches and metrics, one folder each
+DEFAULT_MAX_CONCURRENT_ACCOUNTS = 2  # Accounts synced at the same time
+ACCOUNT_SECRETS = {  # Settings attribute -> environment variable holding it for the default account
+    "leetcode_session": "LEETCODE_SESSION",
+    "leetcode_csrf": "LEETCODE_CSRF_TOKEN",
+    "github_token": "GITHUB_TOKEN"
+}
+
+# Local git backend
+DEFAULT_GIT_WORK_DIR = ".sync_repo"  # Working copy the git backend commits in
+GIT_COMMIT_AUTHOR_NAME = "LeetCode Sync"  # Used when git has no user configured
+GIT_COMMIT_AUTHOR_EMAIL = "leetcode-sync@users.noreply.github.com"
+
+# Offline export backends
+DEFAULT_EXPORT_DIR = "export"
+DEFAULT_EXPORT_ARCHIVE = "leetcode-solutions"  # .tar.gz / .zip is appended
 
 # File headers
 FILE_HEADER_TEMPLATE = """/*
@@ -50,7 +123,10 @@ COMMIT_MESSAGES = {
     "add": "Add: {problem_title} solution",
     "update": "Update: {problem_title} solution (v{version})",
     "sync": "Sync: {count} {tag} solutions",
-    "bulk": "Sync: {count} solutions across {tag_count} categories"
+    "bulk": "Sync: {count} solutions across {tag_count} categories",
+    "pipeline": "Sync: solutions from {count} submissions",
+    "index": "Docs: update README and {count} folder indexes",
+    "manifest": "Sync: update manifest"
 }
 
 # README templates
@@ -70,11 +146,15 @@ Auto-synced from LeetCode account.
 
 # Validation
 MAX_FILENAME_LENGTH = 200
+FILENAME_CACHE_SIZE = 16384  # (slug, version, extension) -> filename results kept by slug_to_filename
 INVALID_FILENAME_CHARS = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
 
 # GitHub
 GITHUB_API_BASE = "https://api.github.com"
 MAX_COMMIT_MESSAGE_LENGTH = 72
+DEFAULT_UPLOAD_WORKERS = 8  # Parallel blob uploads for batch commits
+UPLOAD_WINDOW_PER_WORKER = 2  # Blob uploads queued per worker while files are still being rendered
+REF_UPDATE_RETRIES = 3  # Attempts to advance the branch when it moved underneath us
 
 # GraphQL Queries
 GRAPHQL_RECENT_SUBMISSIONS = """
@@ -88,9 +168,27 @@ query recentAcSubmissions($username: String!, $limit: Int!) {
 }
 """
 
-GRAPHQL_SUBMISSION_DETAIL = """
-query submissionDetails($submissionId: Int!) {
-  submissionDetails(submissionId: $submissionId) {
+# Full submission history of the signed-in user, newest first.
+# Pages after the first need the lastKey returned by the previous page.
+GRAPHQL_SUBMISSION_LIST = """
+query submissionList($offset: Int!, $limit: Int!, $lastKey: String) {
+  submissionList(offset: $offset, limit: $limit, lastKey: $lastKey) {
+    lastKey
+    hasNext
+    submissions {
+      id
+      title
+      titleSlug
+      timestamp
+      statusDisplay
+    }
+  }
+}
+"""
+
+# Selection set shared by single and batched submissionDetails queries.
+# Problem metadata is resolved separately by title slug (see ProblemCache).
+SUBMISSION_DETAIL_FIELDS = """
     id
     code
     timestamp
@@ -100,22 +198,35 @@ query submissionDetails($submissionId: Int!) {
     runtimeDisplay
     memoryDisplay
     question {
-      questionId
-      title
       titleSlug
-      content
-      difficulty
-      topicTags {
-        name
-      }
     }
-  }
+"""
+
+GRAPHQL_SUBMISSION_DETAIL = """
+query submissionDetails($submissionId: Int!) {
+  submissionDetails(submissionId: $submissionId) {""" + SUBMISSION_DETAIL_FIELDS + """  }
 }
 """
 
-GRAPHQL_QUESTION_DETAIL = """
-query questionData($titleSlug: String!) {
-  question(titleSlug: $titleSlug) {
+# One aliased submissionDetails lookup inside a batched query
+GRAPHQL_SUBMISSION_DETAIL_ALIAS = """
+  {alias}: submissionDetails(submissionId: ${variable}) {{{fields}  }}"""
+
+# Selection sets for question queries, by ProblemFieldSet value.
+# The HTML statement (content) is the bulk of each question payload and is
+# not needed to sync files, so the default set leaves it out.
+QUESTION_FIELD_SETS = {
+    "metadata": """
+    questionId
+    title
+    titleSlug
+    difficulty
+    topicTags {
+      name
+      slug
+    }
+""",
+    "full": """
     questionId
     title
     titleSlug
@@ -125,6 +236,36 @@ query questionData($titleSlug: String!) {
       name
       slug
     }
+"""
+}
+
+# Selection set shared by single and batched question queries
+QUESTION_DETAIL_FIELDS = QUESTION_FIELD_SETS["full"]
+
+# Problem statement only, for loading content on demand
+GRAPHQL_QUESTION_CONTENT = """
+query questionContent($titleSlug: String!) {
+  question(titleSlug: $titleSlug) {
+    content
+  }
+}
+"""
+
+GRAPHQL_QUESTION_DETAIL = """
+query questionData($titleSlug: String!) {
+  question(titleSlug: $titleSlug) {""" + QUESTION_DETAIL_FIELDS + """  }
+}
+"""
+
+# One aliased question lookup inside a batched query
+GRAPHQL_QUESTION_DETAIL_ALIAS = """
+  {alias}: question(titleSlug: ${variable}) {{{fields}  }}"""
+
+GRAPHQL_USER_STATUS = """
+query globalData {
+  userStatus {
+    username
+    isSignedIn
   }
 }
 """
@@ -105,3 +105,26 @@ class GitHubCommitType(Enum):
     UPDATE = "Update"
     SYNC = "Sync"
     REFACTOR = "Refactor"
+
+
+class StorageBackend(Enum):
+    """Where synced files are written"""
+    GITHUB = "github"  # GitHub REST API
+    LOCAL_GIT = "git"  # Local working copy, one commit and one push
+    DIRECTORY = "directory"  # Plain files in a local directory
+    TAR = "tar"  # Single .tar.gz archive
+    ZIP = "zip"  # Single .zip archive
+
+
+class ProblemFieldSet(Enum):
+    """Problem fields requested from LeetCode"""
+    METADATA = "metadata"  # Title, difficulty and tags; statement loaded on demand
+    FULL = "full"  # Also the HTML problem statement
+
+
+class UploadStatus(Enum):
+    """Outcome of writing a file to the repository"""
+    CREATED = "created"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"  # Remote content already identical, nothing written
+    FAILED = "failed"
@@ -1,12 +1,40 @@
 """
 Configuration settings loader
 """
+import copy
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
 
+from src.config.constants import (
+    LEETCODE_GRAPHQL_ENDPOINT,
+    GITHUB_API_BASE,
+    RATE_LIMIT_REQUESTS,
+    RATE_LIMIT_PERIOD,
+    DEFAULT_DETAIL_BATCH_SIZE,
+    DEFAULT_CACHE_DIR,
+    SUBMISSION_CACHE_MAX_ENTRIES,
+    PROBLEM_CACHE_MAX_ENTRIES,
+    RENDER_CACHE_MAX_ENTRIES,
+    DEFAULT_STATE_FILE,
+    DEFAULT_MANIFEST_FILE,
+    DEFAULT_METRICS_JSON_FILE,
+    DEFAULT_METRICS_PROMETHEUS_FILE,
+    DEFAULT_PROFILE_DIR,
+    DEFAULT_WATCH_INTERVAL,
+    DEFAULT_WATCH_JITTER,
+    DEFAULT_ACCOUNTS_DIR,
+    DEFAULT_MAX_CONCURRENT_ACCOUNTS,
+    ACCOUNT_SECRETS,
+    DEFAULT_UPLOAD_WORKERS,
+    DEFAULT_GIT_WORK_DIR,
+    DEFAULT_EXPORT_DIR,
+    DEFAULT_EXPORT_ARCHIVE,
+    DEFAULT_PIPELINE_QUEUE_SIZE
+)
+from src.config.enums import SyncMode, StorageBackend, ProblemFieldSet
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,18 +43,23 @@ logger = get_logger(__name__)
 class Settings:
     """Application settings"""
     
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml",
+                 overrides: Optional[Dict[str, Dict[str, Any]]] = None):
         """
         Load settings from config file and environment
         
         Args:
             config_path: Path to config YAML file
+            overrides: Options merged over the config file's sections before
+                       validation, e.g. {"storage": {"backend": "zip"}}
         """
         # Load environment variables
         load_dotenv()
         
         # Load config file
         self.config = self._load_config(config_path)
+        for section, values in (overrides or {}).items():
+            self.config.setdefault(section, {}).update(values)
         
         # Load tag mappings
         self.tag_mappings = self._load_tag_mappings()
@@ -36,6 +69,8 @@ class Settings:
         self.leetcode_csrf = os.getenv("LEETCODE_CSRF_TOKEN", "")
         self.github_token = os.getenv("GITHUB_TOKEN", "")
         
+        self.account_name: Optional[str] = None  # Set on the settings of one of several accounts
+        
         # Validate
         self._validate()
     
@@ -84,7 +119,8 @@ class Settings:
                 "days_to_look_back": 30,
                 "only_accepted": True,
                 "keep_all_versions": True,
-                "version_naming": "sequential"
+                "version_naming": "sequential",
+                "detail_workers": 1
             },
             "logging": {
                 "level": "INFO",
@@ -108,26 +144,106 @@ class Settings:
         if not self.leetcode_session:
             errors.append("LEETCODE_SESSION not set in .env")
         
-        if not self.github_token:
+        backend = self.storage_backend
+        uses_github = self.uses_github
+        if uses_github and not self.github_token:
             errors.append("GITHUB_TOKEN not set in .env")
         
         if not self.leetcode_username:
             errors.append("LeetCode username not set in config")
         
-        if not self.github_username:
+        if uses_github and not self.github_username:
             errors.append("GitHub username not set in config")
         
+        # Archives are rebuilt from each run's files, so a partial run would drop the rest
+        if backend in (StorageBackend.TAR, StorageBackend.ZIP) and self.sync_mode == SyncMode.INCREMENTAL:
+            errors.append(f"Incremental mode is not supported by the {backend.value} backend (full syncs will run)")
+        
         if errors:
-            logger.error("Configuration validation failed:")
+            scope = f" for account {self.account_name}" if self.account_name else ""
+            logger.error(f"Configuration validation failed{scope}:")
             for error in errors:
                 logger.error(f"  - {error}")
             # Don't raise exception, allow user to proceed and fix
     
+    def for_account(self, account: Dict[str, Any]) -> "Settings":
+        """
+        Derive the settings of one entry of the accounts list
+        
+        The entry's sections (leetcode, github, sync_settings, ...) are
+        merged over this configuration. Its env mapping names the environment
+        variables holding its secrets; secrets it doesn't name are shared.
+        State, manifest, caches, metrics, profiles and the git working copy
+        move to the account's own folder unless the entry sets them.
+        
+        Args:
+            account: Entry of the accounts list, with at least a name
+        
+        Returns:
+            Settings of the account
+        
+        Raises:
+            ValueError: If the entry has no usable name
+        """
+        name = str(account.get("name", "")).strip()
+        if not name or "/" in name or name.startswith("."):
+            raise ValueError(f"Invalid account name: {account.get('name')!r}")
+        
+        account_dir = f"{DEFAULT_ACCOUNTS_DIR}/{name}"
+        config = copy.deepcopy(self.config)
+        # Off ("") stays off, everything else gets a per-account default
+        config.setdefault("sync_settings", {}).update(state_file=f"{account_dir}/state.json",
+                                                      manifest_file=f"{account_dir}/manifest.json")
+        config.setdefault("cache", {})["directory"] = f"{account_dir}/cache"
+        config.setdefault("storage", {}).update(git_work_dir=f"{account_dir}/repo", export_path="")
+        config.setdefault("profiling", {})["directory"] = f"{account_dir}/profiles"
+        metrics = config.setdefault("metrics", {})
+        for key, filename in (("json_file", "metrics.json"), ("prometheus_file", "metrics.prom")):
+            if metrics.get(key, True):
+                metrics[key] = f"{account_dir}/{filename}"
+        
+        for section, values in account.items():
+            if section in ("name", "env"):
+                continue
+            if isinstance(values, dict):
+                config.setdefault(section, {}).update(copy.deepcopy(values))
+            else:
+                config[section] = copy.deepcopy(values)
+        
+        settings = copy.copy(self)
+        settings.config = config
+        settings.account_name = name
+        for attribute, variable in account.get("env", {}).items():
+            if attribute not in ACCOUNT_SECRETS:
+                raise ValueError(f"Account {name}: unknown secret '{attribute}' "
+                                 f"(expected one of {', '.join(ACCOUNT_SECRETS)})")
+            setattr(settings, attribute, os.getenv(variable, ""))
+        
+        if not config["storage"]["export_path"]:
+            # Default export file name, inside the account folder
+            config["storage"]["export_path"] = f"{account_dir}/{Path(settings.export_path).name}"
+        
+        settings._validate()
+        return settings
+    
     # Properties for easy access
     @property
     def leetcode_username(self) -> str:
         return self.config.get("leetcode", {}).get("username", "")
     
+    @property
+    def leetcode_api_endpoint(self) -> str:
+        return self.config.get("leetcode", {}).get("api_endpoint", LEETCODE_GRAPHQL_ENDPOINT)
+    
+    @property
+    def problem_fields(self) -> ProblemFieldSet:
+        fields = self.config.get("leetcode", {}).get("problem_fields", ProblemFieldSet.METADATA.value)
+        try:
+            return ProblemFieldSet(fields)
+        except ValueError:
+            logger.warning(f"Unknown problem field set '{fields}', using metadata")
+            return ProblemFieldSet.METADATA
+    
     @property
     def github_username(self) -> str:
         return self.config.get("github", {}).get("username", "")
@@ -140,6 +256,58 @@ class Settings:
     def github_branch(self) -> str:
         return self.config.get("github", {}).get("branch", "main")
     
+    @property
+    def github_api_url(self) -> str:
+        return self.config.get("github", {}).get("api_url", GITHUB_API_BASE)
+    
+    @property
+    def github_throttle(self) -> bool:
+        return self.config.get("github", {}).get("throttle", True)
+    
+    @property
+    def batch_commit(self) -> bool:
+        return self.config.get("github", {}).get("batch_commit", True)
+    
+    @property
+    def upload_workers(self) -> int:
+        return self.config.get("github", {}).get("upload_workers", DEFAULT_UPLOAD_WORKERS)
+    
+    @property
+    def storage_backend(self) -> StorageBackend:
+        backend = self.config.get("storage", {}).get("backend", StorageBackend.GITHUB.value)
+        try:
+            return StorageBackend(backend)
+        except ValueError:
+            logger.warning(f"Unknown storage backend '{backend}', using github")
+            return StorageBackend.GITHUB
+    
+    @property
+    def git_work_dir(self) -> str:
+        return self.config.get("storage", {}).get("git_work_dir", DEFAULT_GIT_WORK_DIR)
+    
+    @property
+    def uses_github(self) -> bool:
+        """Whether the backend talks to GitHub (a git backend without its own remote pushes there)"""
+        backend = self.storage_backend
+        return backend == StorageBackend.GITHUB or (backend == StorageBackend.LOCAL_GIT and not self.git_remote)
+    
+    @property
+    def git_remote(self) -> str:
+        return self.config.get("storage", {}).get("git_remote", "")
+    
+    @property
+    def export_path(self) -> str:
+        path = self.config.get("storage", {}).get("export_path", "")
+        if path:
+            return path
+        
+        backend = self.storage_backend
+        if backend == StorageBackend.TAR:
+            return f"{DEFAULT_EXPORT_ARCHIVE}.tar.gz"
+        if backend == StorageBackend.ZIP:
+            return f"{DEFAULT_EXPORT_ARCHIVE}.zip"
+        return DEFAULT_EXPORT_DIR
+    
     @property
     def days_to_look_back(self) -> int:
         return self.config.get("sync_settings", {}).get("days_to_look_back", 30)
@@ -152,6 +320,83 @@ class Settings:
     def keep_all_versions(self) -> bool:
         return self.config.get("sync_settings", {}).get("keep_all_versions", True)
     
+    @property
+    def sync_mode(self) -> SyncMode:
+        mode = self.config.get("sync_settings", {}).get("mode", SyncMode.FULL.value)
+        try:
+            return SyncMode(mode)
+        except ValueError:
+            logger.warning(f"Unknown sync mode '{mode}', using full sync")
+            return SyncMode.FULL
+    
+    @property
+    def state_file(self) -> str:
+        return self.config.get("sync_settings", {}).get("state_file", DEFAULT_STATE_FILE)
+    
+    @property
+    def manifest_file(self) -> str:
+        return self.config.get("sync_settings", {}).get("manifest_file", DEFAULT_MANIFEST_FILE)
+    
+    @property
+    def manifest_in_repo(self) -> bool:
+        return self.config.get("sync_settings", {}).get("manifest_in_repo", False)
+    
+    @property
+    def generate_readme(self) -> bool:
+        return self.config.get("sync_settings", {}).get("generate_readme", True)
+    
+    @property
+    def detail_workers(self) -> int:
+        return self.config.get("sync_settings", {}).get("detail_workers", 1)
+    
+    @property
+    def detail_batch_size(self) -> int:
+        return self.config.get("sync_settings", {}).get("detail_batch_size", DEFAULT_DETAIL_BATCH_SIZE)
+    
+    @property
+    def pipelined(self) -> bool:
+        return self.config.get("sync_settings", {}).get("pipelined", False)
+    
+    @property
+    def pipeline_queue_size(self) -> int:
+        return self.config.get("sync_settings", {}).get("pipeline_queue_size", DEFAULT_PIPELINE_QUEUE_SIZE)
+    
+    @property
+    def rate_limit_requests(self) -> int:
+        return self.config.get("rate_limit", {}).get("requests", RATE_LIMIT_REQUESTS)
+    
+    @property
+    def rate_limit_period(self) -> int:
+        return self.config.get("rate_limit", {}).get("period", RATE_LIMIT_PERIOD)
+    
+    @property
+    def cache_enabled(self) -> bool:
+        return self.config.get("cache", {}).get("enabled", True)
+    
+    @property
+    def cache_bypass(self) -> bool:
+        return self.config.get("cache", {}).get("bypass", False)
+    
+    @property
+    def cache_dir(self) -> str:
+        return self.config.get("cache", {}).get("directory", DEFAULT_CACHE_DIR)
+    
+    @property
+    def submission_cache_max_entries(self) -> int:
+        return self.config.get("cache", {}).get("max_submissions", SUBMISSION_CACHE_MAX_ENTRIES)
+    
+    @property
+    def problem_cache_on_disk(self) -> bool:
+        return self.config.get("cache", {}).get("problems_on_disk", True)
+    
+    @property
+    def problem_cache_max_entries(self) -> int:
+        return self.config.get("cache", {}).get("max_problems", PROBLEM_CACHE_MAX_ENTRIES)
+    
+    @property
+    def render_cache_max_entries(self) -> int:
+        return self.config.get("cache", {}).get("max_renders", RENDER_CACHE_MAX_ENTRIES)
+    
     @property
     def active_tags(self) -> List[str]:
         return self.tag_mappings.get("active_tags", ["Database"])
@@ -160,6 +405,42 @@ class Settings:
     def tag_folder_mappings(self) -> Dict[str, str]:
         return self.tag_mappings.get("tag_mappings", {"Database": "Databases"})
     
+    @property
+    def metrics_json_file(self) -> str:
+        return self.config.get("metrics", {}).get("json_file", DEFAULT_METRICS_JSON_FILE)
+    
+    @property
+    def metrics_prometheus_file(self) -> str:
+        return self.config.get("metrics", {}).get("prometheus_file", DEFAULT_METRICS_PROMETHEUS_FILE)
+    
+    @property
+    def profile_enabled(self) -> bool:
+        return self.config.get("profiling", {}).get("enabled", False)
+    
+    @property
+    def profile_directory(self) -> str:
+        return self.config.get("profiling", {}).get("directory", DEFAULT_PROFILE_DIR)
+    
+    @property
+    def watch_interval(self) -> float:
+        return self.config.get("watch", {}).get("interval", DEFAULT_WATCH_INTERVAL)
+    
+    @property
+    def watch_jitter(self) -> float:
+        return self.config.get("watch", {}).get("jitter", DEFAULT_WATCH_JITTER)
+    
+    @property
+    def accounts(self) -> List[Dict[str, Any]]:
+        return self.config.get("accounts") or []
+    
+    @property
+    def max_concurrent_accounts(self) -> int:
+        return self.config.get("multi_account", {}).get("max_concurrent", DEFAULT_MAX_CONCURRENT_ACCOUNTS)
+    
+    @property
+    def share_rate_limit(self) -> bool:
+        return self.config.get("multi_account", {}).get("share_rate_limit", True)
+    
     @property
     def log_level(self) -> str:
         return self.config.get("logging", {}).get("level", "INFO")
@@ -0,0 +1,635 @@
+"""
+Async LeetCode API client
+asyncio counterpart of LeetCodeClient built on aiohttp
+"""
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple, Iterable, AsyncIterator
+
+from src.config.constants import (
+    LEETCODE_GRAPHQL_ENDPOINT,
+    GRAPHQL_RECENT_SUBMISSIONS,
+    GRAPHQL_SUBMISSION_LIST,
+    GRAPHQL_SUBMISSION_DETAIL,
+    GRAPHQL_QUESTION_CONTENT,
+    GRAPHQL_USER_STATUS,
+    QUESTION_FIELD_SETS,
+    DEFAULT_SUBMISSION_LIMIT,
+    SUBMISSION_PAGE_SIZE,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_DETAIL_BATCH_SIZE,
+    MAX_DETAIL_BATCH_SIZE,
+    DEFAULT_ASYNC_CONCURRENCY,
+    DEFAULT_ASYNC_POOL_SIZE
+)
+from src.config.enums import SubmissionStatus, ProblemFieldSet
+from src.core.leetcode_client import LeetCodeClient
+from src.core.problem_cache import ProblemCache
+from src.models.problem import Problem
+from src.models.submission import Submission
+from src.utils.helpers import parse_retry_after
+from src.utils.logger import get_logger
+from src.utils.metrics import SyncMetrics
+from src.utils.rate_limiter import RateLimiter
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+logger = get_logger(__name__)
+
+
+class AsyncLeetCodeClient:
+    """Async client for LeetCode GraphQL API"""
+    
+    def __init__(self, session_cookie: str, csrf_token: Optional[str] = None,
+                 max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+                 pool_size: int = DEFAULT_ASYNC_POOL_SIZE,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 problem_cache: Optional[ProblemCache] = None,
+                 problem_fields: ProblemFieldSet = ProblemFieldSet.METADATA,
+                 endpoint: str = LEETCODE_GRAPHQL_ENDPOINT,
+                 metrics: Optional[SyncMetrics] = None):
+        """
+        Initialize async LeetCode client
+        
+        The HTTP session is created lazily inside the running event loop.
+        Use the client as an async context manager or call close() when done.
+        
+        Args:
+            session_cookie: LEETCODE_SESSION cookie value
+            csrf_token: CSRF token (optional)
+            max_concurrency: Maximum number of in-flight requests
+            pool_size: Maximum number of pooled connections
+            rate_limiter: Limiter shared by every request of this client
+            problem_cache: Problem metadata cache (an in-memory one by default)
+            problem_fields: Problem fields to request; statements are only
+                            fetched up front with ProblemFieldSet.FULL
+            endpoint: GraphQL endpoint URL
+            metrics: Metrics requests are recorded in (none by default)
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncLeetCodeClient requires aiohttp (pip install aiohttp)")
+        
+        self.session_cookie = session_cookie
+        self.csrf_token = csrf_token or ""
+        self.max_concurrency = max(1, max_concurrency)
+        self.pool_size = max(1, pool_size)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.problem_cache = problem_cache if problem_cache is not None else ProblemCache()
+        self.problem_fields = problem_fields
+        self.endpoint = endpoint
+        self.metrics = metrics
+        self._inflight_problems: Dict[str, asyncio.Future] = {}
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def __aenter__(self) -> "AsyncLeetCodeClient":
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Create the pooled aiohttp session on first use"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=LeetCodeClient.build_headers(self.session_cookie, self.csrf_token),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
+    async def _make_request(self, query: str, variables: Dict[str, Any],
+                            retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+                            allow_partial: bool = False,
+                            retry_bad_request: bool = False) -> Optional[Dict]:
+        """
+        Make GraphQL request with retry logic
+        
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            retry_attempts: Number of retry attempts
+            allow_partial: Return partial data when some fields errored
+            retry_bad_request: Retry 400 responses like other failures, for
+                               requests that cannot be split up on a 400
+        
+        Returns:
+            Response data or None if failed
+        """
+        session = await self._get_session()
+        payload = {
+            "query": query,
+            "variables": variables
+        }
+        body = json.dumps(payload).encode("utf-8")
+        operation = LeetCodeClient.operation_name(query)
+        metrics = self.metrics
+        
+        for attempt in range(retry_attempts):
+            if attempt and metrics is not None:
+                metrics.record_retry("leetcode", operation)
+            try:
+                async with self._semaphore:
+                    # Tasks interleave on one thread, so waits are added directly rather than as nested stages
+                    waiting = time.monotonic()
+                    await self.rate_limiter.acquire_async()
+                    started = time.monotonic()
+                    if metrics is not None:
+                        metrics.add_stage_time("rate_limit_wait", started - waiting)
+                    
+                    status, raw = None, b""
+                    try:
+                        async with session.post(self.endpoint, data=body) as response:
+                            status = response.status
+                            retry_after = response.headers.get("Retry-After")
+                            raw = await response.read()
+                    finally:
+                        if metrics is not None:
+                            metrics.record_request("leetcode", operation, time.monotonic() - started,
+                                                   status, len(body), len(raw))
+                    data = json.loads(raw) if status == 200 else None
+                
+                # Other client errors (400 on a bad ID) say nothing about the pace
+                if status == 429:
+                    self.rate_limiter.on_throttle(parse_retry_after(retry_after))
+                elif status >= 500:
+                    self.rate_limiter.on_server_error(status, parse_retry_after(retry_after))
+                elif 200 <= status < 300:
+                    self.rate_limiter.on_success(time.monotonic() - started)
+                
+                if status == 200:
+                    if "errors" in data:
+                        if allow_partial and data.get("data"):
+                            logger.warning(f"GraphQL errors on {len(data['errors'])} field(s) - keeping partial data")
+                            return data["data"]
+                        logger.error(f"GraphQL errors: {data['errors']}")
+                        return None
+                    return data.get("data")
+                elif status == 400:
+                    logger.warning(f"Bad request (400) - possibly rate limited or invalid submission ID")
+                    if not retry_bad_request:
+                        return None
+                elif status == 429:
+                    logger.warning(f"Rate limited (429) - slowing down...")
+                    continue
+                else:
+                    logger.warning(f"Request failed with status {status}")
+            
+            except asyncio.TimeoutError as e:
+                self.rate_limiter.on_throttle()
+                logger.error(f"Request timed out (attempt {attempt + 1}): {str(e)}")
+            except Exception as e:
+                logger.error(f"Request error (attempt {attempt + 1}): {str(e)}")
+            
+            if attempt < retry_attempts - 1:
+                await asyncio.sleep(DEFAULT_RETRY_DELAY)
+        
+        return None
+    
+    async def get_recent_submissions(self, username: str,
+                                     limit: int = DEFAULT_SUBMISSION_LIMIT) -> List[Dict]:
+        """
+        Get list of recent submissions
+        
+        Args:
+            username: LeetCode username
+            limit: Maximum number of submissions to fetch
+        
+        Returns:
+            List of submission summaries
+        """
+        logger.info(f"Fetching recent submissions for user: {username}")
+        
+        variables = {
+            "username": username,
+            "limit": limit
+        }
+        
+        data = await self._make_request(GRAPHQL_RECENT_SUBMISSIONS, variables)
+        
+        if data and "recentAcSubmissionList" in data:
+            submissions = data["recentAcSubmissionList"]
+            logger.info(f"Found {len(submissions)} recent submissions")
+            return submissions
+        
+        logger.error("Failed to fetch recent submissions")
+        return []
+    
+    async def iter_submission_history(self, username: str, days_back: int = 0,
+                                      page_size: int = SUBMISSION_PAGE_SIZE,
+                                      incomplete: Optional[List[str]] = None) -> AsyncIterator[Dict]:
+        """
+        Stream accepted submission summaries over the full history, newest first
+        
+        See LeetCodeClient.iter_submission_history.
+        
+        Args:
+            username: LeetCode username (used by the fallback)
+            days_back: Number of days to look back (0 = all time)
+            page_size: Submissions per page
+            incomplete: List the reason the history was cut short is appended to
+        
+        Yields:
+            Submission summaries (id, title, titleSlug, timestamp)
+        """
+        cutoff_timestamp = 0
+        if days_back > 0:
+            cutoff_timestamp = int((datetime.now() - timedelta(days=days_back)).timestamp())
+        
+        offset = 0
+        last_key = None
+        pages = 0
+        
+        while True:
+            variables = {
+                "offset": offset,
+                "limit": page_size,
+                "lastKey": last_key
+            }
+            # A page cannot be split up, so a 400 is retried like any other failure
+            data = await self._make_request(GRAPHQL_SUBMISSION_LIST, variables, retry_bad_request=True)
+            page = data.get("submissionList") if data else None
+            
+            if not page:
+                if pages == 0:
+                    logger.warning("Submission history unavailable - falling back to recent submissions")
+                    recent = await self.get_recent_submissions(username)
+                    if incomplete is not None:
+                        incomplete.append(f"Submission history unavailable - only the {len(recent)} "
+                                          f"most recent accepted submissions were checked")
+                    for summary in recent:
+                        yield summary
+                else:
+                    logger.error(f"Failed to fetch submission history page {pages + 1} - history is incomplete")
+                    if incomplete is not None:
+                        incomplete.append(f"Failed to fetch submission history page {pages + 1} - "
+                                          f"older submissions were not synced")
+                return
+            
+            pages += 1
+            for summary in page.get("submissions") or []:
+                if int(summary.get("timestamp", 0)) < cutoff_timestamp:
+                    logger.info(f"Reached cutoff date after {pages} page(s)")
+                    return
+                
+                if summary.get("statusDisplay") == SubmissionStatus.ACCEPTED.value:
+                    yield summary
+            
+            if not page.get("hasNext"):
+                logger.info(f"Reached start of submission history after {pages} page(s)")
+                return
+            
+            offset += page_size
+            last_key = page.get("lastKey")
+    
+    async def get_submission_detail(self, submission_id: int) -> Optional[Submission]:
+        """
+        Get detailed submission information including code
+        
+        Args:
+            submission_id: Submission ID
+        
+        Returns:
+            Submission object or None if failed
+        """
+        logger.debug(f"Fetching submission detail for ID: {submission_id}")
+        
+        variables = {"submissionId": submission_id}
+        data = await self._make_request(GRAPHQL_SUBMISSION_DETAIL, variables)
+        
+        if not data or "submissionDetails" not in data:
+            logger.warning(f"Failed to fetch submission {submission_id} - skipping")
+            return None
+        
+        submission = (await self._resolve_submissions([(submission_id, data["submissionDetails"])]))[0]
+        if not submission:
+            return None
+        
+        logger.debug(f"Successfully fetched submission: {submission.problem.title}")
+        return submission
+    
+    async def get_problem(self, slug: str) -> Optional[Problem]:
+        """
+        Get problem metadata by title slug
+        
+        Args:
+            slug: Problem title slug
+        
+        Returns:
+            Problem object or None if failed
+        """
+        return (await self.get_problems([slug])).get(slug)
+    
+    async def get_problems(self, slugs: Iterable[str]) -> Dict[str, Problem]:
+        """
+        Get problem metadata for several title slugs
+        
+        Slugs are answered from the problem cache where possible. The rest are
+        fetched in aliased batches; a slug already being fetched by another
+        task is awaited instead of requested twice. Cache reads and writes may
+        hit SQLite, so they run in a worker thread to keep the loop responsive.
+        
+        Args:
+            slugs: Problem title slugs
+        
+        Returns:
+            Dictionary of slug to Problem; slugs that failed are absent
+        """
+        slugs = list(dict.fromkeys(slug for slug in slugs if slug))
+        problems = await asyncio.to_thread(self.problem_cache.get_many, slugs)
+        if self.problem_fields == ProblemFieldSet.FULL:
+            # Problems cached without their statement are refetched
+            problems = {slug: problem for slug, problem in problems.items() if problem.has_content}
+        loop = asyncio.get_running_loop()
+        
+        to_fetch = []
+        to_wait = []
+        for slug in slugs:
+            if slug in problems:
+                continue
+            future = self._inflight_problems.get(slug)
+            if future is None:
+                self._inflight_problems[slug] = loop.create_future()
+                to_fetch.append(slug)
+            else:
+                to_wait.append(future)
+        
+        try:
+            batches = [to_fetch[i:i + MAX_DETAIL_BATCH_SIZE]
+                       for i in range(0, len(to_fetch), MAX_DETAIL_BATCH_SIZE)]
+            for fetched in await asyncio.gather(*(self._fetch_problem_batch(b) for b in batches)):
+                await asyncio.to_thread(self.problem_cache.put_many, list(fetched.values()))
+                problems.update(fetched)
+        finally:
+            for slug in to_fetch:
+                future = self._inflight_problems.pop(slug)
+                if not future.done():
+                    future.set_result(None)
+        
+        if to_wait:
+            await asyncio.gather(*to_wait)
+            missing = [slug for slug in slugs if slug not in problems]
+            problems.update(await asyncio.to_thread(self.problem_cache.get_many, missing))
+        
+        return problems
+    
+    async def load_problem_content(self, problem: Problem) -> Optional[str]:
+        """
+        Load the HTML statement of a problem fetched without it
+        
+        Args:
+            problem: Problem to complete (updated in place and re-cached)
+        
+        Returns:
+            Problem statement, or None if it could not be fetched
+        """
+        if problem.has_content:
+            return problem.content
+        
+        data = await self._make_request(GRAPHQL_QUESTION_CONTENT, {"titleSlug": problem.title_slug})
+        question = (data or {}).get("question")
+        if not question:
+            logger.warning(f"Failed to fetch statement of problem {problem.title_slug}")
+            return None
+        
+        problem.content = question.get("content") or ""
+        await asyncio.to_thread(self.problem_cache.put, problem)
+        return problem.content
+    
+    async def _fetch_problem_batch(self, slugs: List[str]) -> Dict[str, Problem]:
+        """
+        Fetch problem metadata for several slugs in a single aliased request
+        
+        Args:
+            slugs: Problem title slugs
+        
+        Returns:
+            Dictionary of slug to Problem; slugs that failed are absent
+        """
+        query, variables = LeetCodeClient.build_batch_question_query(
+            slugs, QUESTION_FIELD_SETS[self.problem_fields.value]
+        )
+        data = await self._make_request(query, variables, allow_partial=True)
+        
+        if not data and len(slugs) > 1:
+            logger.warning(f"Batch of {len(slugs)} problems failed - retrying individually")
+            problems = {}
+            for fetched in await asyncio.gather(*(self._fetch_problem_batch([slug]) for slug in slugs)):
+                problems.update(fetched)
+            return problems
+        
+        problems = {}
+        for index, slug in enumerate(slugs):
+            question = (data or {}).get(f"q{index}")
+            if not question:
+                logger.warning(f"Failed to fetch problem {slug}")
+                continue
+            problems[slug] = LeetCodeClient.parse_problem(question)
+        
+        return problems
+    
+    async def _resolve_submissions(self, details: List[Tuple[int, Optional[Dict]]]) -> List[Optional[Submission]]:
+        """
+        Turn raw submissionDetails payloads into Submissions with their problems
+        
+        Args:
+            details: List of (submission_id, submissionDetails payload) pairs
+        
+        Returns:
+            List aligned with details; None where a submission is unusable
+        """
+        problems = await self.get_problems(LeetCodeClient.problem_slug(detail) for _, detail in details)
+        
+        results = []
+        for submission_id, detail in details:
+            try:
+                slug = LeetCodeClient.problem_slug(detail)
+                if detail and detail.get("code") is not None and slug not in problems:
+                    logger.warning(f"Problem '{slug}' for submission {submission_id} unavailable - skipping")
+                    results.append(None)
+                    continue
+                results.append(LeetCodeClient.parse_submission_detail(submission_id, detail, problems.get(slug)))
+            except Exception as e:
+                logger.warning(f"Failed to parse submission {submission_id}: {str(e)} - skipping")
+                results.append(None)
+        
+        return results
+    
+    async def _fetch_detail_safe(self, submission_id: int) -> Optional[Submission]:
+        """Fetch a submission detail, turning unexpected errors into a skip"""
+        try:
+            return await self.get_submission_detail(submission_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch submission {submission_id}: {str(e)} - skipping")
+            return None
+    
+    async def _fetch_detail_batch(self, submission_ids: List[int]) -> List[Optional[Submission]]:
+        """
+        Fetch several submission details in a single aliased request
+        
+        Args:
+            submission_ids: Submission IDs to fetch
+        
+        Returns:
+            List aligned with submission_ids; None where a lookup failed
+        """
+        if len(submission_ids) == 1:
+            return [await self._fetch_detail_safe(submission_ids[0])]
+        
+        query, variables = LeetCodeClient.build_batch_detail_query(submission_ids)
+        data = await self._make_request(query, variables, allow_partial=True)
+        
+        if not data:
+            # The whole document was rejected (e.g. 400 on one bad ID) - isolate the failure
+            logger.warning(f"Batch of {len(submission_ids)} submissions failed - retrying individually")
+            return list(await asyncio.gather(
+                *(self._fetch_detail_safe(submission_id) for submission_id in submission_ids)
+            ))
+        
+        return await self._resolve_submissions(
+            [(submission_id, data.get(f"s{index}")) for index, submission_id in enumerate(submission_ids)]
+        )
+    
+    async def get_submission_details(self, submission_ids: List[int],
+                                     batch_size: int = DEFAULT_DETAIL_BATCH_SIZE,
+                                     failed: Optional[List[int]] = None) -> List[Submission]:
+        """
+        Get detailed submission information for many submissions
+        
+        Batches run concurrently, bounded by max_concurrency.
+        
+        Args:
+            submission_ids: Submission IDs to fetch
+            batch_size: Lookups per request (1 = one request per submission)
+            failed: List the IDs that could not be fetched are appended to
+        
+        Returns:
+            List of Submission objects in input order; failed IDs are skipped
+        """
+        batch_size = max(1, min(batch_size, MAX_DETAIL_BATCH_SIZE))
+        batches = [submission_ids[i:i + batch_size]
+                   for i in range(0, len(submission_ids), batch_size)]
+        
+        # gather() preserves input order
+        results = await asyncio.gather(*(self._fetch_detail_batch(batch) for batch in batches))
+        return self._collect_details(batches, results, failed)
+    
+    @staticmethod
+    def _collect_details(batches: List[List[int]], results: List[List[Optional[Submission]]],
+                         failed: Optional[List[int]]) -> List[Submission]:
+        """Flatten batch results, noting the IDs that came back empty"""
+        submissions = []
+        for batch, batch_results in zip(batches, results):
+            for submission_id, submission in zip(batch, batch_results):
+                if submission:
+                    submissions.append(submission)
+                elif failed is not None:
+                    failed.append(int(submission_id))
+        return submissions
+    
+    async def get_submissions_by_date_range(self, username: str, days_back: int,
+                                            batch_size: int = DEFAULT_DETAIL_BATCH_SIZE,
+                                            since_mark: Optional[Tuple[int, int]] = None,
+                                            failed: Optional[List[int]] = None,
+                                            incomplete: Optional[List[str]] = None) -> List[Submission]:
+        """
+        Get submissions within a date range
+        
+        History pages are streamed: each batch of IDs is sent for its details
+        as soon as it is complete, while later pages are still being read, and
+        paging stops at the cutoff or the mark.
+        
+        Args:
+            username: LeetCode username
+            days_back: Number of days to look back
+            batch_size: Submission details per request
+            since_mark: Only fetch submissions newer than this
+                        (timestamp, submission ID) high-water mark
+            failed: List the IDs whose details could not be fetched are appended to
+            incomplete: List the reason the history was cut short is appended to
+        
+        Returns:
+            List of Submission objects, in the same order as the submission list
+        """
+        logger.info(f"Fetching submissions from last {days_back} days")
+        
+        batch_size = max(1, min(batch_size, MAX_DETAIL_BATCH_SIZE))
+        batches: List[List[int]] = []
+        tasks: List[asyncio.Task] = []
+        batch: List[int] = []
+        
+        history = self.iter_submission_history(username, days_back, incomplete=incomplete)
+        try:
+            async for summary in history:
+                timestamp = int(summary.get("timestamp", 0))
+                submission_id = int(summary.get("id", 0))
+                
+                # Everything from here on was synced by an earlier run
+                if since_mark and (timestamp, submission_id) <= since_mark:
+                    logger.info(f"Reached last synced submission {since_mark[1]} - stopping scan")
+                    break
+                
+                batch.append(submission_id)
+                if len(batch) >= batch_size:
+                    batches.append(batch)
+                    tasks.append(asyncio.ensure_future(self._fetch_detail_batch(batch)))
+                    batch = []
+            
+            if batch:
+                batches.append(batch)
+                tasks.append(asyncio.ensure_future(self._fetch_detail_batch(batch)))
+            
+            # gather() preserves input order
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            await history.aclose()
+        
+        filtered_submissions = self._collect_details(batches, results, failed)
+        logger.info(f"Filtered to {len(filtered_submissions)} submissions within date range")
+        return filtered_submissions
+    
+    async def test_connection(self) -> bool:
+        """
+        Test if connection to LeetCode is working
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            data = await self._make_request(GRAPHQL_USER_STATUS, {})
+            
+            if data and 'userStatus' in data:
+                user_status = data['userStatus']
+                if user_status.get('isSignedIn'):
+                    username = user_status.get('username', 'Unknown')
+                    logger.info(f"✓ LeetCode connection test successful (User: {username})")
+                    return True
+                else:
+                    logger.error("✗ LeetCode connection test failed: Not signed in")
+                    return False
+            else:
+                logger.error("✗ LeetCode connection test failed: Invalid response")
+                return False
+        
+        except Exception as e:
+            logger.error(f"✗ LeetCode connection test failed: {str(e)}")
+            return False
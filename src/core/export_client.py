@@ -0,0 +1,218 @@
+"""
+Export clients
+Write synced files to a local directory, a .tar.gz or a .zip instead of GitHub
+"""
+import io
+import os
+from abc import ABC, abstractmethod
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.config.constants import DEFAULT_UPLOAD_WORKERS
+from src.config.enums import UploadStatus
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FileExporter(ABC):
+    """
+    Base class for offline storage backends
+    
+    Exporters offer the same upload interface as GitHubClient. Files are
+    consumed one at a time from the iterable passed to commit_files and
+    written straight out, so memory stays flat however many files are synced.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize exporter
+        
+        Args:
+            path: Output directory or archive file
+        """
+        self.path = Path(path)
+    
+    def test_connection(self) -> bool:
+        """
+        Check that the output location is writable
+        
+        Returns:
+            True if writable, False otherwise
+        """
+        parent = self._output_dir()
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.error(f"✗ Output location not writable: {str(e)}")
+            return False
+        
+        if not os.access(parent, os.W_OK):
+            logger.error(f"✗ Output location not writable: {parent}")
+            return False
+        
+        logger.info(f"✓ Output location writable: {self.path}")
+        return True
+    
+    def _output_dir(self) -> Path:
+        """Directory that must exist for the export to be written"""
+        return self.path.parent
+    
+    def repository_exists(self) -> bool:
+        """Exports need no remote repository"""
+        return True
+    
+    def create_repository(self, description: str = "") -> bool:
+        """Exports need no remote repository"""
+        return True
+    
+    @abstractmethod
+    def commit_files(self, files: Iterable[Tuple[str, str]], commit_message: str,
+                     branch: str = "main",
+                     max_workers: int = DEFAULT_UPLOAD_WORKERS,
+                     blob_shas: Optional[Dict[str, str]] = None) -> Dict[str, UploadStatus]:
+        """
+        Write all files to the output
+        
+        Args:
+            files: Iterable of (file_path, content) tuples, consumed lazily
+            commit_message: Unused; kept for interface parity with GitHubClient
+            branch: Unused; kept for interface parity with GitHubClient
+            max_workers: Unused; kept for interface parity with GitHubClient
+            blob_shas: Unused; kept for interface parity with GitHubClient
+        
+        Returns:
+            Dictionary of file path to UploadStatus
+        """
+    
+    def upload_file(self, file_path: str, content: str,
+                    commit_message: str, branch: str = "main",
+                    blob_sha: Optional[str] = None) -> UploadStatus:
+        """Write a single file"""
+        return self.commit_files([(file_path, content)], commit_message, branch)[file_path]
+    
+    def create_or_update_file(self, file_path: str, content: str,
+                              commit_message: str, branch: str = "main") -> bool:
+        """Write a single file; True if successful (or already up to date)"""
+        return self.upload_file(file_path, content, commit_message, branch) != UploadStatus.FAILED
+    
+    def get_repository_url(self) -> str:
+        """Get the output location"""
+        return str(self.path.resolve())
+
+
+class DirectoryExporter(FileExporter):
+    """Write files into a plain directory tree, skipping identical files"""
+    
+    def _output_dir(self) -> Path:
+        return self.path
+    
+    def file_exists(self, file_path: str, branch: str = "main") -> bool:
+        """Check if a file exists in the output directory"""
+        return (self.path / file_path).is_file()
+    
+    def get_file_content(self, file_path: str, branch: str = "main") -> Optional[str]:
+        """Get content of an exported file, or None if not found"""
+        try:
+            return (self.path / file_path).read_text(encoding="utf-8")
+        except OSError:
+            return None
+    
+    def commit_files(self, files: Iterable[Tuple[str, str]], commit_message: str,
+                     branch: str = "main",
+                     max_workers: int = DEFAULT_UPLOAD_WORKERS,
+                     blob_shas: Optional[Dict[str, str]] = None) -> Dict[str, UploadStatus]:
+        statuses: Dict[str, UploadStatus] = {}
+        
+        for file_path, content in files:
+            target = self.path / file_path
+            data = content.encode("utf-8")
+            try:
+                existed = target.is_file()
+                if existed and target.read_bytes() == data:
+                    statuses[file_path] = UploadStatus.UNCHANGED
+                    continue
+                
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+                statuses[file_path] = UploadStatus.UPDATED if existed else UploadStatus.CREATED
+            except OSError as e:
+                logger.error(f"✗ Failed to write {file_path}: {str(e)}")
+                statuses[file_path] = UploadStatus.FAILED
+        
+        logger.info(f"✓ Exported {len(statuses)} files to {self.path}")
+        return statuses
+
+
+class ArchiveExporter(FileExporter):
+    """
+    Base class for single-file archive exports
+    
+    Each export replaces the whole archive: entries are streamed into a
+    temporary file that is renamed over the target once complete, so an
+    interrupted export never leaves a truncated archive behind. Since only
+    the files of the current run end up in it, archive exports always run
+    full syncs (see SyncService._sync).
+    """
+    
+    def commit_files(self, files: Iterable[Tuple[str, str]], commit_message: str,
+                     branch: str = "main",
+                     max_workers: int = DEFAULT_UPLOAD_WORKERS,
+                     blob_shas: Optional[Dict[str, str]] = None) -> Dict[str, UploadStatus]:
+        statuses: Dict[str, UploadStatus] = {}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        mtime = time.time()
+        
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._open(tmp_path) as archive:
+                for file_path, content in files:
+                    self._add(archive, file_path, content.encode("utf-8"), mtime)
+                    statuses[file_path] = UploadStatus.CREATED
+            os.replace(tmp_path, self.path)
+        
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+            logger.error(f"✗ Failed to write archive {self.path}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+            return {file_path: UploadStatus.FAILED for file_path in statuses}
+        
+        logger.info(f"✓ Exported {len(statuses)} files to {self.path}")
+        return statuses
+    
+    @abstractmethod
+    def _open(self, path: Path):
+        """Open a new archive for writing"""
+    
+    @abstractmethod
+    def _add(self, archive, file_path: str, data: bytes, mtime: float):
+        """Add one entry to an open archive"""
+
+
+class TarExporter(ArchiveExporter):
+    """Export files into a gzip-compressed tarball"""
+    
+    def _open(self, path: Path) -> tarfile.TarFile:
+        return tarfile.open(path, "w:gz")
+    
+    def _add(self, archive: tarfile.TarFile, file_path: str, data: bytes, mtime: float):
+        info = tarfile.TarInfo(name=file_path)
+        info.size = len(data)
+        info.mtime = int(mtime)
+        info.mode = 0o644
+        archive.addfile(info, io.BytesIO(data))
+
+
+class ZipExporter(ArchiveExporter):
+    """Export files into a deflate-compressed zip archive"""
+    
+    def _open(self, path: Path) -> zipfile.ZipFile:
+        return zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+    
+    def _add(self, archive: zipfile.ZipFile, file_path: str, data: bytes, mtime: float):
+        info = zipfile.ZipInfo(file_path, date_time=time.localtime(mtime)[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        archive.writestr(info, data)
@@ -2,21 +2,41 @@
 GitHub API client
 Handles all interactions with GitHub API
 """
-from typing import Optional, List
-from github import Github, GithubException
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, List, Dict, Iterable, Tuple
+from github import Github, GithubException, InputGitTreeElement
 from github.Repository import Repository
 from github.ContentFile import ContentFile
 import base64
 
+from src.config.constants import (
+    DEFAULT_UPLOAD_WORKERS,
+    GITHUB_API_BASE,
+    REF_UPDATE_RETRIES,
+    UPLOAD_WINDOW_PER_WORKER
+)
+from src.config.enums import UploadStatus
+from src.utils.helpers import git_blob_sha
 from src.utils.logger import get_logger
+from src.utils.metrics import SyncMetrics
 
 logger = get_logger(__name__)
 
 
 class GitHubClient:
-    """Client for GitHub API using PyGithub"""
+    """
+    Client for GitHub API using PyGithub
     
-    def __init__(self, token: str, username: str, repository: str):
+    Lookups are answered from an in-memory index of the branch tree
+    (path -> blob SHA), loaded with one recursive tree listing and kept
+    current as the client writes, instead of one get_contents call per file.
+    """
+    
+    def __init__(self, token: str, username: str, repository: str,
+                 base_url: str = GITHUB_API_BASE, throttle: bool = True,
+                 metrics: Optional[SyncMetrics] = None, github: Optional[Github] = None):
         """
         Initialize GitHub client
         
@@ -24,12 +44,29 @@ class GitHubClient:
             token: GitHub Personal Access Token
             username: GitHub username
             repository: Repository name
+            base_url: REST API root (GitHub Enterprise or a local stand-in)
+            throttle: Keep PyGithub's pause between requests, as GitHub
+                      asks of clients; disable only against local servers
+            metrics: Metrics API calls are recorded in (none by default)
+            github: PyGithub client to reuse, e.g. one shared by several
+                    repositories with the same token (base_url and throttle
+                    are then ignored)
         """
         self.token = token
         self.username = username
         self.repository_name = repository
-        self.github = Github(token)
+        if github is not None:
+            self.github = github
+        elif throttle:
+            self.github = Github(token, base_url=base_url)
+        else:
+            self.github = Github(token, base_url=base_url,
+                                 seconds_between_requests=None, seconds_between_writes=None)
         self.repo: Optional[Repository] = None
+        self.metrics = metrics
+        self._tree_index: Dict[str, Dict[str, str]] = {}  # branch -> {path: blob SHA}
+        self._index_heads: Dict[str, str] = {}  # branch -> commit SHA the index reflects
+        self._index_lock = threading.RLock()
         self._connect_to_repo()
     
     def _connect_to_repo(self):
@@ -85,6 +122,87 @@ class GitHubClient:
             logger.error(f"✗ Failed to create repository: {str(e)}")
             return False
     
+    def _call(self, endpoint: str, function: Callable, *args, bytes_sent: int = 0, **kwargs) -> Any:
+        """
+        Make an API call, recording it when metrics are attached
+        
+        PyGithub hides the HTTP exchange, so each call is recorded as one
+        request and only file contents count as bytes sent.
+        
+        Args:
+            endpoint: Name the call is recorded under
+            function: PyGithub method to call
+            bytes_sent: Size of the file content being written
+        """
+        if self.metrics is None:
+            return function(*args, **kwargs)
+        with self.metrics.timed_request("github", endpoint, bytes_sent):
+            return function(*args, **kwargs)
+    
+    def get_tree_index(self, branch: str = "main", refresh: bool = False) -> Optional[Dict[str, str]]:
+        """
+        Get the path -> blob SHA index of a branch, loading it on first use
+        
+        Args:
+            branch: Branch name
+            refresh: Reload the index from the branch head
+            
+        Returns:
+            Dictionary of file path to blob SHA, or None if the branch can't be read
+        """
+        if not self.repo:
+            return None
+        
+        with self._index_lock:
+            if not refresh and branch in self._tree_index:
+                return self._tree_index[branch]
+            
+            try:
+                ref = self._call("get_git_ref", self.repo.get_git_ref, f"heads/{branch}")
+                commit = self._call("get_git_commit", self.repo.get_git_commit, ref.object.sha)
+                self._set_tree_index(branch, commit.sha, commit.tree.sha)
+            except GithubException as e:
+                logger.error(f"✗ Failed to read tree of {branch}: {str(e)}")
+                return None
+            
+            return self._tree_index[branch]
+    
+    def _set_tree_index(self, branch: str, commit_sha: str, tree_sha: str):
+        """Load the index of a branch from a commit's tree (caller holds the lock)"""
+        index: Dict[str, str] = {}
+        self._walk_tree(tree_sha, "", index)
+        self._tree_index[branch] = index
+        self._index_heads[branch] = commit_sha
+        logger.debug(f"Indexed {len(index)} files on {branch} at {commit_sha[:7]}")
+    
+    def _walk_tree(self, tree_sha: str, prefix: str, index: Dict[str, str]):
+        """
+        Add every blob under a tree to the index
+        
+        A recursive listing is tried first. GitHub truncates it on very large
+        trees, in which case the tree is listed one level deep and each
+        subtree is walked on its own.
+        """
+        tree = self._call("get_git_tree", self.repo.get_git_tree, tree_sha, recursive=True)
+        if not tree.raw_data.get("truncated"):
+            for element in tree.tree:
+                if element.type == "blob":
+                    index[prefix + element.path] = element.sha
+            return
+        
+        for element in self._call("get_git_tree", self.repo.get_git_tree, tree_sha).tree:
+            if element.type == "blob":
+                index[prefix + element.path] = element.sha
+            elif element.type == "tree":
+                self._walk_tree(element.sha, f"{prefix}{element.path}/", index)
+    
+    def _index_file(self, branch: str, file_path: str, blob_sha: str, commit_sha: str):
+        """Record a write in the index of a branch"""
+        with self._index_lock:
+            if branch in self._tree_index:
+                self._tree_index[branch][file_path] = blob_sha
+                self._index_heads[branch] = commit_sha
+    
     def file_exists(self, file_path: str, branch: str = "main") -> bool:
         """
         Check if a file exists in the repository
@@ -96,14 +214,8 @@ class GitHubClient:
         Returns:
             True if file exists, False otherwise
         """
-        if not self.repo:
-            return False
-        
-        try:
-            self.repo.get_contents(file_path, ref=branch)
-            return True
-        except GithubException:
-            return False
+        index = self.get_tree_index(branch)
+        return index is not None and file_path in index
     
     def get_file_content(self, file_path: str, branch: str = "main") -> Optional[str]:
         """
@@ -116,14 +228,13 @@ class GitHubClient:
         Returns:
             File content as string or None if not found
         """
-        if not self.repo:
+        index = self.get_tree_index(branch)
+        if not index or file_path not in index:
             return None
         
         try:
-            content_file = self.repo.get_contents(file_path, ref=branch)
-            if isinstance(content_file, list):
-                return None
-            return content_file.decoded_content.decode('utf-8')
+            blob = self._call("get_git_blob", self.repo.get_git_blob, index[file_path])
+            return base64.b64decode(blob.content).decode('utf-8')
         except GithubException:
             return None
     
@@ -139,48 +250,80 @@ class GitHubClient:
             branch: Branch name
             
         Returns:
-            True if successful, False otherwise
+            True if successful (including when the file was already up to date), False otherwise
+        """
+        status = self.upload_file(file_path, content, commit_message, branch)
+        return status != UploadStatus.FAILED
+    
+    def upload_file(self, file_path: str, content: str,
+                    commit_message: str, branch: str = "main",
+                    blob_sha: Optional[str] = None) -> UploadStatus:
+        """
+        Create or update a file, skipping the write when content is unchanged
+        
+        Args:
+            file_path: Path to file in repository
+            content: File content
+            commit_message: Commit message
+            branch: Branch name
+            blob_sha: Git blob SHA of content if already known (computed otherwise)
+        
+        Returns:
+            UploadStatus of the write
         """
         if not self.repo:
             logger.error("No repository connection")
-            return False
+            return UploadStatus.FAILED
+        
+        index = self.get_tree_index(branch)
+        if index is None:
+            return UploadStatus.FAILED
+        
+        local_sha = blob_sha or git_blob_sha(content)
+        existing_sha = index.get(file_path)
+        
+        if existing_sha == local_sha:
+            logger.debug(f"Unchanged, skipping: {file_path}")
+            return UploadStatus.UNCHANGED
         
         try:
-            # Check if file exists
-            try:
-                existing_file = self.repo.get_contents(file_path, ref=branch)
+            if existing_sha:
                 # File exists, update it
-                if isinstance(existing_file, list):
-                    logger.error(f"Path is a directory: {file_path}")
-                    return False
-                
-                self.repo.update_file(
+                result = self._call(
+                    "update_file", self.repo.update_file,
+                    bytes_sent=len(content),
                     path=file_path,
                     message=commit_message,
                     content=content,
-                    sha=existing_file.sha,
+                    sha=existing_sha,
                     branch=branch
                 )
                 logger.info(f"✓ Updated file: {file_path}")
-                return True
+                status = UploadStatus.UPDATED
+            else:
+                # File doesn't exist, create it
+                result = self._call(
+                    "create_file", self.repo.create_file,
+                    bytes_sent=len(content),
+                    path=file_path,
+                    message=commit_message,
+                    content=content,
+                    branch=branch
+                )
+                logger.info(f"✓ Created file: {file_path}")
+                status = UploadStatus.CREATED
                 
-            except GithubException as e:
-                if e.status == 404:
-                    # File doesn't exist, create it
-                    self.repo.create_file(
-                        path=file_path,
-                        message=commit_message,
-                        content=content,
-                        branch=branch
-                    )
-                    logger.info(f"✓ Created file: {file_path}")
-                    return True
-                else:
-                    raise
+            self._index_file(branch, file_path, result["content"].sha, result["commit"].sha)
+            return status
         
         except GithubException as e:
             logger.error(f"✗ Failed to create/update file {file_path}: {str(e)}")
-            return False
+            if e.status in (409, 422):
+                # The index is stale (the branch changed elsewhere) - reload on next use
+                with self._index_lock:
+                    self._tree_index.pop(branch, None)
+                    self._index_heads.pop(branch, None)
+            return UploadStatus.FAILED
     
     def create_folder(self, folder_path: str, branch: str = "main") -> bool:
         """
@@ -201,25 +344,144 @@ class GitHubClient:
             branch=branch
         )
     
+    def commit_files(self, files: Iterable[Tuple[str, str]], commit_message: str,
+                     branch: str = "main",
+                     max_workers: int = DEFAULT_UPLOAD_WORKERS,
+                     blob_shas: Optional[Dict[str, str]] = None) -> Dict[str, UploadStatus]:
+        """
+        Write many files in a single commit using the Git Data API
+        
+        The git blob SHA of each file is computed locally (unless given in
+        blob_shas) and compared with the branch head; identical files are
+        skipped without uploading.
+        Changed blobs are uploaded in parallel while files is consumed, with at
+        most max_workers * UPLOAD_WINDOW_PER_WORKER uploads pending, so a lazy
+        iterable is not rendered ahead of the uploads. Then one tree and one commit
+        are created and the branch ref is advanced once. If the branch moved
+        while committing, the tree and commit are rebuilt on the new head.
+        
+        Args:
+            files: Iterable of (file_path, content) tuples
+            commit_message: Commit message
+            branch: Branch name
+            max_workers: Number of parallel blob uploads
+            blob_shas: Known git blob SHAs by path; may be filled while files is consumed
+            
+        Returns:
+            Dictionary of file path to UploadStatus
+        """
+        if not self.repo:
+            logger.error("No repository connection")
+            return {path: UploadStatus.FAILED for path, _ in files}
+        
+        try:
+            ref = self._call("get_git_ref", self.repo.get_git_ref, f"heads/{branch}")
+            base_commit = self._call("get_git_commit", self.repo.get_git_commit, ref.object.sha)
+            with self._index_lock:
+                if self._index_heads.get(branch) != base_commit.sha:
+                    self._set_tree_index(branch, base_commit.sha, base_commit.tree.sha)
+                remote_shas = dict(self._tree_index[branch])
+        except GithubException as e:
+            logger.error(f"✗ Failed to read branch {branch}: {str(e)}")
+            return {path: UploadStatus.FAILED for path, _ in files}
+        
+        statuses: Dict[str, UploadStatus] = {}
+        local_shas: Dict[str, str] = {}
+        known_shas = blob_shas if blob_shas is not None else {}
+        
+        def upload_blob(item: Tuple[str, str]) -> Tuple[str, UploadStatus]:
+            path, content = item
+            local_sha = known_shas.get(path) or git_blob_sha(content)
+            local_shas[path] = local_sha
+            if remote_shas.get(path) == local_sha:
+                return path, UploadStatus.UNCHANGED
+            try:
+                self._call("create_git_blob", self.repo.create_git_blob, content, "utf-8",
+                           bytes_sent=len(content))
+                return path, UploadStatus.UPDATED if path in remote_shas else UploadStatus.CREATED
+            except GithubException as e:
+                logger.error(f"✗ Failed to upload blob for {path}: {str(e)}")
+                return path, UploadStatus.FAILED
+        
+        # Upload changed blobs in parallel; executor.map() would drain files up front
+        max_workers = max(1, max_workers)
+        window = max_workers * UPLOAD_WINDOW_PER_WORKER
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="github-blob") as executor:
+            pending = deque()
+            for item in files:
+                if len(pending) >= window:
+                    path, status = pending.popleft().result()
+                    statuses[path] = status
+                pending.append(executor.submit(upload_blob, item))
+            while pending:
+                path, status = pending.popleft().result()
+                statuses[path] = status
+        
+        changed = [path for path, status in statuses.items()
+                   if status in (UploadStatus.CREATED, UploadStatus.UPDATED)]
+        unchanged_count = sum(1 for status in statuses.values() if status == UploadStatus.UNCHANGED)
+        
+        if not changed:
+            logger.info(f"✓ All {unchanged_count} files unchanged - nothing to commit")
+            return statuses
+        
+        elements = [InputGitTreeElement(path, "100644", "blob", sha=local_shas[path])
+                    for path in changed]
+        
+        for attempt in range(REF_UPDATE_RETRIES):
+            try:
+                if attempt > 0:
+                    if self.metrics is not None:
+                        self.metrics.record_retry("github", "edit_ref")
+                    ref = self._call("get_git_ref", self.repo.get_git_ref, f"heads/{branch}")
+                    base_commit = self._call("get_git_commit", self.repo.get_git_commit, ref.object.sha)
+                
+                tree = self._call("create_git_tree", self.repo.create_git_tree, elements, base_commit.tree)
+                commit = self._call("create_git_commit", self.repo.create_git_commit,
+                                    commit_message, tree, [base_commit])
+                self._call("edit_ref", ref.edit, commit.sha)
+                
+                with self._index_lock:
+                    if self._index_heads.get(branch) == base_commit.sha:
+                        self._tree_index[branch].update((path, local_shas[path]) for path in changed)
+                        self._index_heads[branch] = commit.sha
+                    else:
+                        # Committed on top of writes made elsewhere - reload on next use
+                        self._tree_index.pop(branch, None)
+                        self._index_heads.pop(branch, None)
+                
+                logger.info(f"✓ Committed {len(changed)} files in {commit.sha[:7]} "
+                            f"({unchanged_count} unchanged)")
+                return statuses
+            
+            except GithubException as e:
+                # 422 "Update is not a fast forward" / 409 conflict: the branch moved
+                if e.status in (409, 422) and attempt < REF_UPDATE_RETRIES - 1:
+                    logger.warning(f"Branch {branch} moved during commit - retrying ({attempt + 1})")
+                    continue
+                logger.error(f"✗ Failed to commit files: {str(e)}")
+                break
+        
+        for path in changed:
+            statuses[path] = UploadStatus.FAILED
+        return statuses
+    
     def bulk_upload_files(self, files: List[tuple], commit_message: str, 
                          branch: str = "main") -> int:
         """
-        Upload multiple files in separate commits
+        Upload multiple files in a single commit
         
         Args:
             files: List of (file_path, content) tuples
-            commit_message: Base commit message
+            commit_message: Commit message
             branch: Branch name
             
         Returns:
             Number of files successfully uploaded
         """
-        success_count = 0
-        
-        for file_path, content in files:
-            specific_message = f"{commit_message}: {file_path}"
-            if self.create_or_update_file(file_path, content, specific_message, branch):
-                success_count += 1
+        statuses = self.commit_files(files, commit_message, branch)
+        success_count = sum(1 for status in statuses.values() if status != UploadStatus.FAILED)
         
         logger.info(f"✓ Uploaded {success_count}/{len(files)} files")
         return success_count
@@ -2,54 +2,126 @@
 LeetCode API client
 Handles all interactions with LeetCode GraphQL API
 """
+import json
+import re
 import requests
+import threading
 import time
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Iterator
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
 
 from src.config.constants import (
     LEETCODE_GRAPHQL_ENDPOINT,
     GRAPHQL_RECENT_SUBMISSIONS,
+    GRAPHQL_SUBMISSION_LIST,
     GRAPHQL_SUBMISSION_DETAIL,
+    GRAPHQL_SUBMISSION_DETAIL_ALIAS,
+    GRAPHQL_QUESTION_DETAIL_ALIAS,
+    GRAPHQL_QUESTION_CONTENT,
+    GRAPHQL_USER_STATUS,
+    SUBMISSION_DETAIL_FIELDS,
+    QUESTION_DETAIL_FIELDS,
+    QUESTION_FIELD_SETS,
     DEFAULT_SUBMISSION_LIMIT,
+    SUBMISSION_PAGE_SIZE,
     DEFAULT_RETRY_ATTEMPTS,
-    DEFAULT_RETRY_DELAY
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_DETAIL_WORKERS,
+    MAX_DETAIL_WORKERS,
+    DEFAULT_DETAIL_BATCH_SIZE,
+    MAX_DETAIL_BATCH_SIZE
 )
+from src.config.enums import SubmissionStatus, ProblemFieldSet
+from src.models.compact import CompactProblem, CompactSubmission
 from src.models.problem import Problem
 from src.models.submission import Submission
+from src.core.problem_cache import ProblemCache
+from src.core.submission_cache import SubmissionCache
+from src.utils.helpers import parse_retry_after
 from src.utils.logger import get_logger
+from src.utils.metrics import SyncMetrics
+from src.utils.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
+# Operation name of a GraphQL document, used to label request metrics
+OPERATION_PATTERN = re.compile(r"query\s+(\w+)")
+
 
 class LeetCodeClient:
     """Client for LeetCode GraphQL API"""
     
-    def __init__(self, session_cookie: str, csrf_token: Optional[str] = None):
+    def __init__(self, session_cookie: str, csrf_token: Optional[str] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[SubmissionCache] = None,
+                 problem_cache: Optional[ProblemCache] = None,
+                 problem_fields: ProblemFieldSet = ProblemFieldSet.METADATA,
+                 endpoint: str = LEETCODE_GRAPHQL_ENDPOINT,
+                 metrics: Optional[SyncMetrics] = None,
+                 adapter: Optional[HTTPAdapter] = None):
         """
         Initialize LeetCode client
         
         Args:
             session_cookie: LEETCODE_SESSION cookie value
             csrf_token: CSRF token (optional)
+            rate_limiter: Limiter shared by every request of this client
+            cache: Persistent submission cache consulted before fetching details
+            problem_cache: Problem metadata cache (an in-memory one by default)
+            problem_fields: Problem fields to request; statements are only
+                            fetched up front with ProblemFieldSet.FULL
+            endpoint: GraphQL endpoint URL
+            metrics: Metrics requests and stages are recorded in (none by default)
+            adapter: Connection pool to send requests through, e.g. one shared
+                     by the clients of several accounts (a private one by default)
         """
         self.session_cookie = session_cookie
         self.csrf_token = csrf_token or ""
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.problem_cache = problem_cache if problem_cache is not None else ProblemCache()
+        self.problem_fields = problem_fields
+        self.endpoint = endpoint
+        self.metrics = metrics
+        self._inflight_problems = self.problem_cache.inflight
+        self._inflight_lock = self.problem_cache.inflight_lock
         self.session = requests.Session()
+        if adapter is not None:
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
         self._setup_session()
     
     def _setup_session(self):
         """Setup requests session with headers"""
-        self.session.headers.update({
+        self.session.headers.update(self.build_headers(self.session_cookie, self.csrf_token))
+    
+    @staticmethod
+    def build_headers(session_cookie: str, csrf_token: str) -> Dict[str, str]:
+        """
+        Build the HTTP headers LeetCode expects on GraphQL requests
+        
+        Args:
+            session_cookie: LEETCODE_SESSION cookie value
+            csrf_token: CSRF token
+            
+        Returns:
+            Dictionary of headers
+        """
+        return {
             "Content-Type": "application/json",
-            "Cookie": f"LEETCODE_SESSION={self.session_cookie}; csrftoken={self.csrf_token}",
+            "Cookie": f"LEETCODE_SESSION={session_cookie}; csrftoken={csrf_token}",
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Referer": "https://leetcode.com",
-            "X-CSRFToken": self.csrf_token
-        })
+            "X-CSRFToken": csrf_token
+        }
     
     def _make_request(self, query: str, variables: Dict[str, Any], 
-                     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS) -> Optional[Dict]:
+                     retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+                     allow_partial: bool = False,
+                     retry_bad_request: bool = False) -> Optional[Dict]:
         """
         Make GraphQL request with retry logic
         
@@ -57,6 +129,9 @@ class LeetCodeClient:
             query: GraphQL query string
             variables: Query variables
             retry_attempts: Number of retry attempts
+            allow_partial: Return partial data when some fields errored
+            retry_bad_request: Retry 400 responses like other failures, for
+                               requests that cannot be split up on a 400
             
         Returns:
             Response data or None if failed
@@ -65,39 +140,84 @@ class LeetCodeClient:
             "query": query,
             "variables": variables
         }
+        body = json.dumps(payload).encode("utf-8")
+        operation = self.operation_name(query)
         
         for attempt in range(retry_attempts):
+            if attempt and self.metrics is not None:
+                self.metrics.record_retry("leetcode", operation)
             try:
-                response = self.session.post(
-                    LEETCODE_GRAPHQL_ENDPOINT,
-                    json=payload,
-                    timeout=30
-                )
+                with self._stage("rate_limit_wait"):
+                    self.rate_limiter.acquire()
+                started = time.monotonic()
+                try:
+                    response = self.session.post(
+                        self.endpoint,
+                        data=body,
+                        timeout=30
+                    )
+                except requests.RequestException:
+                    self._record_request(operation, time.monotonic() - started, None, len(body))
+                    raise
+                self._record_request(operation, time.monotonic() - started, response.status_code,
+                                     len(body), len(response.content))
+                
+                # Other client errors (400 on a bad ID) say nothing about the pace
+                if response.status_code == 429:
+                    self.rate_limiter.on_throttle(parse_retry_after(response.headers.get("Retry-After")))
+                elif response.status_code >= 500:
+                    self.rate_limiter.on_server_error(response.status_code,
+                                                      parse_retry_after(response.headers.get("Retry-After")))
+                elif 200 <= response.status_code < 300:
+                    self.rate_limiter.on_success(time.monotonic() - started)
                 
                 if response.status_code == 200:
                     data = response.json()
                     if "errors" in data:
+                        if allow_partial and data.get("data"):
+                            logger.warning(f"GraphQL errors on {len(data['errors'])} field(s) - keeping partial data")
+                            return data["data"]
                         logger.error(f"GraphQL errors: {data['errors']}")
                         return None
                     return data.get("data")
                 elif response.status_code == 400:
                     logger.warning(f"Bad request (400) - possibly rate limited or invalid submission ID")
-                    return None
+                    if not retry_bad_request:
+                        return None
                 elif response.status_code == 429:
-                    logger.warning(f"Rate limited (429) - waiting longer...")
-                    time.sleep(5)
+                    logger.warning(f"Rate limited (429) - slowing down...")
                     continue
                 else:
                     logger.warning(f"Request failed with status {response.status_code}")
                 
+            except requests.Timeout as e:
+                self.rate_limiter.on_throttle()
+                logger.error(f"Request timed out (attempt {attempt + 1}): {str(e)}")
             except Exception as e:
                 logger.error(f"Request error (attempt {attempt + 1}): {str(e)}")
             
             if attempt < retry_attempts - 1:
-                time.sleep(DEFAULT_RETRY_DELAY)
+                with self._stage("retry_wait"):
+                    time.sleep(DEFAULT_RETRY_DELAY)
         
         return None
     
+    @staticmethod
+    def operation_name(query: str) -> str:
+        """Name of a GraphQL operation ("anonymous" if it has none)"""
+        match = OPERATION_PATTERN.search(query, 0, 200)
+        return match.group(1) if match else "anonymous"
+    
+    def _stage(self, name: str):
+        """Time a block as a sync stage when metrics are attached"""
+        return self.metrics.stage(name) if self.metrics is not None else nullcontext()
+    
+    def _record_request(self, operation: str, seconds: float, status: Optional[int],
+                        bytes_sent: int, bytes_received: int = 0):
+        """Record a GraphQL request when metrics are attached"""
+        if self.metrics is not None:
+            self.metrics.record_request("leetcode", operation, seconds, status, bytes_sent, bytes_received)
+    
     def get_recent_submissions(self, username: str, 
                               limit: int = DEFAULT_SUBMISSION_LIMIT) -> List[Dict]:
         """
@@ -127,6 +247,79 @@ class LeetCodeClient:
         logger.error("Failed to fetch recent submissions")
         return []
     
+    def iter_submission_history(self, username: str, days_back: int = 0,
+                                page_size: int = SUBMISSION_PAGE_SIZE,
+                                incomplete: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Stream accepted submission summaries over the full history, newest first
+        
+        Pages are requested lazily through submissionList (the signed-in
+        user's history), so paging stops as soon as a page crosses the
+        days_back cutoff or the caller stops iterating. If the paginated
+        list is unavailable, falls back to recentAcSubmissionList.
+        
+        A page that keeps failing ends the history early, and the reason is
+        appended to incomplete. So is the fallback, which only covers the
+        most recent submissions.
+        
+        Args:
+            username: LeetCode username (used by the fallback)
+            days_back: Number of days to look back (0 = all time)
+            page_size: Submissions per page
+            incomplete: List the reason the history was cut short is appended to
+            
+        Yields:
+            Submission summaries (id, title, titleSlug, timestamp)
+        """
+        cutoff_timestamp = 0
+        if days_back > 0:
+            cutoff_timestamp = int((datetime.now() - timedelta(days=days_back)).timestamp())
+        
+        offset = 0
+        last_key = None
+        pages = 0
+        
+        while True:
+            variables = {
+                "offset": offset,
+                "limit": page_size,
+                "lastKey": last_key
+            }
+            # A page cannot be split up, so a 400 is retried like any other failure
+            data = self._make_request(GRAPHQL_SUBMISSION_LIST, variables, retry_bad_request=True)
+            page = data.get("submissionList") if data else None
+            
+            if not page:
+                if pages == 0:
+                    logger.warning("Submission history unavailable - falling back to recent submissions")
+                    recent = self.get_recent_submissions(username)
+                    if incomplete is not None:
+                        incomplete.append(f"Submission history unavailable - only the {len(recent)} "
+                                          f"most recent accepted submissions were checked")
+                    yield from recent
+                else:
+                    logger.error(f"Failed to fetch submission history page {pages + 1} - history is incomplete")
+                    if incomplete is not None:
+                        incomplete.append(f"Failed to fetch submission history page {pages + 1} - "
+                                          f"older submissions were not synced")
+                return
+            
+            pages += 1
+            for summary in page.get("submissions") or []:
+                if int(summary.get("timestamp", 0)) < cutoff_timestamp:
+                    logger.info(f"Reached cutoff date after {pages} page(s)")
+                    return
+                
+                if summary.get("statusDisplay") == SubmissionStatus.ACCEPTED.value:
+                    yield summary
+            
+            if not page.get("hasNext"):
+                logger.info(f"Reached start of submission history after {pages} page(s)")
+                return
+            
+            offset += page_size
+            last_key = page.get("lastKey")
+    
     def get_submission_detail(self, submission_id: int) -> Optional[Submission]:
         """
         Get detailed submission information including code
@@ -137,6 +330,12 @@ class LeetCodeClient:
         Returns:
             Submission object or None if failed
         """
+        if self.cache is not None:
+            cached = self.cache.get(submission_id, self.get_problems)
+            if cached:
+                logger.debug(f"Using cached submission detail for ID: {submission_id}")
+                return cached
+        
         logger.debug(f"Fetching submission detail for ID: {submission_id}")
         
         variables = {"submissionId": submission_id}
@@ -146,30 +345,237 @@ class LeetCodeClient:
             logger.warning(f"Failed to fetch submission {submission_id} - skipping")
             return None
         
-        detail = data["submissionDetails"]
+        submission = self._resolve_submissions([(submission_id, data["submissionDetails"])])[0]
+        if not submission:
+            return None
         
-        # Check if submission detail is valid
-        if not detail or detail.get("code") is None:
-            logger.warning(f"Submission {submission_id} has no code - skipping")
+        if self.cache is not None:
+            self.cache.put(submission)
+        
+        logger.debug(f"Successfully fetched submission: {submission.problem.title}")
+        return submission
+    
+    def get_problem(self, slug: str) -> Optional[Problem]:
+        """
+        Get problem metadata by title slug
+        
+        Args:
+            slug: Problem title slug
+            
+        Returns:
+            Problem object or None if failed
+        """
+        return self.get_problems([slug]).get(slug)
+    
+    def get_problems(self, slugs: Iterable[str]) -> Dict[str, Problem]:
+        """
+        Get problem metadata for several title slugs
+        
+        Slugs are answered from the problem cache where possible. The rest are
+        fetched in aliased batches; a slug already being fetched by another
+        thread is waited on instead of requested twice.
+        
+        Args:
+            slugs: Problem title slugs
+            
+        Returns:
+            Dictionary of slug to Problem; slugs that failed are absent
+        """
+        slugs = list(dict.fromkeys(slug for slug in slugs if slug))
+        problems = self.cached_problems(slugs)
+        
+        to_fetch = []
+        to_wait = []
+        with self._inflight_lock:
+            for slug in slugs:
+                if slug in problems:
+                    continue
+                event = self._inflight_problems.get(slug)
+                if event is None:
+                    self._inflight_problems[slug] = threading.Event()
+                    to_fetch.append(slug)
+                else:
+                    to_wait.append(event)
+        
+        try:
+            for start in range(0, len(to_fetch), MAX_DETAIL_BATCH_SIZE):
+                fetched = self._fetch_problem_batch(to_fetch[start:start + MAX_DETAIL_BATCH_SIZE])
+                self.problem_cache.put_many(list(fetched.values()))
+                problems.update(fetched)
+        finally:
+            with self._inflight_lock:
+                for slug in to_fetch:
+                    self._inflight_problems.pop(slug).set()
+        
+        if to_wait:
+            for event in to_wait:
+                event.wait()
+            problems.update(self.problem_cache.get_many(slug for slug in slugs if slug not in problems))
+        
+        return problems
+    
+    def cached_problems(self, slugs: List[str]) -> Dict[str, Problem]:
+        """
+        Get the cached problems that satisfy the configured field set
+        
+        Args:
+            slugs: Problem title slugs
+            
+        Returns:
+            Dictionary of slug to Problem; with ProblemFieldSet.FULL, problems
+            cached without their statement are left out so they get refetched
+        """
+        problems = self.problem_cache.get_many(slugs)
+        if self.problem_fields == ProblemFieldSet.FULL:
+            problems = {slug: problem for slug, problem in problems.items() if problem.has_content}
+        return problems
+    
+    def load_problem_content(self, problem: Problem) -> Optional[str]:
+        """
+        Load the HTML statement of a problem fetched without it
+        
+        The statement is stored on the problem (and so on every submission
+        sharing it) and written back to the problem cache, so each statement
+        is downloaded at most once.
+        
+        Args:
+            problem: Problem to complete
+            
+        Returns:
+            Problem statement, or None if it could not be fetched
+        """
+        if problem.has_content:
+            return problem.content
+        
+        logger.debug(f"Fetching statement of problem {problem.title_slug}")
+        data = self._make_request(GRAPHQL_QUESTION_CONTENT, {"titleSlug": problem.title_slug})
+        question = (data or {}).get("question")
+        if not question:
+            logger.warning(f"Failed to fetch statement of problem {problem.title_slug}")
             return None
         
-        question = detail.get("question", {})
+        problem.content = question.get("content") or ""
+        self.problem_cache.put(problem)
+        return problem.content
+    
+    def _fetch_problem_batch(self, slugs: List[str]) -> Dict[str, Problem]:
+        """
+        Fetch problem metadata for several slugs in a single aliased request
         
-        # Parse problem
-        problem = Problem(
+        Args:
+            slugs: Problem title slugs
+            
+        Returns:
+            Dictionary of slug to Problem; slugs that failed are absent
+        """
+        if not slugs:
+            return {}
+        
+        logger.debug(f"Fetching metadata for {len(slugs)} problems")
+        
+        query, variables = self.build_batch_question_query(slugs, QUESTION_FIELD_SETS[self.problem_fields.value])
+        data = self._make_request(query, variables, allow_partial=True)
+        
+        if not data and len(slugs) > 1:
+            logger.warning(f"Batch of {len(slugs)} problems failed - retrying individually")
+            problems = {}
+            for slug in slugs:
+                problems.update(self._fetch_problem_batch([slug]))
+            return problems
+        
+        problems = {}
+        for index, slug in enumerate(slugs):
+            question = (data or {}).get(f"q{index}")
+            if not question:
+                logger.warning(f"Failed to fetch problem {slug}")
+                continue
+            problems[slug] = self.parse_problem(question)
+        
+        return problems
+    
+    def _resolve_submissions(self, details: List[Tuple[int, Optional[Dict]]]) -> List[Optional[Submission]]:
+        """
+        Turn raw submissionDetails payloads into Submissions with their problems
+        
+        Args:
+            details: List of (submission_id, submissionDetails payload) pairs
+            
+        Returns:
+            List aligned with details; None where a submission is unusable
+        """
+        problems = self.get_problems(self.problem_slug(detail) for _, detail in details)
+        
+        results = []
+        for submission_id, detail in details:
+            try:
+                slug = self.problem_slug(detail)
+                if detail and detail.get("code") is not None and slug not in problems:
+                    logger.warning(f"Problem '{slug}' for submission {submission_id} unavailable - skipping")
+                    results.append(None)
+                    continue
+                results.append(self.parse_submission_detail(submission_id, detail, problems.get(slug)))
+            except Exception as e:
+                logger.warning(f"Failed to parse submission {submission_id}: {str(e)} - skipping")
+                results.append(None)
+        
+        return results
+    
+    @staticmethod
+    def problem_slug(detail: Optional[Dict]) -> str:
+        """Get the problem title slug referenced by a submissionDetails payload"""
+        if not detail:
+            return ""
+        return (detail.get("question") or {}).get("titleSlug", "")
+    
+    @staticmethod
+    def parse_problem(question: Dict) -> CompactProblem:
+        """
+        Parse a question payload into a Problem
+        
+        Args:
+            question: Raw question object
+            
+        Returns:
+            CompactProblem, the memory-compact variant of Problem
+        """
+        return CompactProblem(
             question_id=question.get("questionId", ""),
             title=question.get("title", ""),
             title_slug=question.get("titleSlug", ""),
-            content=question.get("content", ""),
+            content=question.get("content"),
             difficulty=question.get("difficulty", "Unknown"),
-            tags=[tag.get("name", "") for tag in question.get("topicTags", [])]
+            tags=[tag.get("name", "") for tag in question.get("topicTags") or []]
         )
+    
+    @staticmethod
+    def parse_submission_detail(submission_id: int, detail: Optional[Dict],
+                                problem: Optional[CompactProblem] = None) -> Optional[CompactSubmission]:
+        """
+        Parse a submissionDetails payload into a Submission
+        
+        Args:
+            submission_id: Submission ID (for logging)
+            detail: Raw submissionDetails object
+            problem: Resolved problem; parsed from detail["question"] if omitted
+            
+        Returns:
+            CompactSubmission (the memory-compact variant of Submission), or
+            None if the payload is unusable
+        """
+        # Check if submission detail is valid
+        if not detail or detail.get("code") is None:
+            logger.warning(f"Submission {submission_id} has no code - skipping")
+            return None
+        
+        # Parse problem
+        if problem is None:
+            problem = LeetCodeClient.parse_problem(detail.get("question") or {})
         
         # Parse submission
         lang_info = detail.get("lang", {})
         language_name = lang_info.get("name", "") if isinstance(lang_info, dict) else str(lang_info)
         
-        submission = Submission(
+        submission = CompactSubmission(
             id=detail.get("id", ""),
             code=detail.get("code", ""),
             timestamp=int(detail.get("timestamp", 0)),
@@ -179,54 +585,268 @@ class LeetCodeClient:
             memory=detail.get("memoryDisplay"),
             problem=problem
         )
-        
-        logger.debug(f"Successfully fetched submission: {submission.problem.title}")
         return submission
     
-    def get_submissions_by_date_range(self, username: str, days_back: int) -> List[Submission]:
+    @staticmethod
+    def select_submission_ids(summaries: Iterable[Dict], days_back: int,
+                              since_mark: Optional[Tuple[int, int]] = None) -> List[int]:
         """
-        Get submissions within a date range
+        Select submission IDs that fall within the date range
         
         Args:
-            username: LeetCode username
-            days_back: Number of days to look back
+            summaries: Submission summaries, newest first (consumed only up to the
+                       cutoff or mark, so a lazy history stops paging there)
+            days_back: Number of days to look back (0 = all time)
+            since_mark: Only select submissions newer than this
+                        (timestamp, submission ID) high-water mark
             
         Returns:
-            List of Submission objects
+            List of submission IDs, in summary order
         """
-        logger.info(f"Fetching submissions from last {days_back} days")
-        
-        # Get recent submission list
-        recent_submissions = self.get_recent_submissions(username)
-        
-        if not recent_submissions:
-            return []
+        selected = LeetCodeClient.select_summaries(summaries, days_back, since_mark)
+        return [int(sub_summary.get("id", 0)) for sub_summary in selected]
+    
+    @staticmethod
+    def select_summaries(summaries: Iterable[Dict], days_back: int,
+                         since_mark: Optional[Tuple[int, int]] = None) -> List[Dict]:
+        """
+        Select submission summaries that fall within the date range
         
+        Args:
+            summaries: Submission summaries, newest first
+            days_back: Number of days to look back (0 = all time)
+            since_mark: Only select submissions newer than this
+                        (timestamp, submission ID) high-water mark
+            
+        Returns:
+            List of summaries, in input order
+        """
         # Calculate cutoff timestamp
         cutoff_date = datetime.now() - timedelta(days=days_back)
         cutoff_timestamp = int(cutoff_date.timestamp())
         
         logger.info(f"Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # Filter by date and fetch details
-        filtered_submissions = []
+        # Filter by date
+        selected = []
         
-        for sub_summary in recent_submissions:
+        for sub_summary in summaries:
             timestamp = int(sub_summary.get("timestamp", 0))
+            submission_id = int(sub_summary.get("id", 0))
+            
+            # Everything from here on was synced by an earlier run
+            if since_mark and (timestamp, submission_id) <= since_mark:
+                logger.info(f"Reached last synced submission {since_mark[1]} - stopping scan")
+                break
             
-            # Check if within date range
+            # Summaries are newest first, so everything from here on is older
             if days_back > 0 and timestamp < cutoff_timestamp:
-                continue
+                break
             
-            # Fetch full submission details
-            submission_id = int(sub_summary.get("id", 0))
-            submission = self.get_submission_detail(submission_id)
+            selected.append(sub_summary)
+        
+        return selected
+    
+    def _fetch_detail_safe(self, submission_id: int) -> Optional[Submission]:
+        """
+        Fetch a submission detail, turning unexpected errors into a skip
+        
+        Args:
+            submission_id: Submission ID
             
+        Returns:
+            Submission object or None if failed
+        """
+        try:
+            return self.get_submission_detail(submission_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch submission {submission_id}: {str(e)} - skipping")
+            return None
+    
+    @staticmethod
+    def build_batch_query(operation: str, alias_template: str, fields: str,
+                          variable_type: str, values: List[Any],
+                          prefix: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build one GraphQL document with an aliased lookup per value
+        
+        Args:
+            operation: Operation name
+            alias_template: Alias selection template (see constants)
+            fields: Selection set for each lookup
+            variable_type: GraphQL type of each variable (e.g. "Int!")
+            values: Values to look up
+            prefix: Alias prefix; results come back under prefix0, prefix1, ...
+            
+        Returns:
+            Tuple of (query, variables)
+        """
+        variables = {}
+        selections = []
+        
+        for index, value in enumerate(values):
+            variables[f"v{index}"] = value
+            selections.append(alias_template.format(
+                alias=f"{prefix}{index}",
+                variable=f"v{index}",
+                fields=fields
+            ))
+        
+        declarations = ", ".join(f"${name}: {variable_type}" for name in variables)
+        query = f"query {operation}({declarations}) {{{''.join(selections)}\n}}\n"
+        return query, variables
+    
+    @staticmethod
+    def build_batch_detail_query(submission_ids: List[int]) -> Tuple[str, Dict[str, int]]:
+        """Build an aliased submissionDetails query; results come back under s0, s1, ..."""
+        return LeetCodeClient.build_batch_query(
+            "submissionDetailsBatch", GRAPHQL_SUBMISSION_DETAIL_ALIAS,
+            SUBMISSION_DETAIL_FIELDS, "Int!", submission_ids, "s"
+        )
+    
+    @staticmethod
+    def build_batch_question_query(slugs: List[str],
+                                   fields: str = QUESTION_DETAIL_FIELDS) -> Tuple[str, Dict[str, str]]:
+        """Build an aliased question query; results come back under q0, q1, ..."""
+        return LeetCodeClient.build_batch_query(
+            "questionDataBatch", GRAPHQL_QUESTION_DETAIL_ALIAS,
+            fields, "String!", slugs, "q"
+        )
+    
+    def _fetch_detail_batch(self, submission_ids: List[int]) -> List[Optional[Submission]]:
+        """
+        Fetch several submission details in a single aliased request
+        
+        Args:
+            submission_ids: Submission IDs to fetch
+            
+        Returns:
+            List aligned with submission_ids; None where a lookup failed
+        """
+        if len(submission_ids) == 1:
+            return [self._fetch_detail_safe(submission_ids[0])]
+        
+        logger.debug(f"Fetching {len(submission_ids)} submission details in one request")
+        
+        query, variables = self.build_batch_detail_query(submission_ids)
+        data = self._make_request(query, variables, allow_partial=True)
+        
+        if not data:
+            # The whole document was rejected (e.g. 400 on one bad ID) - isolate the failure
+            logger.warning(f"Batch of {len(submission_ids)} submissions failed - retrying individually")
+            return [self._fetch_detail_safe(submission_id) for submission_id in submission_ids]
+        
+        return self._resolve_submissions(
+            [(submission_id, data.get(f"s{index}")) for index, submission_id in enumerate(submission_ids)]
+        )
+    
+    def get_submission_details(self, submission_ids: List[int],
+                               batch_size: int = DEFAULT_DETAIL_BATCH_SIZE,
+                               max_workers: int = DEFAULT_DETAIL_WORKERS,
+                               failed: Optional[List[int]] = None) -> List[Submission]:
+        """
+        Get detailed submission information for many submissions
+        
+        IDs are packed batch_size at a time into aliased GraphQL requests, and
+        batches are fetched by up to max_workers threads.
+        
+        Args:
+            submission_ids: Submission IDs to fetch
+            batch_size: Lookups per request (1 = one request per submission)
+            max_workers: Number of concurrent requests (1 = serial)
+            failed: List the IDs that could not be fetched are appended to
+            
+        Returns:
+            List of Submission objects in input order; failed IDs are skipped
+        """
+        cached = self.cache.get_many(submission_ids, self.get_problems) if self.cache is not None else {}
+        missing_ids = [sid for sid in submission_ids if int(sid) not in cached]
+        
+        if cached:
+            logger.info(f"Using {len(cached)} cached submission details, "
+                        f"fetching {len(missing_ids)}")
+        
+        fetched = {int(sub.id): sub for sub in self._fetch_details(missing_ids, batch_size, max_workers)}
+        
+        if self.cache is not None and fetched:
+            self.cache.put_many(list(fetched.values()))
+        
+        results = []
+        for submission_id in submission_ids:
+            submission = cached.get(int(submission_id)) or fetched.get(int(submission_id))
             if submission:
-                filtered_submissions.append(submission)
+                results.append(submission)
+            elif failed is not None:
+                failed.append(int(submission_id))
+        
+        return results
+    
+    def _fetch_details(self, submission_ids: List[int], batch_size: int,
+                       max_workers: int) -> List[Submission]:
+        """
+        Fetch submission details from LeetCode, bypassing the cache
+        
+        Args:
+            submission_ids: Submission IDs to fetch
+            batch_size: Lookups per request
+            max_workers: Number of concurrent requests
             
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
+        Returns:
+            List of Submission objects in input order; failed IDs are skipped
+        """
+        batch_size = max(1, min(batch_size, MAX_DETAIL_BATCH_SIZE))
+        batches = [submission_ids[i:i + batch_size]
+                   for i in range(0, len(submission_ids), batch_size)]
+        
+        max_workers = max(1, min(max_workers, MAX_DETAIL_WORKERS, len(batches) or 1))
+        
+        if max_workers == 1:
+            results = [self._fetch_detail_batch(batch) for batch in batches]
+        else:
+            logger.info(f"Fetching {len(submission_ids)} submission details in "
+                        f"{len(batches)} requests with {max_workers} workers")
+            with ThreadPoolExecutor(max_workers=max_workers,
+                                    thread_name_prefix="leetcode-detail") as executor:
+                # map() yields results in input order
+                results = list(executor.map(self._fetch_detail_batch, batches))
+        
+        return [submission for batch in results for submission in batch if submission]
+    
+    def get_submissions_by_date_range(self, username: str, days_back: int,
+                                      max_workers: int = DEFAULT_DETAIL_WORKERS,
+                                      batch_size: int = DEFAULT_DETAIL_BATCH_SIZE,
+                                      since_mark: Optional[Tuple[int, int]] = None,
+                                      failed: Optional[List[int]] = None,
+                                      incomplete: Optional[List[str]] = None) -> List[Submission]:
+        """
+        Get submissions within a date range
+        
+        Args:
+            username: LeetCode username
+            days_back: Number of days to look back
+            max_workers: Number of concurrent detail requests (1 = serial)
+            batch_size: Submission details per request
+            since_mark: Only fetch submissions newer than this
+                        (timestamp, submission ID) high-water mark
+            failed: List the IDs whose details could not be fetched are appended to
+            incomplete: List the reason the history was cut short is appended to
+            
+        Returns:
+            List of Submission objects, in the same order as the submission list
+        """
+        logger.info(f"Fetching submissions from last {days_back} days")
+        
+        # Stream the submission history, stopping at the cutoff or mark
+        with self._stage("summaries"):
+            history = self.iter_submission_history(username, days_back, incomplete=incomplete)
+            submission_ids = self.select_submission_ids(history, days_back, since_mark)
+        
+        if not submission_ids:
+            return []
+        
+        # Fetch full submission details
+        with self._stage("details"):
+            filtered_submissions = self.get_submission_details(submission_ids, batch_size, max_workers, failed)
         
         logger.info(f"Filtered to {len(filtered_submissions)} submissions within date range")
         return filtered_submissions
@@ -240,16 +860,7 @@ class LeetCodeClient:
         """
         try:
             # Test with a simple GraphQL query
-            query = """
-            query globalData {
-              userStatus {
-                username
-                isSignedIn
-              }
-            }
-            """
-              
-            data = self._make_request(query, {})
+            data = self._make_request(GRAPHQL_USER_STATUS, {})
             
             if data and 'userStatus' in data:
                 user_status = data['userStatus']
@@ -0,0 +1,306 @@
+"""
+Local git client
+Writes files into a local working copy, commits once and pushes once
+"""
+import base64
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.config.constants import (
+    DEFAULT_UPLOAD_WORKERS,
+    REF_UPDATE_RETRIES,
+    GIT_COMMIT_AUTHOR_NAME,
+    GIT_COMMIT_AUTHOR_EMAIL
+)
+from src.config.enums import UploadStatus
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LocalGitClient:
+    """
+    Storage backend backed by a local clone of the solutions repository
+    
+    A sync becomes plain file writes, one `git commit` and one `git push`,
+    instead of REST calls per file. The remote can be any URL git accepts,
+    including a path to a local bare repository. Offers the same upload
+    interface as GitHubClient (commit_files, upload_file, ...).
+    """
+    
+    def __init__(self, work_dir: str, remote_url: str, branch: str = "main",
+                 token: Optional[str] = None):
+        """
+        Initialize local git client
+        
+        Args:
+            work_dir: Directory of the working copy (cloned if missing)
+            remote_url: Remote repository URL or path
+            branch: Branch to commit to
+            token: GitHub token for HTTPS remotes (sent as a header, never stored)
+        """
+        self.work_dir = Path(work_dir)
+        self.remote_url = remote_url
+        self.branch = branch
+        self.token = token
+        self._identity: Dict[str, str] = {}
+        self._ready = self._prepare()
+    
+    def _git(self, *args: str, cwd: Optional[Path] = None, network: bool = False,
+             input: Optional[str] = None, check: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run a git command
+        
+        Args:
+            args: Git arguments
+            cwd: Directory to run in (default: the working copy)
+            network: Whether the command talks to the remote (adds credentials)
+            input: Text passed on stdin
+            check: Raise CalledProcessError on a non-zero exit code
+        """
+        command = ["git"]
+        if network and self.token and self.remote_url.startswith("https://"):
+            credentials = base64.b64encode(f"x-access-token:{self.token}".encode()).decode()
+            command += ["-c", f"http.extraHeader=Authorization: Basic {credentials}"]
+        command += list(args)
+        
+        env = dict(os.environ, GIT_TERMINAL_PROMPT="0", **self._identity)
+        return subprocess.run(
+            command,
+            cwd=str(cwd or self.work_dir),
+            input=input,
+            capture_output=True,
+            text=True,
+            env=env,
+            check=check
+        )
+    
+    def _prepare(self) -> bool:
+        """
+        Clone the remote, or refresh an existing working copy, and check out the branch
+        
+        Returns:
+            True if the working copy is ready
+        """
+        try:
+            if not (self.work_dir / ".git").exists():
+                self.work_dir.parent.mkdir(parents=True, exist_ok=True)
+                self._git("clone", "--quiet", self.remote_url, str(self.work_dir),
+                          cwd=self.work_dir.parent, network=True)
+                logger.info(f"✓ Cloned {self.get_repository_url()} into {self.work_dir}")
+            else:
+                self._git("remote", "set-url", "origin", self.remote_url)
+            
+            # Commits and rebases need an identity; fall back to ours if git has none
+            if self._git("config", "user.email", check=False).returncode != 0:
+                self._identity = {
+                    "GIT_AUTHOR_NAME": GIT_COMMIT_AUTHOR_NAME,
+                    "GIT_AUTHOR_EMAIL": GIT_COMMIT_AUTHOR_EMAIL,
+                    "GIT_COMMITTER_NAME": GIT_COMMIT_AUTHOR_NAME,
+                    "GIT_COMMITTER_EMAIL": GIT_COMMIT_AUTHOR_EMAIL
+                }
+            
+            self._sync_branch()
+            return True
+        
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.error(f"✗ Failed to prepare working copy {self.work_dir}: {self._describe(e)}")
+            return False
+    
+    def _sync_branch(self):
+        """Reset the working copy to the remote branch, or start it if the remote has none"""
+        fetch = self._git("fetch", "--quiet", "origin", self.branch, network=True, check=False)
+        
+        if fetch.returncode == 0:
+            self._git("checkout", "--quiet", "--force", "-B", self.branch, "FETCH_HEAD")
+            self._git("reset", "--quiet", "--hard", "FETCH_HEAD")
+        else:
+            # Empty remote or new branch: start it from scratch
+            self._git("symbolic-ref", "HEAD", f"refs/heads/{self.branch}")
+    
+    @staticmethod
+    def _describe(error: Exception) -> str:
+        """Get a readable message from a git failure"""
+        if isinstance(error, subprocess.CalledProcessError):
+            return (error.stderr or error.stdout or str(error)).strip()
+        return str(error)
+    
+    def test_connection(self) -> bool:
+        """
+        Test if the remote repository is reachable
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            self._git("ls-remote", "--heads", self.remote_url, cwd=Path.cwd(), network=True)
+            logger.info(f"✓ Git remote reachable: {self.get_repository_url()}")
+            return True
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.error(f"✗ Git remote test failed: {self._describe(e)}")
+            return False
+    
+    def repository_exists(self) -> bool:
+        """Check if the working copy was cloned from the remote"""
+        return self._ready
+    
+    def create_repository(self, description: str = "LeetCode solutions synced automatically") -> bool:
+        """
+        Create the remote repository
+        
+        Only local bare repositories can be created; hosted remotes must exist already.
+        
+        Args:
+            description: Repository description
+        
+        Returns:
+            True if created successfully, False otherwise
+        """
+        if re.match(r"^[\w+.-]+://|^[^/]+@[^/]+:", self.remote_url):
+            logger.error(f"✗ Cannot create remote repository {self.get_repository_url()} - create it first")
+            return False
+        
+        try:
+            Path(self.remote_url).mkdir(parents=True, exist_ok=True)
+            self._git("init", "--quiet", "--bare", f"--initial-branch={self.branch}",
+                      cwd=Path(self.remote_url))
+            (Path(self.remote_url) / "description").write_text(description + "\n")
+            logger.info(f"✓ Created bare repository: {self.remote_url}")
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.error(f"✗ Failed to create repository: {self._describe(e)}")
+            return False
+        
+        self._ready = self._prepare()
+        return self._ready
+    
+    def file_exists(self, file_path: str, branch: str = "main") -> bool:
+        """Check if a file exists in the working copy"""
+        return (self.work_dir / file_path).is_file()
+    
+    def get_file_content(self, file_path: str, branch: str = "main") -> Optional[str]:
+        """Get content of a file in the working copy, or None if not found"""
+        try:
+            return (self.work_dir / file_path).read_text(encoding="utf-8")
+        except OSError:
+            return None
+    
+    def _write_file(self, file_path: str, content: str) -> UploadStatus:
+        """Write one file into the working copy, skipping identical content"""
+        target = self.work_dir / file_path
+        data = content.encode("utf-8")
+        
+        existed = target.is_file()
+        if existed and target.read_bytes() == data:
+            return UploadStatus.UNCHANGED
+        
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        return UploadStatus.UPDATED if existed else UploadStatus.CREATED
+    
+    def commit_files(self, files: Iterable[Tuple[str, str]], commit_message: str,
+                     branch: str = "main",
+                     max_workers: int = DEFAULT_UPLOAD_WORKERS,
+                     blob_shas: Optional[Dict[str, str]] = None) -> Dict[str, UploadStatus]:
+        """
+        Write many files, commit them once and push once
+        
+        If the push is rejected because the remote moved, the commit is
+        rebased onto the new remote head and pushed again.
+        
+        Args:
+            files: Iterable of (file_path, content) tuples
+            commit_message: Commit message
+            branch: Branch name (the client's branch is used; kept for interface parity)
+            max_workers: Unused; kept for interface parity with GitHubClient
+            blob_shas: Unused; files are compared byte for byte
+        
+        Returns:
+            Dictionary of file path to UploadStatus
+        """
+        if not self._ready:
+            logger.error("No working copy")
+            return {path: UploadStatus.FAILED for path, _ in files}
+        
+        statuses: Dict[str, UploadStatus] = {}
+        for path, content in files:
+            try:
+                statuses[path] = self._write_file(path, content)
+            except OSError as e:
+                logger.error(f"✗ Failed to write {path}: {str(e)}")
+                statuses[path] = UploadStatus.FAILED
+        
+        changed = [path for path, status in statuses.items()
+                   if status in (UploadStatus.CREATED, UploadStatus.UPDATED)]
+        unchanged_count = sum(1 for status in statuses.values() if status == UploadStatus.UNCHANGED)
+        
+        if not changed:
+            logger.info(f"✓ All {unchanged_count} files unchanged - nothing to commit")
+            return statuses
+        
+        try:
+            self._commit(changed, commit_message)
+            self._push()
+            logger.info(f"✓ Committed and pushed {len(changed)} files ({unchanged_count} unchanged)")
+            return statuses
+        
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.error(f"✗ Failed to commit files: {self._describe(e)}")
+            # Drop the local commit; the next sync starts again from the remote branch
+            try:
+                self._sync_branch()
+            except (subprocess.CalledProcessError, OSError):
+                self._ready = False
+        
+        for path in changed:
+            statuses[path] = UploadStatus.FAILED
+        return statuses
+    
+    def _commit(self, paths: List[str], commit_message: str):
+        """Stage the given paths and create one commit"""
+        self._git("add", "--pathspec-from-file=-", input="\n".join(paths) + "\n")
+        self._git("commit", "--quiet", "--no-verify", "-m", commit_message)
+    
+    def _push(self):
+        """Push the branch, rebasing onto the remote head when the push is rejected"""
+        for attempt in range(REF_UPDATE_RETRIES):
+            push = self._git("push", "--quiet", "origin", f"HEAD:refs/heads/{self.branch}",
+                             network=True, check=False)
+            if push.returncode == 0:
+                return
+            
+            if attempt == REF_UPDATE_RETRIES - 1:
+                raise subprocess.CalledProcessError(push.returncode, "git push", push.stdout, push.stderr)
+            
+            logger.warning(f"Push rejected - rebasing onto origin/{self.branch} ({attempt + 1})")
+            self._git("fetch", "--quiet", "origin", self.branch, network=True)
+            self._git("rebase", "--quiet", "FETCH_HEAD")
+    
+    def upload_file(self, file_path: str, content: str,
+                    commit_message: str, branch: str = "main",
+                    blob_sha: Optional[str] = None) -> UploadStatus:
+        """
+        Write one file as its own commit and push
+        
+        Args:
+            file_path: Path to file in repository
+            content: File content
+            commit_message: Commit message
+            branch: Branch name
+            blob_sha: Unused; kept for interface parity with GitHubClient
+        
+        Returns:
+            UploadStatus of the write
+        """
+        return self.commit_files([(file_path, content)], commit_message, branch)[file_path]
+    
+    def create_or_update_file(self, file_path: str, content: str,
+                              commit_message: str, branch: str = "main") -> bool:
+        """Create or update a file; True if successful (or already up to date)"""
+        return self.upload_file(file_path, content, commit_message, branch) != UploadStatus.FAILED
+    
+    def get_repository_url(self) -> str:
+        """Get the remote URL without credentials"""
+        return re.sub(r"//[^/@]+@", "//", self.remote_url)
@@ -0,0 +1,196 @@
+"""
+Problem metadata cache
+In-memory LRU of Problem objects keyed by title slug, with an optional SQLite tier
+"""
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.config.constants import (
+    PROBLEM_CACHE_MAX_ENTRIES,
+    PROBLEM_CACHE_MAX_AGE,
+    PROBLEM_CACHE_SCHEMA_VERSION
+)
+from src.models.compact import CompactProblem
+from src.models.problem import Problem
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProblemCache:
+    """
+    Two-tier cache of Problem objects
+    
+    The memory tier is an LRU bounded by max_entries. When a disk path is
+    given, problems are also persisted to SQLite and reused across runs.
+    Either tier serves a problem for up to max_age seconds after it was
+    fetched, since LeetCode occasionally retags problems; long-lived
+    processes (watch mode, several accounts) then pick up the change too.
+    The cache is thread-safe and can be shared by several clients.
+    Problems read back from disk are CompactProblems, like those the
+    clients parse.
+    """
+    
+    def __init__(self, max_entries: int = PROBLEM_CACHE_MAX_ENTRIES,
+                 path: Optional[str] = None,
+                 max_age: int = PROBLEM_CACHE_MAX_AGE):
+        """
+        Initialize problem cache
+        
+        Args:
+            max_entries: Maximum number of problems kept in memory
+            path: Optional SQLite database file for the on-disk tier
+            max_age: Seconds an entry stays valid after it was fetched
+        """
+        self.max_entries = max(1, max_entries)
+        self.path = path
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        
+        # slug -> (problem, time it was fetched)
+        self._memory: "OrderedDict[str, Tuple[Problem, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # Slugs a client is fetching right now -> set once they are cached, so
+        # clients sharing the cache wait for a fetch instead of repeating it
+        self.inflight: Dict[str, threading.Event] = {}
+        self.inflight_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._init_schema()
+    
+    def _init_schema(self):
+        """Create the on-disk table, discarding data written by another schema version"""
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            
+            if version != PROBLEM_CACHE_SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS problems")
+                self._conn.execute(f"PRAGMA user_version = {PROBLEM_CACHE_SCHEMA_VERSION}")
+            
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS problems (
+                    slug TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+    
+    def _remember(self, problem: Problem, fetched_at: float):
+        """Insert into the memory tier and evict past the cap (caller holds the lock)"""
+        self._memory[problem.title_slug] = (problem, fetched_at)
+        self._memory.move_to_end(problem.title_slug)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def get(self, slug: str) -> Optional[Problem]:
+        """
+        Get a cached problem
+        
+        Args:
+            slug: Problem title slug
+        
+        Returns:
+            Problem object or None if not cached
+        """
+        return self.get_many([slug]).get(slug)
+    
+    def get_many(self, slugs: Iterable[str]) -> Dict[str, Problem]:
+        """
+        Get several cached problems
+        
+        Args:
+            slugs: Problem title slugs
+        
+        Returns:
+            Dictionary of slug to Problem for the slugs that were cached
+        """
+        slugs = list(slugs)
+        found = {}
+        missing = []
+        
+        oldest = time.time() - self.max_age
+        with self._lock:
+            for slug in slugs:
+                entry = self._memory.get(slug)
+                if entry is not None and entry[1] >= oldest:
+                    self._memory.move_to_end(slug)
+                    found[slug] = entry[0]
+                else:
+                    if entry is not None:
+                        del self._memory[slug]
+                    missing.append(slug)
+            
+            if missing and self._conn is not None:
+                for slug in missing:
+                    row = self._conn.execute(
+                        "SELECT payload, fetched_at FROM problems WHERE slug = ? AND fetched_at >= ?",
+                        (slug, oldest)
+                    ).fetchone()
+                    if row:
+                        problem = CompactProblem.from_dict(json.loads(row[0]))
+                        self._remember(problem, row[1])
+                        found[slug] = problem
+        
+        self.hits += len(found)
+        self.misses += len(slugs) - len(found)
+        return found
+    
+    def put(self, problem: Problem):
+        """
+        Store a problem
+        
+        Args:
+            problem: Problem to cache
+        """
+        self.put_many([problem])
+    
+    def put_many(self, problems: List[Problem]):
+        """
+        Store several problems in both tiers
+        
+        Args:
+            problems: Problems to cache
+        """
+        if not problems:
+            return
+        
+        now = time.time()
+        with self._lock:
+            for problem in problems:
+                self._remember(problem, now)
+            
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO problems (slug, payload, fetched_at) VALUES (?, ?, ?)",
+                        [(p.title_slug, json.dumps(p.to_dict()), now) for p in problems]
+                    )
+    
+    def clear(self):
+        """Remove all cached problems"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM problems")
+    
+    def close(self):
+        """Close the on-disk tier"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
@@ -0,0 +1,192 @@
+"""
+Render cache
+Stores formatted solution files and their git blob SHAs in SQLite
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.config.constants import (
+    DEFAULT_CACHE_DIR,
+    RENDER_CACHE_FILE,
+    RENDER_CACHE_MAX_ENTRIES,
+    RENDER_CACHE_SCHEMA_VERSION,
+    RENDER_CACHE_WRITE_BATCH
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (submission ID, version, render fingerprint)
+RenderKey = Tuple[int, int, str]
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered solution files
+    
+    A rendered file depends on its submission, its version number, the
+    header template, the problem's title, difficulty and tags, and the local
+    timezone, so entries are keyed by (submission ID, version, render
+    fingerprint; see FileFormatter.render_fingerprint) and never expire.
+    Editing a template, retagging a problem or moving to another timezone
+    changes the fingerprint: affected entries stop matching and are replaced
+    as they are re-rendered, while the others keep theirs.
+    
+    Writes and access-time updates are buffered and committed in batches;
+    call flush() once rendering is done.
+    """
+    
+    def __init__(self, path: str = f"{DEFAULT_CACHE_DIR}/{RENDER_CACHE_FILE}",
+                 max_entries: int = RENDER_CACHE_MAX_ENTRIES,
+                 bypass: bool = False):
+        """
+        Initialize render cache
+        
+        Args:
+            path: SQLite database file
+            max_entries: Maximum number of cached files
+            bypass: Skip cache reads (fresh renders are still written back)
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._pending: List[Tuple[int, int, str, str, str]] = []
+        self._touched: List[RenderKey] = []
+        self._init_schema()
+    
+    def _init_schema(self):
+        """Create the table, discarding data written by another schema version"""
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            
+            if version != RENDER_CACHE_SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS renders")
+                self._conn.execute(f"PRAGMA user_version = {RENDER_CACHE_SCHEMA_VERSION}")
+            
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS renders (
+                    submission_id INTEGER NOT NULL,
+                    version INTEGER NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    blob_sha TEXT NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (submission_id, version)
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_renders_accessed ON renders (accessed_at)"
+            )
+    
+    def get(self, submission_id: int, version: int, fingerprint: str) -> Optional[Tuple[str, str]]:
+        """
+        Get a rendered file
+        
+        Args:
+            submission_id: Submission ID
+            version: Version number the file was rendered with
+            fingerprint: Render fingerprint the file must have been rendered with
+        
+        Returns:
+            (content, git blob SHA), or None if not cached, stale or bypassed
+        """
+        if self.bypass:
+            return None
+        
+        key = (int(submission_id), int(version), fingerprint)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, blob_sha FROM renders "
+                "WHERE submission_id = ? AND version = ? AND fingerprint = ?",
+                key
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self._touched.append(key)
+            if len(self._touched) >= RENDER_CACHE_WRITE_BATCH:
+                self._write()
+        
+        return row[0], row[1]
+    
+    def put(self, submission_id: int, version: int, fingerprint: str,
+            content: str, blob_sha: str):
+        """
+        Store a rendered file, replacing one with another fingerprint
+        
+        Args:
+            submission_id: Submission ID
+            version: Version number the file was rendered with
+            fingerprint: Render fingerprint of the file
+            content: Rendered file content
+            blob_sha: Git blob SHA of the content
+        """
+        with self._lock:
+            self._pending.append((int(submission_id), int(version), fingerprint, content, blob_sha))
+            if len(self._pending) >= RENDER_CACHE_WRITE_BATCH:
+                self._write()
+    
+    def flush(self):
+        """Commit buffered writes and access times"""
+        with self._lock:
+            self._write()
+    
+    def _write(self):
+        """Commit buffered rows and evict the oldest entries over the cap (caller holds the lock)"""
+        if not self._pending and not self._touched:
+            return
+        
+        now = time.time()
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE renders SET accessed_at = ? "
+                    "WHERE submission_id = ? AND version = ? AND fingerprint = ?",
+                    [(now, *key) for key in self._touched]
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO renders "
+                    "(submission_id, version, fingerprint, content, blob_sha, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(*row, now) for row in self._pending]
+                )
+                if self._pending:
+                    self._conn.execute("""
+                        DELETE FROM renders WHERE rowid IN (
+                            SELECT rowid FROM renders ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                        )
+                    """, (self.max_entries,))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write render cache: {str(e)}")
+        
+        self._pending.clear()
+        self._touched.clear()
+    
+    def clear(self):
+        """Remove all cached files"""
+        with self._lock, self._conn:
+            self._pending.clear()
+            self._touched.clear()
+            self._conn.execute("DELETE FROM renders")
+    
+    def close(self):
+        """Flush buffered writes and close the database connection"""
+        with self._lock:
+            self._write()
+            self._conn.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM renders").fetchone()[0]
@@ -0,0 +1,199 @@
+"""
+Persistent submission cache
+Stores parsed accepted submissions in SQLite, keyed by submission ID
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.config.constants import (
+    DEFAULT_CACHE_DIR,
+    SUBMISSION_CACHE_FILE,
+    SUBMISSION_CACHE_MAX_ENTRIES,
+    SUBMISSION_CACHE_SCHEMA_VERSION
+)
+from src.models.compact import CompactSubmission
+from src.models.problem import Problem
+from src.models.submission import Submission
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SubmissionCache:
+    """
+    On-disk cache of Submission objects
+    
+    Accepted submissions never change, so entries never expire; the cache is
+    capped at max_entries and evicts the least recently used rows. A schema
+    version is stored in the database and a mismatch drops the old table.
+    
+    Rows only reference their problem by title slug. Readers pass a lookup
+    (normally LeetCodeClient.get_problems) that resolves slugs through the
+    problem cache, so problems are shared, refreshed once they expire and
+    completed with their statement when it is required. Entries are loaded
+    as CompactSubmissions, like those the clients parse.
+    """
+    
+    def __init__(self, path: str = f"{DEFAULT_CACHE_DIR}/{SUBMISSION_CACHE_FILE}",
+                 max_entries: int = SUBMISSION_CACHE_MAX_ENTRIES,
+                 bypass: bool = False):
+        """
+        Initialize submission cache
+        
+        Args:
+            path: SQLite database file
+            max_entries: Maximum number of cached submissions
+            bypass: Skip cache reads (fresh results are still written back)
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._init_schema()
+    
+    def _init_schema(self):
+        """Create the table, discarding data written by another schema version"""
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            
+            if version != SUBMISSION_CACHE_SCHEMA_VERSION:
+                if version:
+                    logger.info(f"Submission cache schema changed (v{version} → "
+                                f"v{SUBMISSION_CACHE_SCHEMA_VERSION}) - clearing cache")
+                self._conn.execute("DROP TABLE IF EXISTS submissions")
+                self._conn.execute(f"PRAGMA user_version = {SUBMISSION_CACHE_SCHEMA_VERSION}")
+            
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS submissions (
+                    id INTEGER PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_submissions_accessed ON submissions (accessed_at)"
+            )
+    
+    def get(self, submission_id: int,
+            problems: Callable[[Iterable[str]], Dict[str, Problem]]) -> Optional[Submission]:
+        """
+        Get a cached submission
+        
+        Args:
+            submission_id: Submission ID
+            problems: Lookup of problems by title slug
+        
+        Returns:
+            Submission object or None if not cached (or bypassed)
+        """
+        return self.get_many([submission_id], problems).get(int(submission_id))
+    
+    def get_many(self, submission_ids: Iterable[int],
+                 problems: Callable[[Iterable[str]], Dict[str, Problem]]) -> Dict[int, Submission]:
+        """
+        Get several cached submissions
+        
+        Args:
+            submission_ids: Submission IDs
+            problems: Lookup of problems by title slug; entries whose problem
+                      it cannot provide are treated as misses
+        
+        Returns:
+            Dictionary of submission ID to Submission for the IDs that were cached
+        """
+        ids = [int(submission_id) for submission_id in submission_ids]
+        if self.bypass or not ids:
+            return {}
+        
+        payloads = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id, payload FROM submissions WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+                
+                for row_id, payload in rows:
+                    try:
+                        payloads[row_id] = json.loads(payload)
+                    except (ValueError, TypeError) as e:
+                        logger.warning(f"Discarding corrupt cache entry {row_id}: {str(e)}")
+        
+        # Resolved outside the lock, since the lookup may have to fetch problems
+        resolved = problems(data.get("problem_slug", "") for data in payloads.values()) if payloads else {}
+        
+        found = {}
+        for row_id, data in payloads.items():
+            problem = resolved.get(data.get("problem_slug", ""))
+            if problem is not None:
+                found[row_id] = CompactSubmission.from_dict(data, problem)
+        
+        if found:
+            with self._lock, self._conn:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE submissions SET accessed_at = ? WHERE id = ?",
+                    [(now, row_id) for row_id in found]
+                )
+        
+        self.hits += len(found)
+        self.misses += len(ids) - len(found)
+        return found
+    
+    def put(self, submission: Submission):
+        """
+        Store a submission
+        
+        Args:
+            submission: Submission to cache
+        """
+        self.put_many([submission])
+    
+    def put_many(self, submissions: List[Submission]):
+        """
+        Store several submissions and evict the oldest entries over the cap
+        
+        Args:
+            submissions: Submissions to cache
+        """
+        if not submissions:
+            return
+        
+        now = time.time()
+        rows = [(int(sub.id), json.dumps(sub.to_dict()), now) for sub in submissions]
+        
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO submissions (id, payload, accessed_at) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.execute("""
+                DELETE FROM submissions WHERE id IN (
+                    SELECT id FROM submissions ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+    
+    def clear(self):
+        """Remove all cached submissions"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM submissions")
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM submissions").fetchone()[0]
@@ -0,0 +1,221 @@
+"""
+Compact data models
+Slotted, interned variants of Problem and Submission for holding whole histories in memory
+"""
+import sys
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from src.config.enums import Difficulty, FileExtension, Language
+from src.models.problem import Problem
+from src.models.submission import Submission
+
+# Language name (lowercase) -> file extension, resolved once instead of per access
+_EXTENSIONS: Dict[str, str] = {
+    lang.value: FileExtension[lang.name].value for lang in Language
+}
+
+# Identical tag lists share one tuple and one lowercase set
+_TAG_TUPLES: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a short, frequently repeated string"""
+    return sys.intern(value) if value else value
+
+
+def _intern_tags(tags: Iterable[str]) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Get the shared (tags, lowercase tag set) pair for a tag list"""
+    key = tuple(tags)
+    shared = _TAG_TUPLES.get(key)
+    if shared is None:
+        interned = tuple(sys.intern(tag) for tag in key)
+        shared = (interned, frozenset(sys.intern(tag.lower()) for tag in interned))
+        shared = _TAG_TUPLES.setdefault(interned, shared)
+    return shared
+
+
+class CompactProblem:
+    """
+    Memory-compact Problem
+    
+    Same attributes and methods as Problem, without a per-instance __dict__.
+    Difficulty and tags are interned, and tag lists are shared between
+    problems with the same tags together with a precomputed lowercase set.
+    """
+    
+    __slots__ = ("question_id", "title", "title_slug", "content", "difficulty", "tags", "tag_set")
+    
+    def __init__(self, question_id: str, title: str, title_slug: str, content: Optional[str],
+                 difficulty: str, tags: Iterable[str]):
+        self.question_id = question_id
+        self.title = title
+        self.title_slug = title_slug
+        self.content = content
+        self.difficulty = _intern(difficulty)
+        self.tags, self.tag_set = _intern_tags(tags)
+    
+    @property
+    def url(self) -> str:
+        """Get LeetCode problem URL"""
+        return f"https://leetcode.com/problems/{self.title_slug}/"
+    
+    @property
+    def difficulty_enum(self) -> Difficulty:
+        """Get difficulty as enum"""
+        return Difficulty(self.difficulty)
+    
+    @property
+    def has_content(self) -> bool:
+        """Check if the problem statement has been loaded"""
+        return self.content is not None
+    
+    def has_tag(self, tag: str) -> bool:
+        """Check if problem has a specific tag"""
+        return tag.lower() in self.tag_set
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (same layout as Problem)"""
+        return {
+            "question_id": self.question_id,
+            "title": self.title,
+            "title_slug": self.title_slug,
+            "content": self.content,
+            "difficulty": self.difficulty,
+            "tags": list(self.tags)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactProblem":
+        """Create a CompactProblem from a dictionary produced by to_dict"""
+        return cls(
+            question_id=data.get("question_id", ""),
+            title=data.get("title", ""),
+            title_slug=data.get("title_slug", ""),
+            content=data.get("content"),
+            difficulty=data.get("difficulty", "Unknown"),
+            tags=data.get("tags", [])
+        )
+    
+    @classmethod
+    def from_problem(cls, problem: Problem) -> "CompactProblem":
+        """Create a CompactProblem from a Problem"""
+        return cls(problem.question_id, problem.title, problem.title_slug,
+                   problem.content, problem.difficulty, problem.tags)
+    
+    def __repr__(self) -> str:
+        return f"Problem({self.question_id}. {self.title})"
+
+
+class CompactSubmission:
+    """
+    Memory-compact Submission
+    
+    Same attributes and properties as Submission, without a per-instance
+    __dict__. Status, language, runtime and memory strings are interned,
+    the submission datetime and its formatted form are computed once on
+    first use, and file extensions come from a table built at import time.
+    """
+    
+    __slots__ = ("id", "code", "timestamp", "status", "language", "runtime", "memory",
+                 "problem", "_datetime", "_formatted_timestamp")
+    
+    def __init__(self, id: str, code: str, timestamp: int, status: str, language: str,
+                 runtime: Optional[str], memory: Optional[str], problem: CompactProblem):
+        self.id = id
+        self.code = code
+        self.timestamp = timestamp
+        self.status = _intern(status)
+        self.language = _intern(language)
+        self.runtime = _intern(runtime)
+        self.memory = _intern(memory)
+        self.problem = problem
+        self._datetime: Optional[datetime] = None
+        self._formatted_timestamp: Optional[str] = None
+    
+    @property
+    def datetime(self) -> datetime:
+        """Get submission datetime"""
+        if self._datetime is None:
+            self._datetime = datetime.fromtimestamp(int(self.timestamp))
+        return self._datetime
+    
+    @property
+    def is_accepted(self) -> bool:
+        """Check if submission was accepted"""
+        return self.status == "Accepted"
+    
+    @property
+    def file_extension(self) -> str:
+        """Get file extension for this language"""
+        # Default to .txt for unknown languages
+        return _EXTENSIONS.get(self.language.lower(), ".txt")
+    
+    @property
+    def formatted_timestamp(self) -> str:
+        """Get formatted timestamp string"""
+        if self._formatted_timestamp is None:
+            self._formatted_timestamp = self.datetime.strftime("%Y-%m-%d %H:%M:%S")
+        return self._formatted_timestamp
+    
+    @property
+    def timestamp_for_filename(self) -> str:
+        """Get timestamp for filename (no special chars)"""
+        return self.datetime.strftime("%Y%m%d_%H%M%S")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (same layout as Submission)"""
+        return {
+            "id": self.id,
+            "code": self.code,
+            "timestamp": self.timestamp,
+            "status": self.status,
+            "language": self.language,
+            "runtime": self.runtime,
+            "memory": self.memory,
+            "problem_slug": self.problem.title_slug
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], problem: CompactProblem) -> "CompactSubmission":
+        """
+        Create a CompactSubmission from a dictionary produced by to_dict
+        
+        Args:
+            data: Submission dictionary
+            problem: Problem named by data["problem_slug"]; pass the same
+                     object for every submission of a problem to share it
+        """
+        return cls(
+            id=data.get("id", ""),
+            code=data.get("code", ""),
+            timestamp=int(data.get("timestamp", 0)),
+            status=data.get("status", "Accepted"),
+            language=data.get("language", ""),
+            runtime=data.get("runtime"),
+            memory=data.get("memory"),
+            problem=problem
+        )
+    
+    @classmethod
+    def from_submission(cls, submission: Submission,
+                        problems: Optional[Dict[str, CompactProblem]] = None) -> "CompactSubmission":
+        """
+        Create a CompactSubmission from a Submission
+        
+        Args:
+            submission: Submission to convert
+            problems: Optional slug -> CompactProblem registry shared across conversions
+        """
+        slug = submission.problem.title_slug
+        problem = problems.get(slug) if problems is not None else None
+        if problem is None:
+            problem = CompactProblem.from_problem(submission.problem)
+            if problems is not None:
+                problems[slug] = problem
+        
+        return cls(submission.id, submission.code, submission.timestamp, submission.status,
+                   submission.language, submission.runtime, submission.memory, problem)
+    
+    def __repr__(self) -> str:
+        return f"Submission({self.id}, {self.problem.title}, {self.status})"
@@ -1,19 +1,24 @@
 """
 Problem data model
 """
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional
 
 from src.config.enums import Difficulty
 
 
 @dataclass
 class Problem:
-    """Problem details from LeetCode"""
+    """
+    Problem details from LeetCode
+    
+    content holds the HTML problem statement, or None when it was not
+    fetched (see LeetCodeClient.load_problem_content).
+    """
     question_id: str
     title: str
     title_slug: str
-    content: str
+    content: Optional[str]
     difficulty: str
     tags: List[str]
     
@@ -27,9 +32,30 @@ class Problem:
         """Get difficulty as enum"""
         return Difficulty(self.difficulty)
     
+    @property
+    def has_content(self) -> bool:
+        """Check if the problem statement has been loaded"""
+        return self.content is not None
+    
     def has_tag(self, tag: str) -> bool:
         """Check if problem has a specific tag"""
         return tag.lower() in [t.lower() for t in self.tags]
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Problem":
+        """Create a Problem from a dictionary produced by to_dict"""
+        return cls(
+            question_id=data.get("question_id", ""),
+            title=data.get("title", ""),
+            title_slug=data.get("title_slug", ""),
+            content=data.get("content"),
+            difficulty=data.get("difficulty", "Unknown"),
+            tags=list(data.get("tags", []))
+        )
+    
     def __repr__(self) -> str:
         return f"Problem({self.question_id}. {self.title})"
@@ -3,7 +3,7 @@ Submission data model
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Dict, Any
 
 from src.config.enums import SubmissionStatus, Language, FileExtension
 from src.models.problem import Problem
@@ -51,5 +51,43 @@ class Submission:
         """Get timestamp for filename (no special chars)"""
         return self.datetime.strftime("%Y%m%d_%H%M%S")
     
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dictionary
+        
+        The problem is referenced by its title slug only, so problem metadata
+        is stored once (in the problem cache) rather than with every submission.
+        """
+        return {
+            "id": self.id,
+            "code": self.code,
+            "timestamp": self.timestamp,
+            "status": self.status,
+            "language": self.language,
+            "runtime": self.runtime,
+            "memory": self.memory,
+            "problem_slug": self.problem.title_slug
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], problem: Problem) -> "Submission":
+        """
+        Create a Submission from a dictionary produced by to_dict
+        
+        Args:
+            data: Submission dictionary
+            problem: Problem named by data["problem_slug"]
+        """
+        return cls(
+            id=data.get("id", ""),
+            code=data.get("code", ""),
+            timestamp=int(data.get("timestamp", 0)),
+            status=data.get("status", "Accepted"),
+            language=data.get("language", ""),
+            runtime=data.get("runtime"),
+            memory=data.get("memory"),
+            problem=problem
+        )
+    
     def __repr__(self) -> str:
         return f"Submission({self.id}, {self.problem.title}, {self.status})"
@@ -0,0 +1,287 @@
+"""
+Sync manifest data model
+Persisted record of the submissions and problems synced to the repository
+"""
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from src.models.problem import Problem
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ManifestProblem:
+    """A synced problem and the solution files written for it"""
+    question_id: str
+    title: str
+    title_slug: str
+    difficulty: str
+    tags: List[str]
+    folder: str
+    paths: List[str] = field(default_factory=list)  # Solution files, oldest first
+    
+    @property
+    def url(self) -> str:
+        """Get LeetCode problem URL"""
+        return f"https://leetcode.com/problems/{self.title_slug}/"
+    
+    @property
+    def solutions(self) -> int:
+        """Number of solution files"""
+        return len(self.paths)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return {
+            "question_id": self.question_id,
+            "title": self.title,
+            "title_slug": self.title_slug,
+            "difficulty": self.difficulty,
+            "tags": self.tags,
+            "folder": self.folder,
+            "paths": self.paths
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ManifestProblem":
+        """Create a ManifestProblem from a dictionary produced by to_dict"""
+        return cls(
+            question_id=data.get("question_id", ""),
+            title=data.get("title", ""),
+            title_slug=data.get("title_slug", ""),
+            difficulty=data.get("difficulty", "Unknown"),
+            tags=list(data.get("tags", [])),
+            folder=data.get("folder", ""),
+            paths=list(data.get("paths", []))
+        )
+
+
+@dataclass
+class ManifestSubmission:
+    """Where a submission was synced and what was written"""
+    path: str
+    version: int
+    blob_sha: str  # Git blob SHA of the file content
+    synced_at: int  # Unix timestamp of the write
+    
+    def to_list(self) -> List[Any]:
+        """Convert to the compact list stored in the manifest file"""
+        return [self.path, self.version, self.blob_sha, self.synced_at]
+    
+    @classmethod
+    def from_list(cls, data: List[Any]) -> "ManifestSubmission":
+        """Create a ManifestSubmission from a list produced by to_list"""
+        path, version, blob_sha, synced_at = data
+        return cls(path, int(version), blob_sha, int(synced_at))
+
+
+@dataclass
+class SyncManifest:
+    """
+    Manifest of everything synced to the repository
+    
+    Each synced submission maps to its file path, version and git blob SHA,
+    so unchanged files can be recognised locally without asking the storage
+    backend. The README and per-folder indexes are generated from the
+    manifest, not from the repository. Recording a file marks its folder as
+    pending, and only pending folders are re-rendered; the rendered README
+    section of every other folder is kept in the manifest and reused as is.
+    """
+    submissions: Dict[str, ManifestSubmission] = field(default_factory=dict)  # submission ID -> file
+    problems: Dict[str, ManifestProblem] = field(default_factory=dict)  # slug -> problem
+    sections: Dict[str, str] = field(default_factory=dict)  # folder -> rendered README section
+    pending_folders: Set[str] = field(default_factory=set)  # Folders whose index is out of date
+    updated_at: Optional[str] = None
+    changed: bool = field(default=False, init=False, compare=False)  # Modified since loaded
+    _by_folder: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_path: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        for slug, problem in self.problems.items():
+            self._by_folder.setdefault(problem.folder, set()).add(slug)
+        for entry in self.submissions.values():
+            self._by_path[entry.path] = entry.blob_sha
+    
+    def is_synced(self, submission_id: str, file_path: str, blob_sha: str) -> bool:
+        """
+        Check if a file is already in the repository with this content
+        
+        Args:
+            submission_id: Submission ID
+            file_path: Path the file would be written to
+            blob_sha: Git blob SHA of the rendered content
+        
+        Returns:
+            True if the submission was synced to this path with identical content
+        """
+        entry = self.submissions.get(str(submission_id))
+        return (entry is not None and entry.path == file_path and entry.blob_sha == blob_sha
+                and self._by_path.get(file_path) == blob_sha)
+    
+    def record_submission(self, submission_id: str, file_path: str, version: int, blob_sha: str):
+        """
+        Record a submission written (or found up to date) in the repository
+        
+        Args:
+            submission_id: Submission ID
+            file_path: Path of the file in the repository
+            version: Version number of the file
+            blob_sha: Git blob SHA of the file content
+        """
+        key = str(submission_id)
+        entry = self.submissions.get(key)
+        if entry is not None and (entry.path, entry.version, entry.blob_sha) == (file_path, version, blob_sha):
+            return
+        
+        self.submissions[key] = ManifestSubmission(file_path, version, blob_sha, int(time.time()))
+        self._by_path[file_path] = blob_sha
+        self.changed = True
+    
+    def record_file(self, problem: Problem, folder: str, file_path: str) -> bool:
+        """
+        Record a solution file written (or found up to date) in the repository
+        
+        Args:
+            problem: Problem the file solves
+            folder: Folder the problem is filed under
+            file_path: Path of the file in the repository
+        
+        Returns:
+            True if the manifest changed
+        """
+        slug = problem.title_slug
+        entry = self.problems.get(slug)
+        
+        if entry is None:
+            entry = ManifestProblem(problem.question_id, problem.title, slug,
+                                    problem.difficulty, list(problem.tags), folder)
+            self.problems[slug] = entry
+            self._by_folder.setdefault(folder, set()).add(slug)
+            changed = True
+        else:
+            changed = False
+            if entry.folder != folder:
+                # Moved by a tag mapping change: both indexes need rewriting
+                self.pending_folders.add(entry.folder)
+                self._by_folder.get(entry.folder, set()).discard(slug)
+                self._by_folder.setdefault(folder, set()).add(slug)
+                entry.folder = folder
+                entry.paths = [path for path in entry.paths if path.startswith(f"{folder}/")]
+                changed = True
+            metadata = (problem.question_id, problem.title, problem.difficulty, list(problem.tags))
+            if metadata != (entry.question_id, entry.title, entry.difficulty, entry.tags):
+                entry.question_id, entry.title, entry.difficulty, entry.tags = metadata
+                changed = True
+        
+        if file_path not in entry.paths:
+            entry.paths.append(file_path)
+            changed = True
+        
+        if changed:
+            self.pending_folders.add(folder)
+            self.changed = True
+        return changed
+    
+    def problems_in(self, folder: str) -> List[ManifestProblem]:
+        """Get the problems filed under a folder"""
+        return [self.problems[slug] for slug in self._by_folder.get(folder, ())]
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get statistics of what has been synced
+        
+        Returns:
+            Dictionary of submission, file and problem counts
+        """
+        by_difficulty: Dict[str, int] = {}
+        for problem in self.problems.values():
+            by_difficulty[problem.difficulty] = by_difficulty.get(problem.difficulty, 0) + 1
+        
+        return {
+            "submissions": len(self.submissions),
+            "files": len(self._by_path),
+            "problems": len(self.problems),
+            "folders": len(self._by_folder),
+            "by_difficulty": by_difficulty,
+            "last_synced_at": max((entry.synced_at for entry in self.submissions.values()), default=None)
+        }
+    
+    def to_json(self) -> str:
+        """
+        Serialize the manifest, stamping the update time
+        
+        Returns:
+            JSON text
+        """
+        self.updated_at = datetime.now().isoformat(timespec="seconds")
+        return json.dumps({
+            "submissions": {key: entry.to_list() for key, entry in self.submissions.items()},
+            "problems": {slug: entry.to_dict() for slug, entry in self.problems.items()},
+            "sections": self.sections,
+            "pending_folders": sorted(self.pending_folders),
+            "updated_at": self.updated_at
+        }, indent=1, sort_keys=True)
+    
+    @classmethod
+    def from_json(cls, text: str) -> "SyncManifest":
+        """
+        Parse a manifest produced by to_json
+        
+        Args:
+            text: JSON text
+        
+        Returns:
+            SyncManifest
+        """
+        data = json.loads(text)
+        return cls(
+            submissions={key: ManifestSubmission.from_list(entry)
+                         for key, entry in data.get("submissions", {}).items()},
+            problems={slug: ManifestProblem.from_dict(entry)
+                      for slug, entry in data.get("problems", {}).items()},
+            sections=dict(data.get("sections", {})),
+            pending_folders=set(data.get("pending_folders", [])),
+            updated_at=data.get("updated_at")
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> "SyncManifest":
+        """
+        Load the manifest from a JSON file
+        
+        Args:
+            path: Manifest file path
+        
+        Returns:
+            SyncManifest (empty if the file is missing or unreadable)
+        """
+        try:
+            with open(path, 'r') as f:
+                return cls.from_json(f.read())
+        except FileNotFoundError:
+            return cls()
+        except Exception as e:
+            logger.warning(f"Could not read sync manifest {path}: {str(e)} - starting fresh")
+            return cls()
+    
+    def save(self, path: str, text: Optional[str] = None):
+        """
+        Save the manifest to a JSON file atomically
+        
+        Args:
+            path: Manifest file path
+            text: Already serialized manifest (to_json is called otherwise)
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(text if text is not None else self.to_json())
+        os.replace(tmp_path, path)
@@ -2,9 +2,12 @@
 Sync result data model
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from datetime import datetime
 
+from src.config.constants import METRICS_PREFIX
+from src.utils.metrics import SyncMetrics
+
 
 @dataclass
 class SyncResult:
@@ -19,6 +22,9 @@ class SyncResult:
     tag_counts: Dict[str, int] = field(default_factory=dict)
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
+    metrics: SyncMetrics = field(default_factory=SyncMetrics, repr=False, compare=False)
+    profile_directory: Optional[str] = None  # Reports of a profiled run
+    history_complete: bool = True  # Whether the whole requested history was walked
     
     @property
     def duration(self) -> float:
@@ -39,6 +45,11 @@ class SyncResult:
         """Add an error message"""
         self.errors.append(error)
     
+    def mark_history_incomplete(self, reason: str):
+        """Record that part of the requested history could not be read"""
+        self.history_complete = False
+        self.add_error(reason)
+    
     def add_synced_problem(self, problem_title: str):
         """Add a synced problem"""
         if problem_title not in self.synced_problems:
@@ -52,6 +63,62 @@ class SyncResult:
         """Mark sync as finished"""
         self.end_time = datetime.now()
     
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dictionary
+        
+        Returns:
+            Outcome counts, timings and request metrics of the run
+        """
+        return {
+            "start_time": self.start_time.isoformat(timespec="seconds"),
+            "end_time": self.end_time.isoformat(timespec="seconds") if self.end_time else None,
+            "duration_seconds": round(self.duration, 3),
+            "total_submissions": self.total_submissions,
+            "filtered_submissions": self.filtered_submissions,
+            "files_created": self.files_created,
+            "files_updated": self.files_updated,
+            "files_skipped": self.files_skipped,
+            "errors": len(self.errors),
+            "history_complete": self.history_complete,
+            "tag_counts": dict(self.tag_counts),
+            **self.metrics.to_dict()
+        }
+    
+    def to_prometheus(self, prefix: str = METRICS_PREFIX) -> str:
+        """
+        Render the run in Prometheus text format (for the node_exporter textfile collector)
+        
+        Args:
+            prefix: Metric name prefix
+            
+        Returns:
+            Exposition text
+        """
+        gauges = [
+            ("last_run_timestamp_seconds", "Unix time the last run finished",
+             (self.end_time or datetime.now()).timestamp()),
+            ("duration_seconds", "Wall time of the last run", self.duration),
+            ("submissions", "Submissions fetched in the last run", self.total_submissions),
+            ("filtered_submissions", "Submissions matching the filters in the last run",
+             self.filtered_submissions),
+            ("errors", "Errors in the last run", len(self.errors))
+        ]
+        lines = []
+        for name, description, value in gauges:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value:g}" if isinstance(value, int) else f"{prefix}_{name} {value:.3f}")
+        
+        lines.append(f"# HELP {prefix}_files Files by outcome in the last run")
+        lines.append(f"# TYPE {prefix}_files gauge")
+        for outcome, count in (("created", self.files_created), ("updated", self.files_updated),
+                               ("skipped", self.files_skipped)):
+            lines.append(f'{prefix}_files{{outcome="{outcome}"}} {count}')
+        
+        lines.extend(self.metrics.prometheus_lines(prefix))
+        return "\n".join(lines) + "\n"
+    
     def __repr__(self) -> str:
         return (f"SyncResult(created={self.files_created}, "
                 f"updated={self.files_updated}, "
@@ -0,0 +1,82 @@
+"""
+Sync state data model
+Persisted high-water mark for incremental syncs
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SyncState:
+    """State carried between sync runs"""
+    last_timestamp: int = 0  # Unix timestamp of the newest synced submission
+    last_submission_id: int = 0
+    problem_versions: Dict[str, int] = field(default_factory=dict)  # slug -> files synced
+    updated_at: Optional[str] = None
+    
+    @property
+    def mark(self) -> Optional[Tuple[int, int]]:
+        """Get the (timestamp, submission ID) high-water mark, or None before the first run"""
+        if not self.last_timestamp:
+            return None
+        return (self.last_timestamp, self.last_submission_id)
+    
+    def advance(self, timestamp: int, submission_id: int):
+        """Move the high-water mark forward (never backward)"""
+        if (timestamp, submission_id) > (self.last_timestamp, self.last_submission_id):
+            self.last_timestamp = timestamp
+            self.last_submission_id = submission_id
+    
+    @classmethod
+    def load(cls, path: str) -> "SyncState":
+        """
+        Load state from a JSON file
+        
+        Args:
+            path: State file path
+        
+        Returns:
+            SyncState (empty if the file is missing or unreadable)
+        """
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            return cls(
+                last_timestamp=int(data.get("last_timestamp", 0)),
+                last_submission_id=int(data.get("last_submission_id", 0)),
+                problem_versions=dict(data.get("problem_versions", {})),
+                updated_at=data.get("updated_at")
+            )
+        except FileNotFoundError:
+            return cls()
+        except Exception as e:
+            logger.warning(f"Could not read sync state {path}: {str(e)} - starting fresh")
+            return cls()
+    
+    def save(self, path: str):
+        """
+        Save state to a JSON file atomically
+        
+        Args:
+            path: State file path
+        """
+        self.updated_at = datetime.now().isoformat(timespec="seconds")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                "last_timestamp": self.last_timestamp,
+                "last_submission_id": self.last_submission_id,
+                "problem_versions": self.problem_versions,
+                "updated_at": self.updated_at
+            }, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
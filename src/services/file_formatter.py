@@ -2,15 +2,77 @@
 File formatter service
 Formats solution files with metadata
 """
+import hashlib
+import time
+from functools import lru_cache
 from typing import Optional
 from src.models.submission import Submission
 from src.config.constants import FILE_HEADER_TEMPLATE, SQL_COMMENT_TEMPLATE
 from src.utils.helpers import format_tags, format_runtime, format_memory
 
+SQL_LANGUAGES = ('mysql', 'mssql', 'oraclesql', 'postgresql')
+
+
+@lru_cache(maxsize=None)
+def _fingerprint(template: str) -> str:
+    """Short hash identifying a template's text"""
+    return hashlib.sha1(template.encode("utf-8")).hexdigest()[:16]
+
 
 class FileFormatter:
     """Formats solution files with metadata"""
     
+    @staticmethod
+    def is_sql(submission: Submission) -> bool:
+        """Check if a submission is rendered with the SQL comment template"""
+        return submission.language.lower() in SQL_LANGUAGES
+    
+    @staticmethod
+    def template_fingerprint(submission: Submission) -> str:
+        """
+        Fingerprint of the template a submission is rendered with
+        
+        Changes whenever that template's text changes, so cached renders
+        made with an older template no longer match.
+        
+        Args:
+            submission: Submission object
+            
+        Returns:
+            Hex fingerprint
+        """
+        if FileFormatter.is_sql(submission):
+            return _fingerprint(SQL_COMMENT_TEMPLATE)
+        return _fingerprint(FILE_HEADER_TEMPLATE)
+    
+    @staticmethod
+    def render_fingerprint(submission: Submission) -> str:
+        """
+        Fingerprint of everything a rendered file depends on besides its
+        submission ID and version
+        
+        Covers the template, the problem fields shown in the header (which
+        change when LeetCode retitles or retags a problem) and the local
+        timezone the submission timestamp is formatted in.
+        
+        Args:
+            submission: Submission object
+            
+        Returns:
+            Hex fingerprint
+        """
+        problem = submission.problem
+        # Hashed directly: _fingerprint's cache is meant for the few templates
+        fields = "\0".join((
+            FileFormatter.template_fingerprint(submission),
+            problem.question_id,
+            problem.title,
+            problem.difficulty,
+            format_tags(problem.tags),
+            f"{time.tzname}{time.timezone}{time.altzone}"
+        ))
+        return hashlib.sha1(fields.encode("utf-8")).hexdigest()[:16]
+    
     @staticmethod
     def format_solution_file(submission: Submission, version: Optional[int] = None) -> str:
         """
@@ -31,9 +93,7 @@ class FileFormatter:
             version_info = f" * - Version: {version}\n"
         
         # Choose template based on language
-        is_sql = submission.language.lower() in ['mysql', 'mssql', 'oraclesql', 'postgresql']
-        
-        if is_sql:
+        if FileFormatter.is_sql(submission):
             header = SQL_COMMENT_TEMPLATE.format(
                 problem_id=problem.question_id,
                 title=problem.title,
@@ -87,3 +147,28 @@ class FileFormatter:
                 section += f"| {prob['id']} | [{prob['title']}]({prob['url']}) | {prob['difficulty']} | {prob['solutions']} |\n"
         
         return section
+
+    @staticmethod
+    def format_folder_index(folder: str, problems: list) -> str:
+        """
+        Format the README index of a solutions folder
+        
+        Args:
+            folder: Folder name
+            problems: List of problem dicts (id, title, url, difficulty, files)
+            
+        Returns:
+            Formatted folder index
+        """
+        index = f"# {folder}\n\n"
+        index += f"**Total Problems:** {len(problems)}\n\n"
+        
+        if problems:
+            index += "| # | Problem | Difficulty | Solutions |\n"
+            index += "|---|---------|------------|-----------|\n"
+            
+            for prob in problems:
+                files = ", ".join(f"[{name}]({name})" for name in prob['files'])
+                index += f"| {prob['id']} | [{prob['title']}]({prob['url']}) | {prob['difficulty']} | {files} |\n"
+        
+        return index
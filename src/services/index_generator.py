@@ -0,0 +1,107 @@
+"""
+Index generator service
+Builds the repository README and per-folder indexes from the sync manifest
+"""
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from src.config.constants import README_HEADER, README_FILE
+from src.models.sync_manifest import ManifestProblem, SyncManifest
+from src.services.file_formatter import FileFormatter
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class IndexGenerator:
+    """
+    Generates README.md and <folder>/README.md from a SyncManifest
+    
+    Only folders pending in the manifest are re-rendered; the README reuses
+    the cached sections of all other folders, so the work per run follows
+    the number of changed folders rather than the size of the repository.
+    """
+    
+    def __init__(self, formatter: FileFormatter):
+        """
+        Initialize generator
+        
+        Args:
+            formatter: Formatter used for README sections and folder indexes
+        """
+        self.formatter = formatter
+    
+    @staticmethod
+    def _sort_key(problem: ManifestProblem) -> Tuple[int, str]:
+        """Order problems by LeetCode number, then slug"""
+        number = int(problem.question_id) if problem.question_id.isdigit() else 0
+        return number, problem.title_slug
+    
+    def build(self, manifest: SyncManifest) -> List[Tuple[str, str]]:
+        """
+        Render the indexes of pending folders and the README
+        
+        Rendered sections are stored in the manifest; clear pending folders
+        with mark_written() once the returned files are written.
+        
+        Args:
+            manifest: Sync manifest
+        
+        Returns:
+            List of (file_path, content) tuples; empty if nothing changed
+        """
+        if not manifest.pending_folders:
+            return []
+        
+        files = []
+        for folder in sorted(manifest.pending_folders):
+            problems = sorted(manifest.problems_in(folder), key=self._sort_key)
+            if not problems:
+                # The folder emptied (its problems were retagged elsewhere). Storage
+                # backends cannot delete files, so its index is rewritten as empty
+                # instead of keeping stale counts, and it leaves the README.
+                manifest.sections.pop(folder, None)
+                files.append((f"{folder}/{README_FILE}", self.formatter.format_folder_index(folder, [])))
+                continue
+            
+            rows = [self._row(problem) for problem in problems]
+            manifest.sections[folder] = self.formatter.format_readme_section(folder, rows, {})
+            
+            for row, problem in zip(rows, problems):
+                row["files"] = [path.rsplit("/", 1)[-1] for path in problem.paths]
+            files.append((f"{folder}/{README_FILE}", self.formatter.format_folder_index(folder, rows)))
+        
+        files.append((README_FILE, self._readme(manifest)))
+        logger.info(f"Rebuilt {len(files) - 1} folder indexes and the README")
+        return files
+    
+    @staticmethod
+    def mark_written(manifest: SyncManifest):
+        """Clear the pending folders after their indexes were written"""
+        manifest.pending_folders.clear()
+    
+    @staticmethod
+    def _row(problem: ManifestProblem) -> Dict:
+        """Table row of a problem, as expected by FileFormatter"""
+        return {
+            "id": problem.question_id,
+            "title": problem.title,
+            "url": problem.url,
+            "difficulty": problem.difficulty,
+            "solutions": problem.solutions
+        }
+    
+    def _readme(self, manifest: SyncManifest) -> str:
+        """Assemble the README from the statistics and the cached sections"""
+        difficulties = {"easy": 0, "medium": 0, "hard": 0}
+        for problem in manifest.problems.values():
+            key = problem.difficulty.lower()
+            if key in difficulties:
+                difficulties[key] += 1
+        
+        header = README_HEADER.format(
+            total=len(manifest.problems),
+            date=datetime.now().strftime("%Y-%m-%d"),
+            **difficulties
+        )
+        return header + "".join(manifest.sections[folder] for folder in sorted(manifest.sections))
@@ -0,0 +1,182 @@
+"""
+Multi-account runner
+Syncs several LeetCode accounts to their repositories in one process
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from github import Github
+from requests.adapters import HTTPAdapter
+
+from src.config.constants import PROBLEM_CACHE_FILE
+from src.config.enums import StorageBackend, SyncMode
+from src.config.settings import Settings
+from src.core.problem_cache import ProblemCache
+from src.models.sync_result import SyncResult
+from src.services.sync_service import SyncService
+from src.utils.logger import get_logger
+from src.utils.profiler import RunProfiler
+from src.utils.rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+
+class MultiAccountRunner:
+    """
+    Sync several accounts concurrently, at most max_concurrent at a time
+    
+    Each account gets its own SyncService, LeetCode session cookie, state
+    folder and submission caches (see Settings.for_account). What does not
+    depend on the account is shared:
+        - problem metadata, which is the same for every user
+        - the LeetCode connection pool
+        - the LeetCode rate limiter, since LeetCode limits per client
+          address (unless multi_account.share_rate_limit is false)
+        - one PyGithub client per token, so repositories pushed with the
+          same token share its connection and its pause between writes
+    Services are kept, so calling run() again reuses warm connections and caches.
+    """
+    
+    def __init__(self, settings: Settings, accounts: Optional[List[Dict[str, Any]]] = None,
+                 max_concurrent: Optional[int] = None):
+        """
+        Initialize runner
+        
+        Args:
+            settings: Base settings the accounts are derived from
+            accounts: Entries of the accounts list (None = use config)
+            max_concurrent: Accounts synced at the same time (None = use config)
+        
+        Raises:
+            ValueError: If there are no accounts, or a name is invalid or repeated
+        """
+        self.settings = settings
+        entries = accounts if accounts is not None else settings.accounts
+        if not entries:
+            raise ValueError("No accounts configured")
+        
+        self.accounts: Dict[str, Settings] = {}
+        for entry in entries:
+            account_settings = settings.for_account(entry)
+            if account_settings.account_name in self.accounts:
+                raise ValueError(f"Duplicate account name: {account_settings.account_name}")
+            self.accounts[account_settings.account_name] = account_settings
+        
+        concurrent = max_concurrent if max_concurrent is not None else settings.max_concurrent_accounts
+        self.max_concurrent = max(1, min(concurrent, len(self.accounts)))
+        
+        problem_cache_path = None
+        if settings.cache_enabled and settings.problem_cache_on_disk:
+            problem_cache_path = f"{settings.cache_dir}/{PROBLEM_CACHE_FILE}"
+        self.problem_cache = ProblemCache(
+            max_entries=settings.problem_cache_max_entries,
+            path=problem_cache_path
+        )
+        
+        self.rate_limiter = None
+        if settings.share_rate_limit:
+            self.rate_limiter = RateLimiter(
+                requests=settings.rate_limit_requests,
+                period=settings.rate_limit_period
+            )
+        
+        # Enough connections for every detail worker of every running account
+        self.http_adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.max_concurrent * max(1, settings.detail_workers)
+        )
+        
+        self.services: Dict[str, SyncService] = {}
+        self._githubs: Dict[Tuple[str, str, bool], Github] = {}
+        self._lock = threading.Lock()
+    
+    def _github_for(self, settings: Settings) -> Optional[Github]:
+        """Get the PyGithub client shared by every account pushing with the same token"""
+        if settings.storage_backend != StorageBackend.GITHUB:
+            return None
+        
+        key = (settings.github_token, settings.github_api_url, settings.github_throttle)
+        with self._lock:
+            github = self._githubs.get(key)
+            if github is None:
+                if settings.github_throttle:
+                    github = Github(settings.github_token, base_url=settings.github_api_url)
+                else:
+                    github = Github(settings.github_token, base_url=settings.github_api_url,
+                                    seconds_between_requests=None, seconds_between_writes=None)
+                self._githubs[key] = github
+            return github
+    
+    def service(self, name: str) -> SyncService:
+        """
+        Get the sync service of an account, creating it on first use
+        
+        Args:
+            name: Account name
+        
+        Returns:
+            SyncService of the account
+        """
+        with self._lock:
+            service = self.services.get(name)
+        if service is not None:
+            return service
+        
+        settings = self.accounts[name]
+        service = SyncService(
+            settings,
+            problem_cache=self.problem_cache,
+            rate_limiter=self.rate_limiter,
+            http_adapter=self.http_adapter,
+            github=self._github_for(settings)
+        )
+        with self._lock:
+            return self.services.setdefault(name, service)
+    
+    def _sync_account(self, name: str, days_back: Optional[int], mode: Optional[SyncMode]) -> SyncResult:
+        """Sync one account; failures end up in its result instead of raising"""
+        logger.info(f"[{name}] Starting sync")
+        try:
+            result = self.service(name).sync(days_back=days_back, mode=mode, profile=False)
+        except Exception as e:
+            logger.error(f"[{name}] Sync failed: {str(e)}")
+            result = SyncResult()
+            result.add_error(f"Sync failed: {str(e)}")
+            result.finish()
+        
+        logger.info(f"[{name}] Finished in {result.duration:.2f}s: {result.files_created} created, "
+                    f"{result.files_updated} updated, {len(result.errors)} errors")
+        return result
+    
+    def run(self, days_back: Optional[int] = None, mode: Optional[SyncMode] = None,
+            profile: bool = False) -> Dict[str, SyncResult]:
+        """
+        Sync every account
+        
+        Args:
+            days_back: Window of each sync (None = each account's config)
+            mode: Mode of each sync (None = each account's config)
+            profile: Profile the whole run; accounts are not profiled one by
+                     one, since their syncs overlap
+        
+        Returns:
+            Result of each account, by name, in configuration order
+        """
+        logger.info(f"Syncing {len(self.accounts)} accounts, {self.max_concurrent} at a time")
+        
+        profiler = None
+        if profile:
+            profiler = RunProfiler(self.settings.profile_directory)
+            profiler.start()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="account") as pool:
+                futures = {name: pool.submit(self._sync_account, name, days_back, mode) for name in self.accounts}
+                results = {name: future.result() for name, future in futures.items()}
+        finally:
+            profile_directory = profiler.stop() if profiler is not None else None
+        
+        for result in results.values():
+            result.profile_directory = profile_directory
+        return results
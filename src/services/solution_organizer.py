@@ -2,9 +2,10 @@
 Solution organizer service
 Organizes submissions by tags and handles multiple versions
 """
-from typing import List, Dict, Tuple
+from typing import List, Dict, FrozenSet, Tuple, Optional
 from collections import defaultdict
 
+from src.models.problem import Problem
 from src.models.submission import Submission
 from src.utils.helpers import slug_to_filename
 from src.utils.logger import get_logger
@@ -13,7 +14,13 @@ logger = get_logger(__name__)
 
 
 class SolutionOrganizer:
-    """Organizes solutions by tags and manages versions"""
+    """
+    Organizes solutions by tags and manages versions
+    
+    Tag lookups are case-insensitive. The lowercase active tag set and the
+    tag -> folder index are built once here, so filtering and placing a
+    submission cost one lookup per problem tag however many mappings exist.
+    """
     
     def __init__(self, tag_mappings: Dict[str, str], active_tags: List[str]):
         """
@@ -24,7 +31,14 @@ class SolutionOrganizer:
             active_tags: List of tags to sync
         """
         self.tag_mappings = tag_mappings
-        self.active_tags = [tag.lower() for tag in active_tags]
+        self.active_tags: FrozenSet[str] = frozenset(tag.lower() for tag in active_tags)
+        
+        # Lowercase active tag -> folder; the first mapping wins when keys differ only by case
+        self._folders: Dict[str, str] = {}
+        for map_tag, folder_name in tag_mappings.items():
+            tag_lower = map_tag.lower()
+            if tag_lower in self.active_tags:
+                self._folders.setdefault(tag_lower, folder_name)
     
     def filter_by_tags(self, submissions: List[Submission]) -> List[Submission]:
         """
@@ -36,18 +50,29 @@ class SolutionOrganizer:
         Returns:
             Filtered list of submissions
         """
-        filtered = []
-        
-        for submission in submissions:
-            problem_tags = [tag.lower() for tag in submission.problem.tags]
-            
-            # Check if problem has any active tags
-            if any(tag in problem_tags for tag in self.active_tags):
-                filtered.append(submission)
+        filtered = [submission for submission in submissions if self.matches_active_tags(submission)]
         
         logger.info(f"Filtered {len(filtered)} submissions matching active tags")
         return filtered
     
+    def matches_active_tags(self, submission: Submission) -> bool:
+        """
+        Check if a submission's problem has any active tag
+        
+        Args:
+            submission: Submission object
+            
+        Returns:
+            True if the submission should be synced
+        """
+        problem = submission.problem
+        
+        # Compact problems carry a precomputed lowercase tag set
+        tag_set = getattr(problem, "tag_set", None)
+        if tag_set is not None:
+            return not self.active_tags.isdisjoint(tag_set)
+        return any(tag.lower() in self.active_tags for tag in problem.tags)
+    
     def get_folder_for_submission(self, submission: Submission) -> str:
         """
         Get target folder for a submission based on tags
@@ -58,18 +83,23 @@ class SolutionOrganizer:
         Returns:
             Folder name
         """
-        problem_tags = submission.problem.tags
+        return self.get_folder_for_problem(submission.problem)
+    
+    def get_folder_for_problem(self, problem: Problem) -> str:
+        """
+        Get target folder for a problem based on tags
         
-        # Find first matching tag
-        for tag in problem_tags:
-            tag_lower = tag.lower()
+        Args:
+            problem: Problem object
             
-            # Check if this tag is active
-            if tag_lower in self.active_tags:
-                # Get folder mapping
-                for map_tag, folder_name in self.tag_mappings.items():
-                    if map_tag.lower() == tag_lower:
-                        return folder_name
+        Returns:
+            Folder name
+        """
+        # First tag that is active and mapped to a folder
+        for tag in problem.tags:
+            folder_name = self._folders.get(tag.lower())
+            if folder_name is not None:
+                return folder_name
         
         # Default folder if no match
         return "Others"
@@ -96,36 +126,101 @@ class SolutionOrganizer:
         
         return dict(grouped)
     
-    def organize_files(self, submissions: List[Submission]) -> List[Tuple[str, Submission, int]]:
+    def assign_versions(self, entries: List[Tuple[str, int]],
+                        existing_versions: Optional[Dict[str, int]] = None) -> List[int]:
+        """
+        Assign version numbers from problem slugs and timestamps alone
+        
+        Versions count up from the oldest submission of each problem. A
+        problem with a single submission gets version 0 (no number), unless
+        earlier runs already synced versions of it, in which case numbering
+        continues after them. Only slugs and timestamps are needed, so
+        versions can be assigned before submission details are fetched.
+        
+        Args:
+            entries: (problem slug, timestamp) per submission
+            existing_versions: Files already synced per problem slug by earlier runs
+            
+        Returns:
+            Version number per entry, in input order
+        """
+        existing_versions = existing_versions or {}
+        
+        by_slug = defaultdict(list)
+        for index, (slug, timestamp) in enumerate(entries):
+            by_slug[slug].append((timestamp, index))
+        
+        versions = [0] * len(entries)
+        for slug, items in by_slug.items():
+            # Stable sort, so ties keep input order (as in group_by_problem)
+            items.sort(key=lambda item: item[0])
+            already_synced = existing_versions.get(slug, 0)
+            
+            # If only one submission, no version number
+            if already_synced == 0 and len(items) == 1:
+                continue
+            
+            for version, (_, index) in enumerate(items, already_synced + 1):
+                versions[index] = version
+        
+        return versions
+    
+    def get_file_path(self, submission: Submission, version: int) -> str:
+        """
+        Get the repository path of a submission's file
+        
+        Args:
+            submission: Submission object
+            version: Version number (0 for single version)
+            
+        Returns:
+            File path, e.g. "Databases/two-sum_v2.sql"
+        """
+        folder = self.get_folder_for_submission(submission)
+        return f"{folder}/{self.get_filename(submission.problem.title_slug, version, submission.file_extension)}"
+    
+    def get_filename(self, slug: str, version: int, extension: str) -> str:
+        """
+        Get the filename for a problem slug
+        
+        Args:
+            slug: Problem slug (e.g., "two-sum")
+            version: Version number (0 for single version)
+            extension: File extension
+            
+        Returns:
+            Formatted filename
+        """
+        return slug_to_filename(slug, version, extension)
+    
+    def organize_files(self, submissions: List[Submission],
+                       existing_versions: Optional[Dict[str, int]] = None) -> List[Tuple[str, Submission, int]]:
         """
         Organize submissions into file paths with version numbers
         
         Args:
             submissions: List of submissions
+            existing_versions: Files already synced per problem slug by earlier
+                               runs; new versions are numbered after them
             
         Returns:
             List of tuples: (file_path, submission, version)
         """
+        versions = self.assign_versions(
+            [(sub.problem.title_slug, sub.timestamp) for sub in submissions],
+            existing_versions
+        )
+        version_of = {id(sub): version for sub, version in zip(submissions, versions)}
+        
         # Group by problem
         grouped = self.group_by_problem(submissions)
         
         file_list = []
         
         for slug, problem_submissions in grouped.items():
-            folder = self.get_folder_for_submission(problem_submissions[0])
-            
-            # If only one submission, no version number
-            if len(problem_submissions) == 1:
-                sub = problem_submissions[0]
-                filename = slug_to_filename(slug, 0, sub.file_extension)
-                file_path = f"{folder}/{filename}"
-                file_list.append((file_path, sub, 0))
-            else:
-                # Multiple submissions - add version numbers
-                for version, sub in enumerate(problem_submissions, 1):
-                    filename = slug_to_filename(slug, version, sub.file_extension)
-                    file_path = f"{folder}/{filename}"
-                    file_list.append((file_path, sub, version))
+            for sub in problem_submissions:
+                version = version_of[id(sub)]
+                file_list.append((self.get_file_path(sub, version), sub, version))
         
         logger.info(f"Organized {len(file_list)} files across {len(grouped)} problems")
         return file_list
@@ -0,0 +1,276 @@
+"""
+Pipelined sync
+Overlaps detail fetching, formatting and uploading through bounded queues
+"""
+import queue
+import threading
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from src.config.constants import (
+    COMMIT_MESSAGES,
+    DEFAULT_PIPELINE_QUEUE_SIZE,
+    MAX_DETAIL_WORKERS,
+    MAX_DETAIL_BATCH_SIZE
+)
+from src.config.enums import StorageBackend, UploadStatus
+from src.models.problem import Problem
+from src.models.sync_result import SyncResult
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.services.sync_service import SyncService
+
+logger = get_logger(__name__)
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+class SyncPipeline:
+    """
+    Streaming variant of SyncService's staged sync
+    
+    Stages run concurrently and hand items over through bounded queues:
+        
+        fetch details (N workers) -> filter, organize, format -> upload
+    
+    A full queue blocks the stage feeding it, so memory stays bounded and a
+    slow upload throttles fetching instead of buffering the whole history.
+    Version numbers depend on every submission of a problem, so they are
+    assigned up front from the submission summaries (slug and timestamp)
+    before any detail is fetched.
+    """
+    
+    def __init__(self, service: "SyncService", queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE):
+        """
+        Initialize pipeline
+        
+        Args:
+            service: Sync service whose clients, organizer and formatter are used
+            queue_size: Capacity of each queue between stages
+        """
+        self.service = service
+        self.settings = service.settings
+        self.queue_size = max(1, queue_size)
+        self._stop = threading.Event()
+        self._result_lock = threading.Lock()
+    
+    def run(self, result: SyncResult, days_back: int,
+            since_mark: Optional[Tuple[int, int]] = None,
+            existing_versions: Optional[Dict[str, int]] = None
+            ) -> Tuple[Optional[Tuple[int, int]], List[Tuple[str, int]]]:
+        """
+        Fetch, format and upload submissions with all stages overlapping
+        
+        Args:
+            result: Result to record outcomes in
+            days_back: Number of days to look back (0 = all time)
+            since_mark: Only sync submissions newer than this high-water mark
+            existing_versions: Files already synced per problem slug by earlier runs
+        
+        Returns:
+            (newest (timestamp, submission ID) seen, (slug, version) of each file written)
+        """
+        client = self.service.leetcode_client
+        incomplete: List[str] = []
+        with self.service.metrics.stage("summaries"):
+            history = client.iter_submission_history(self.settings.leetcode_username, days_back,
+                                                     incomplete=incomplete)
+            summaries = client.select_summaries(history, days_back, since_mark)
+        
+        # Recorded as errors so the incremental mark stays put and the next run retries them
+        for reason in incomplete:
+            result.mark_history_incomplete(reason)
+        
+        if not summaries:
+            return None, []
+        
+        newest = max((int(s["timestamp"]), int(s["id"])) for s in summaries)
+        versions = self.service.organizer.assign_versions(
+            [(s["titleSlug"], int(s["timestamp"])) for s in summaries],
+            existing_versions
+        )
+        version_by_id = {int(s["id"]): version for s, version in zip(summaries, versions)}
+        logger.info(f"✓ Found {len(summaries)} submissions - streaming through the pipeline")
+        
+        # Split the IDs into batches for the fetch workers
+        ids = list(version_by_id)
+        batch_size = max(1, min(self.settings.detail_batch_size, MAX_DETAIL_BATCH_SIZE))
+        batches: "queue.Queue[List[int]]" = queue.Queue()
+        for start in range(0, len(ids), batch_size):
+            batches.put(ids[start:start + batch_size])
+        
+        workers = max(1, min(self.settings.detail_workers, MAX_DETAIL_WORKERS, batches.qsize()))
+        fetched: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        rendered: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        
+        threads = [
+            threading.Thread(target=self._fetch_stage, args=(batches, fetched, result),
+                             name=f"pipeline-fetch-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        threads.append(threading.Thread(
+            target=self._format_stage, args=(fetched, rendered, workers, version_by_id, result),
+            name="pipeline-format", daemon=True
+        ))
+        
+        for thread in threads:
+            thread.start()
+        
+        written: List[Tuple[str, int]] = []
+        try:
+            with self.service.metrics.stage("upload"):
+                self._upload_stage(rendered, len(summaries), result, written)
+        finally:
+            # Unblock the other stages if the upload stage ended early
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        
+        return newest, written
+    
+    def _put(self, target: queue.Queue, item) -> bool:
+        """Put an item, waiting for space; False if the pipeline was stopped"""
+        with self.service.metrics.stage("queue_wait"):
+            while not self._stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+    
+    def _get(self, source: queue.Queue):
+        """Get an item, waiting for one; _DONE if the pipeline was stopped"""
+        with self.service.metrics.stage("queue_wait"):
+            while not self._stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _DONE
+    
+    def _add_error(self, result: SyncResult, message: str, skipped: bool = False):
+        """Record an error from a stage thread"""
+        with self._result_lock:
+            result.add_error(message)
+            if skipped:
+                result.files_skipped += 1
+    
+    def _fetch_stage(self, batches: queue.Queue, outbox: queue.Queue, result: SyncResult):
+        """Fetch submission details batch by batch"""
+        client = self.service.leetcode_client
+        try:
+            with self.service.metrics.stage("details"):
+                while not self._stop.is_set():
+                    try:
+                        batch = batches.get_nowait()
+                    except queue.Empty:
+                        break
+                    
+                    failed: List[int] = []
+                    for submission in client.get_submission_details(batch, len(batch), 1, failed):
+                        if not self._put(outbox, submission):
+                            return
+                    # Keeps the incremental mark in place, so the next run retries them
+                    for submission_id in failed:
+                        self._add_error(result, f"Submission {submission_id}: failed to fetch details")
+        except Exception as e:
+            logger.error(f"Detail fetch failed: {str(e)}")
+            self._add_error(result, f"Detail fetch failed: {str(e)}")
+        finally:
+            self._put(outbox, _DONE)
+    
+    def _format_stage(self, inbox: queue.Queue, outbox: queue.Queue, producers: int,
+                      version_by_id: Dict[int, int], result: SyncResult):
+        """Filter submissions, place them in the repository layout and render them"""
+        organizer = self.service.organizer
+        remaining = producers
+        
+        try:
+            with self.service.metrics.stage("organize"):
+                while remaining:
+                    submission = self._get(inbox)
+                    if submission is _DONE:
+                        if self._stop.is_set():
+                            return
+                        remaining -= 1
+                        continue
+                    
+                    with self._result_lock:
+                        result.total_submissions += 1
+                    
+                    if self.settings.only_accepted and not submission.is_accepted:
+                        continue
+                    if not organizer.matches_active_tags(submission):
+                        continue
+                    
+                    with self._result_lock:
+                        result.filtered_submissions += 1
+                    
+                    version = version_by_id[int(submission.id)]
+                    file_path = organizer.get_file_path(submission, version)
+                    try:
+                        content, blob_sha = self.service.render(submission, version)
+                    except Exception as e:
+                        logger.error(f"Error processing {file_path}: {str(e)}")
+                        self._add_error(result, f"{file_path}: {str(e)}", skipped=True)
+                        continue
+                    
+                    if not self._put(outbox, (file_path, content, blob_sha, submission, version)):
+                        return
+        finally:
+            self._put(outbox, _DONE)
+    
+    def _upload_stage(self, inbox: queue.Queue, submission_count: int,
+                      result: SyncResult, written: List[Tuple[str, int]]):
+        """Write rendered files to storage as they arrive (runs on the calling thread)"""
+        service = self.service
+        storage = service.storage
+        branch = self.settings.github_branch
+        
+        # Only metadata is kept per file, not the code
+        uploaded: Dict[str, Tuple[Problem, str, int]] = {}
+        blob_shas: Dict[str, str] = {}
+        unchanged: Dict[str, UploadStatus] = {}
+        
+        def files() -> Iterator[Tuple[str, str]]:
+            while True:
+                item = self._get(inbox)
+                if item is _DONE:
+                    return
+                file_path, content, blob_sha, submission, version = item
+                uploaded[file_path] = (submission.problem, submission.id, version)
+                blob_shas[file_path] = blob_sha
+                if service.is_synced(submission.id, file_path, blob_sha):
+                    unchanged[file_path] = UploadStatus.UNCHANGED
+                    continue
+                yield file_path, content
+        
+        archive = self.settings.storage_backend in (StorageBackend.TAR, StorageBackend.ZIP)
+        if self.settings.batch_commit or archive:
+            statuses = service.commit_files_lazily(
+                files(),
+                COMMIT_MESSAGES["pipeline"].format(count=submission_count),
+                blob_shas
+            )
+        else:
+            statuses = {}
+            for file_path, content in files():
+                problem, _, version = uploaded[file_path]
+                statuses[file_path] = storage.upload_file(
+                    file_path=file_path,
+                    content=content,
+                    commit_message=service._file_commit_message(problem.title, version),
+                    branch=branch,
+                    blob_sha=blob_shas[file_path]
+                )
+        
+        statuses.update(unchanged)
+        for file_path, (problem, submission_id, version) in uploaded.items():
+            status = statuses.get(file_path)
+            if status is None:
+                continue
+            service._record_upload(result, file_path, problem, status,
+                                   submission_id, version, blob_shas[file_path])
+            written.append((problem.title_slug, version))
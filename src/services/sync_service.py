@@ -2,17 +2,47 @@
 Main sync service
 Orchestrates the sync process
 """
-from typing import List, Optional
+import itertools
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 
+from github import Github
+from requests.adapters import HTTPAdapter
+
 from src.core.leetcode_client import LeetCodeClient
 from src.core.github_client import GitHubClient
+from src.core.local_git_client import LocalGitClient
+from src.core.export_client import DirectoryExporter, TarExporter, ZipExporter
+from src.core.problem_cache import ProblemCache
+from src.core.render_cache import RenderCache
+from src.core.submission_cache import SubmissionCache
 from src.services.solution_organizer import SolutionOrganizer
 from src.services.file_formatter import FileFormatter
+from src.services.index_generator import IndexGenerator
+from src.services.sync_pipeline import SyncPipeline
+from src.models.problem import Problem
 from src.models.submission import Submission
 from src.models.sync_result import SyncResult
+from src.models.sync_manifest import SyncManifest
+from src.models.sync_state import SyncState
+from src.config.enums import SyncMode, StorageBackend, UploadStatus
 from src.config.settings import Settings
+from src.config.constants import (
+    SUBMISSION_CACHE_FILE,
+    PROBLEM_CACHE_FILE,
+    RENDER_CACHE_FILE,
+    MANIFEST_REPO_PATH,
+    COMMIT_MESSAGES
+)
+from src.utils.helpers import git_blob_sha
 from src.utils.logger import get_logger
+from src.utils.metrics import SyncMetrics
+from src.utils.profiler import RunProfiler
+from src.utils.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
@@ -20,26 +50,67 @@ logger = get_logger(__name__)
 class SyncService:
     """Main service for syncing LeetCode submissions to GitHub"""
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, problem_cache: Optional[ProblemCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None, http_adapter: Optional[HTTPAdapter] = None,
+                 github: Optional[Github] = None):
         """
         Initialize sync service
         
+        The optional arguments let several services (one per account, see
+        MultiAccountRunner) share problem metadata, LeetCode request pacing
+        and connection pools; each service builds its own by default.
+        
         Args:
             settings: Application settings
+            problem_cache: Problem metadata cache
+            rate_limiter: Limiter for LeetCode requests
+            http_adapter: Connection pool for LeetCode requests
+            github: PyGithub client for the github backend
         """
         self.settings = settings
+        self.github = github
+        
+        # Initialize caches
+        self.submission_cache = None
+        self.render_cache = None
+        if settings.cache_enabled:
+            self.submission_cache = SubmissionCache(
+                path=f"{settings.cache_dir}/{SUBMISSION_CACHE_FILE}",
+                max_entries=settings.submission_cache_max_entries,
+                bypass=settings.cache_bypass
+            )
+            self.render_cache = RenderCache(
+                path=f"{settings.cache_dir}/{RENDER_CACHE_FILE}",
+                max_entries=settings.render_cache_max_entries,
+                bypass=settings.cache_bypass
+            )
+        
+        if problem_cache is None:
+            problem_cache_path = None
+            if settings.cache_enabled and settings.problem_cache_on_disk:
+                problem_cache_path = f"{settings.cache_dir}/{PROBLEM_CACHE_FILE}"
+            problem_cache = ProblemCache(
+                max_entries=settings.problem_cache_max_entries,
+                path=problem_cache_path
+            )
+        self.problem_cache = problem_cache
         
         # Initialize clients
         self.leetcode_client = LeetCodeClient(
             session_cookie=settings.leetcode_session,
-            csrf_token=settings.leetcode_csrf
+            csrf_token=settings.leetcode_csrf,
+            rate_limiter=rate_limiter or RateLimiter(
+                requests=settings.rate_limit_requests,
+                period=settings.rate_limit_period
+            ),
+            cache=self.submission_cache,
+            problem_cache=self.problem_cache,
+            problem_fields=settings.problem_fields,
+            endpoint=settings.leetcode_api_endpoint,
+            adapter=http_adapter
         )
         
-        self.github_client = GitHubClient(
-            token=settings.github_token,
-            username=settings.github_username,
-            repository=settings.github_repository
-        )
+        self.storage = self._create_storage()
         
         # Initialize services
         self.organizer = SolutionOrganizer(
@@ -48,6 +119,58 @@ class SyncService:
         )
         
         self.formatter = FileFormatter()
+        self.index_generator = IndexGenerator(self.formatter)
+        self.manifest: Optional[SyncManifest] = None
+        self.metrics = SyncMetrics()  # Replaced by the metrics of each run
+    
+    @property
+    def github_client(self):
+        """
+        Deprecated alias of storage
+        
+        The client was renamed when backends other than GitHub were added,
+        since it can now be a local git client or an exporter.
+        """
+        warnings.warn("SyncService.github_client is deprecated, use SyncService.storage",
+                      DeprecationWarning, stacklevel=2)
+        return self.storage
+    
+    def _create_storage(self):
+        """
+        Create the client files are written through
+        
+        Returns:
+            GitHubClient, LocalGitClient or an exporter, per the storage backend setting
+        """
+        settings = self.settings
+        exporters = {
+            StorageBackend.DIRECTORY: DirectoryExporter,
+            StorageBackend.TAR: TarExporter,
+            StorageBackend.ZIP: ZipExporter
+        }
+        
+        if settings.storage_backend in exporters:
+            return exporters[settings.storage_backend](settings.export_path)
+        
+        if settings.storage_backend == StorageBackend.LOCAL_GIT:
+            remote = settings.git_remote or (
+                f"https://github.com/{settings.github_username}/{settings.github_repository}.git"
+            )
+            return LocalGitClient(
+                work_dir=settings.git_work_dir,
+                remote_url=remote,
+                branch=settings.github_branch,
+                token=settings.github_token
+            )
+        
+        return GitHubClient(
+            token=settings.github_token,
+            username=settings.github_username,
+            repository=settings.github_repository,
+            base_url=settings.github_api_url,
+            throttle=settings.github_throttle,
+            github=self.github
+        )
     
     def test_connections(self) -> bool:
         """
@@ -59,7 +182,7 @@ class SyncService:
         logger.info("Testing connections...")
         
         leetcode_ok = self.leetcode_client.test_connection()
-        github_ok = self.github_client.test_connection()
+        github_ok = self.storage.test_connection()
         
         if leetcode_ok and github_ok:
             logger.info("✓ All connections successful")
@@ -68,18 +191,40 @@ class SyncService:
             logger.error("✗ Connection test failed")
             return False
     
-    def sync(self, days_back: Optional[int] = None) -> SyncResult:
+    def sync(self, days_back: Optional[int] = None, mode: Optional[SyncMode] = None,
+             profile: Optional[bool] = None) -> SyncResult:
         """
         Main sync operation
         
         Args:
             days_back: Number of days to look back (None = use config)
+            mode: FULL re-syncs the whole window; INCREMENTAL only syncs
+                  submissions newer than the last successful run (None = use config)
+            profile: Profile CPU time and allocations of the run and write the
+                     reports under the profiling directory (None = use config)
             
         Returns:
             SyncResult object
         """
+        if profile is None:
+            profile = self.settings.profile_enabled
+        if not profile:
+            return self._sync(days_back, mode)
+        
+        profiler = RunProfiler(self.settings.profile_directory)
+        profiler.start()
+        try:
+            result = self._sync(days_back, mode)
+        finally:
+            profile_directory = profiler.stop()
+        result.profile_directory = profile_directory
+        return result
+    
+    def _sync(self, days_back: Optional[int], mode: Optional[SyncMode]) -> SyncResult:
+        """Run one sync (see sync)"""
         result = SyncResult()
         result.start_time = datetime.now()
+        self._attach_metrics(result.metrics)
         
         logger.info("=" * 60)
         logger.info("Starting LeetCode to GitHub sync...")
@@ -89,22 +234,149 @@ class SyncService:
             # Use provided days or config
             if days_back is None:
                 days_back = self.settings.days_to_look_back
+            if mode is None:
+                mode = self.settings.sync_mode
+            
+            # Archives are rewritten from scratch each run, so an incremental
+            # run would replace the backup with only the newest submissions
+            archive = self.settings.storage_backend in (StorageBackend.TAR, StorageBackend.ZIP)
+            if archive and mode == SyncMode.INCREMENTAL:
+                logger.warning("Archive exports are always full - ignoring incremental mode")
+                mode = SyncMode.FULL
+            
+            state = SyncState.load(self.settings.state_file)
+            since_mark = state.mark if mode == SyncMode.INCREMENTAL else None
+            if since_mark:
+                logger.info(f"Incremental sync: only submissions newer than {since_mark[1]}")
+            existing_versions = state.problem_versions if mode == SyncMode.INCREMENTAL else None
+            
+            # Archives get no manifest for the same reason. Later runs of a
+            # long-lived service (watch mode) reuse the one in memory.
+            if archive:
+                self.manifest = None
+            elif self.manifest is None:
+                self.manifest = self._load_manifest()
             
-            # Fetch submissions
             logger.info(f"Fetching submissions from last {days_back} days...")
-            submissions = self.leetcode_client.get_submissions_by_date_range(
-                username=self.settings.leetcode_username,
-                days_back=days_back
-            )
+            if self.settings.pipelined:
+                pipeline = SyncPipeline(self, self.settings.pipeline_queue_size)
+                newest, written = pipeline.run(result, days_back, since_mark, existing_versions)
+            else:
+                newest, written = self._sync_staged(result, days_back, since_mark, existing_versions)
             
-            result.total_submissions = len(submissions)
-            logger.info(f"✓ Found {len(submissions)} total submissions")
+            with self.metrics.stage("manifest"):
+                if self.render_cache is not None:
+                    self.render_cache.flush()
+                
+                self._save_manifest(result)
             
-            if not submissions:
+            if newest is None:
                 logger.warning("No submissions found")
-                result.finish()
+                self._finish(result)
                 return result
             
+            with self.metrics.stage("state"):
+                self._save_state(state, newest, written, result)
+            
+            # Summary
+            logger.info("=" * 60)
+            logger.info("Sync completed!")
+            logger.info(f"✓ Files created: {result.files_created}")
+            logger.info(f"✓ Files updated: {result.files_updated}")
+            logger.info(f"  Skipped (unchanged or failed): {result.files_skipped}")
+            logger.info(f"  Errors: {len(result.errors)}")
+            logger.info(f"✓ Repository: {self.storage.get_repository_url()}")
+            logger.info("=" * 60)
+            
+        except Exception as e:
+            logger.error(f"Sync failed: {str(e)}")
+            result.add_error(f"Sync failed: {str(e)}")
+        
+        self._finish(result)
+        return result
+    
+    def _attach_metrics(self, metrics: SyncMetrics):
+        """Record the requests and stages of the clients in a run's metrics"""
+        self.metrics = metrics
+        self.leetcode_client.metrics = metrics
+        if isinstance(self.storage, GitHubClient):
+            self.storage.metrics = metrics
+    
+    def _finish(self, result: SyncResult):
+        """
+        Mark the run finished, log where the time went and export its metrics
+        
+        Args:
+            result: Result of this run
+        """
+        result.finish()
+        
+        stages = sorted(result.metrics.stages.items(), key=lambda item: item[1], reverse=True)
+        if stages:
+            logger.info("Stage times: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in stages))
+        
+        exports = [
+            (self.settings.metrics_json_file, lambda: json.dumps(result.to_dict(), indent=2)),
+            (self.settings.metrics_prometheus_file, result.to_prometheus)
+        ]
+        for path, render in exports:
+            if not path:
+                continue
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                # Replaced atomically so collectors never read a partial file
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    f.write(render())
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.error(f"Failed to write metrics to {path}: {str(e)}")
+    
+    def _sync_staged(self, result: SyncResult, days_back: int,
+                     since_mark: Optional[Tuple[int, int]],
+                     existing_versions: Optional[Dict[str, int]]
+                     ) -> Tuple[Optional[Tuple[int, int]], List[Tuple[str, int]]]:
+        """
+        Fetch everything, then filter, organize and upload, one stage at a time
+        
+        Args:
+            result: Result to record outcomes in
+            days_back: Number of days to look back
+            since_mark: Only sync submissions newer than this high-water mark
+            existing_versions: Files already synced per problem slug by earlier runs
+            
+        Returns:
+            (newest (timestamp, submission ID) fetched, (slug, version) of each organized file)
+        """
+        # Fetch submissions
+        failed: List[int] = []
+        incomplete: List[str] = []
+        submissions = self.leetcode_client.get_submissions_by_date_range(
+            username=self.settings.leetcode_username,
+            days_back=days_back,
+            max_workers=self.settings.detail_workers,
+            batch_size=self.settings.detail_batch_size,
+            since_mark=since_mark,
+            failed=failed,
+            incomplete=incomplete
+        )
+        
+        # Recorded as errors so the incremental mark stays put and the next run retries them
+        for submission_id in failed:
+            result.add_error(f"Submission {submission_id}: failed to fetch details")
+        for reason in incomplete:
+            result.mark_history_incomplete(reason)
+        
+        result.total_submissions = len(submissions)
+        logger.info(f"✓ Found {len(submissions)} total submissions")
+        
+        # Newest submission seen this run; becomes the mark if the run succeeds
+        newest = max(((s.timestamp, int(s.id)) for s in submissions), default=None)
+        
+        if not submissions:
+            return newest, []
+        
+        with self.metrics.stage("organize"):
             # Filter by status (accepted only)
             if self.settings.only_accepted:
                 submissions = [s for s in submissions if s.is_accepted]
@@ -116,8 +388,7 @@ class SyncService:
             
             if not submissions:
                 logger.warning("No submissions match the active tags")
-                result.finish()
-                return result
+                return newest, []
             
             # Get statistics
             stats = self.organizer.get_statistics(submissions)
@@ -125,67 +396,341 @@ class SyncService:
             logger.info(f"  Easy: {stats['easy']} | Medium: {stats['medium']} | Hard: {stats['hard']}")
             
             # Organize into files
-            file_list = self.organizer.organize_files(submissions)
+            file_list = self.organizer.organize_files(submissions, existing_versions)
             logger.info(f"✓ Organized into {len(file_list)} files")
-            
-            # Check for multiple versions
-            multi_version_problems = sum(1 for _, _, version in file_list if version > 1)
-            if multi_version_problems > 0:
-                logger.info(f"ℹ  Found {multi_version_problems} problems with multiple solutions")
-            
-            # Upload to GitHub
-            logger.info("Uploading to GitHub...")
-            
-            for file_path, submission, version in file_list:
-                try:
-                    # Format file content
-                    content = self.formatter.format_solution_file(
-                        submission,
-                        version if version > 0 else None
-                    )
-                    
-                    # Create commit message
-                    if version > 0:
-                        commit_msg = f"Add: {submission.problem.title} (v{version})"
-                    else:
-                        commit_msg = f"Add: {submission.problem.title}"
-                    
-                    # Upload file
-                    success = self.github_client.create_or_update_file(
+        
+        # Check for multiple versions
+        multi_version_problems = sum(1 for _, _, version in file_list if version > 1)
+        if multi_version_problems > 0:
+            logger.info(f"ℹ  Found {multi_version_problems} problems with multiple solutions")
+        
+        # Upload to GitHub
+        logger.info("Uploading to GitHub...")
+        
+        # Archives are written in one pass, so they always take the batch path
+        archive = self.settings.storage_backend in (StorageBackend.TAR, StorageBackend.ZIP)
+        with self.metrics.stage("upload"):
+            if self.settings.batch_commit or archive:
+                self._upload_batch(file_list, result)
+            else:
+                self._upload_each(file_list, result)
+        
+        return newest, [(submission.problem.title_slug, version) for _, submission, version in file_list]
+    
+    def _upload_each(self, file_list: List[Tuple[str, Submission, int]], result: SyncResult):
+        """
+        Upload files one commit at a time through the Contents API
+        
+        Args:
+            file_list: Organized files as (file_path, submission, version)
+            result: Result to record outcomes in
+        """
+        for file_path, submission, version in file_list:
+            try:
+                # Format file content
+                content, blob_sha = self.render(submission, version)
+                
+                # Upload file unless the manifest says it is already there
+                if self.is_synced(submission.id, file_path, blob_sha):
+                    status = UploadStatus.UNCHANGED
+                else:
+                    status = self.storage.upload_file(
                         file_path=file_path,
                         content=content,
-                        commit_message=commit_msg,
-                        branch=self.settings.github_branch
+                        commit_message=self._file_commit_message(submission.problem.title, version),
+                        branch=self.settings.github_branch,
+                        blob_sha=blob_sha
                     )
-                    
-                    if success:
-                        result.files_created += 1
-                        result.add_synced_problem(submission.problem.title)
-                        
-                        # Track by tag
-                        folder = self.organizer.get_folder_for_submission(submission)
-                        result.increment_tag_count(folder)
-                    else:
-                        result.files_skipped += 1
-                        result.add_error(f"Failed to upload: {file_path}")
                 
-                except Exception as e:
-                    logger.error(f"Error processing {file_path}: {str(e)}")
-                    result.add_error(f"{file_path}: {str(e)}")
-                    result.files_skipped += 1
+                self._record_upload(result, file_path, submission.problem, status,
+                                    submission.id, version, blob_sha)
             
-            # Summary
-            logger.info("=" * 60)
-            logger.info("Sync completed!")
-            logger.info(f"✓ Files created/updated: {result.files_created}")
-            logger.info(f"  Skipped: {result.files_skipped}")
-            logger.info(f"  Errors: {len(result.errors)}")
-            logger.info(f"✓ Repository: {self.github_client.get_repository_url()}")
-            logger.info("=" * 60)
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {str(e)}")
+                result.add_error(f"{file_path}: {str(e)}")
+                result.files_skipped += 1
+    
+    def _upload_batch(self, file_list: List[Tuple[str, Submission, int]], result: SyncResult):
+        """
+        Write all files in a single commit (or a single export pass)
+        
+        Files are rendered lazily as the storage backend consumes them, so
+        only one rendered file needs to be held at a time.
+        
+        Args:
+            file_list: Organized files as (file_path, submission, version)
+            result: Result to record outcomes in
+        """
+        if not file_list:
+            return
+        
+        folders = {self.organizer.get_folder_for_submission(submission) for _, submission, _ in file_list}
+        commit_msg = COMMIT_MESSAGES["bulk"].format(count=len(file_list), tag_count=len(folders))
+        
+        blob_shas: Dict[str, str] = {}
+        unchanged: Set[str] = set()
+        statuses = self.commit_files_lazily(
+            self._render_files(file_list, result, blob_shas, unchanged),
+            commit_msg,
+            blob_shas
+        )
+        statuses.update((file_path, UploadStatus.UNCHANGED) for file_path in unchanged)
+        
+        for file_path, submission, version in file_list:
+            if file_path in statuses:
+                self._record_upload(result, file_path, submission.problem, statuses[file_path],
+                                    submission.id, version, blob_shas.get(file_path))
+    
+    def commit_files_lazily(self, files: Iterator[Tuple[str, str]], commit_message: str,
+                            blob_shas: Dict[str, str]) -> Dict[str, UploadStatus]:
+        """
+        Commit files from an iterator, without contacting storage if it yields none
+        
+        Args:
+            files: Iterator of (file_path, content) tuples
+            commit_message: Commit message
+            blob_shas: Git blob SHAs by path, filled while files is consumed
             
-        except Exception as e:
-            logger.error(f"Sync failed: {str(e)}")
-            result.add_error(f"Sync failed: {str(e)}")
+        Returns:
+            Dictionary of file path to UploadStatus
+        """
+        first = next(files, None)
+        if first is None:
+            return {}
         
-        result.finish()
-        return result
+        return self.storage.commit_files(
+            itertools.chain([first], files),
+            commit_message=commit_message,
+            branch=self.settings.github_branch,
+            max_workers=self.settings.upload_workers,
+            blob_shas=blob_shas
+        )
+        
+    def is_synced(self, submission_id: str, file_path: str, blob_sha: str) -> bool:
+        """
+        Check the manifest for a file already in the repository with this content
+        
+        Bypassing the cache also bypasses this check, so every file is compared
+        against the storage backend again.
+        
+        Args:
+            submission_id: Submission ID
+            file_path: Path the file would be written to
+            blob_sha: Git blob SHA of the rendered content
+            
+        Returns:
+            True if the file can be skipped without contacting storage
+        """
+        if self.manifest is None or self.settings.cache_bypass:
+            return False
+        return self.manifest.is_synced(submission_id, file_path, blob_sha)
+    
+    def render(self, submission: Submission, version: int) -> Tuple[str, str]:
+        """
+        Render a solution file, reusing the render cache when possible
+        
+        Args:
+            submission: Submission object
+            version: Version number (0 for single version)
+            
+        Returns:
+            (content, git blob SHA of content)
+        """
+        with self.metrics.stage("render"):
+            fingerprint = self.formatter.render_fingerprint(submission)
+            if self.render_cache is not None:
+                cached = self.render_cache.get(int(submission.id), version, fingerprint)
+                if cached:
+                    return cached
+            
+            content = self.formatter.format_solution_file(submission, version if version > 0 else None)
+            blob_sha = git_blob_sha(content)
+            
+            if self.render_cache is not None:
+                self.render_cache.put(int(submission.id), version, fingerprint, content, blob_sha)
+            return content, blob_sha
+    
+    def _render_files(self, file_list: List[Tuple[str, Submission, int]],
+                      result: SyncResult,
+                      blob_shas: Optional[Dict[str, str]] = None,
+                      unchanged: Optional[Set[str]] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Render organized files one at a time
+        
+        Files that fail to render are recorded in the result and skipped.
+        
+        Args:
+            file_list: Organized files as (file_path, submission, version)
+            result: Result to record render errors in
+            blob_shas: Filled with the git blob SHA of each file before it is yielded
+            unchanged: If given, files the manifest shows as synced are added
+                       here instead of being yielded
+            
+        Yields:
+            (file_path, content) tuples
+        """
+        for file_path, submission, version in file_list:
+            try:
+                content, blob_sha = self.render(submission, version)
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {str(e)}")
+                result.add_error(f"{file_path}: {str(e)}")
+                result.files_skipped += 1
+                continue
+            
+            if blob_shas is not None:
+                blob_shas[file_path] = blob_sha
+            if unchanged is not None and self.is_synced(submission.id, file_path, blob_sha):
+                unchanged.add(file_path)
+                continue
+            yield file_path, content
+    
+    @staticmethod
+    def _file_commit_message(problem_title: str, version: int) -> str:
+        """Commit message for a file uploaded on its own"""
+        if version > 0:
+            return f"Add: {problem_title} (v{version})"
+        return f"Add: {problem_title}"
+    
+    def _record_upload(self, result: SyncResult, file_path: str,
+                       problem: Problem, status: UploadStatus,
+                       submission_id: Optional[str] = None, version: int = 0,
+                       blob_sha: Optional[str] = None):
+        """
+        Record the outcome of writing one file
+        
+        Args:
+            result: Result to update
+            file_path: Path of the file in the repository
+            problem: Problem the file's submission solves
+            status: Upload outcome
+            submission_id: Submission the file was rendered from (recorded in the manifest)
+            version: Version number of the file
+            blob_sha: Git blob SHA of the file content
+        """
+        if status == UploadStatus.FAILED:
+            result.files_skipped += 1
+            result.add_error(f"Failed to upload: {file_path}")
+            return
+        
+        folder = self.organizer.get_folder_for_problem(problem)
+        if self.manifest is not None:
+            self.manifest.record_file(problem, folder, file_path)
+            if submission_id is not None and blob_sha is not None:
+                self.manifest.record_submission(submission_id, file_path, version, blob_sha)
+        
+        if status == UploadStatus.UNCHANGED:
+            # Already identical in the repository - nothing was written
+            result.files_skipped += 1
+            return
+        
+        if status == UploadStatus.UPDATED:
+            result.files_updated += 1
+        else:
+            result.files_created += 1
+        result.add_synced_problem(problem.title)
+        
+        # Track by tag
+        result.increment_tag_count(folder)
+    
+    def _load_manifest(self) -> SyncManifest:
+        """
+        Load the sync manifest from the repository or the local manifest file
+        
+        Returns:
+            SyncManifest (empty before the first run)
+        """
+        if self.settings.manifest_in_repo:
+            text = self.storage.get_file_content(MANIFEST_REPO_PATH, self.settings.github_branch)
+            if text:
+                try:
+                    return SyncManifest.from_json(text)
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.warning(f"Could not read {MANIFEST_REPO_PATH}: {str(e)} - using local manifest")
+        
+        return SyncManifest.load(self.settings.manifest_file)
+    
+    def _save_manifest(self, result: SyncResult):
+        """
+        Persist the manifest and rewrite the README and the indexes of changed folders
+        
+        Index files (and the manifest, when kept in the repository) go out
+        in one extra commit, only if something changed.
+        
+        Args:
+            result: Result to record failures in
+        """
+        manifest = self.manifest
+        if manifest is None:
+            return
+        
+        index_files = self.index_generator.build(manifest) if self.settings.generate_readme else []
+        files = list(index_files)
+        
+        # Serialize as if the commit succeeds, so the copy in the repository has no pending folders
+        pending = set(manifest.pending_folders)
+        self.index_generator.mark_written(manifest)
+        text = manifest.to_json()
+        if self.settings.manifest_in_repo and manifest.changed:
+            files.append((MANIFEST_REPO_PATH, text))
+        
+        if files:
+            if index_files:
+                message = COMMIT_MESSAGES["index"].format(count=len(index_files) - 1)
+            else:
+                message = COMMIT_MESSAGES["manifest"]
+            statuses = self.storage.commit_files(
+                files,
+                commit_message=message,
+                branch=self.settings.github_branch,
+                max_workers=self.settings.upload_workers
+            )
+            if not all(statuses.get(path) not in (None, UploadStatus.FAILED) for path, _ in files):
+                # Folders stay pending and are rewritten by the next run
+                result.add_error("Failed to update README indexes and manifest")
+                manifest.pending_folders = pending
+                text = manifest.to_json()
+        
+        try:
+            manifest.save(self.settings.manifest_file, text)
+            if not manifest.pending_folders:
+                manifest.changed = False  # Matches what is stored again
+        except OSError as e:
+            logger.error(f"Failed to save sync manifest: {str(e)}")
+        
+        summary = manifest.summary()
+        logger.info(f"Manifest: {summary['submissions']} submissions in {summary['files']} files "
+                    f"across {summary['problems']} problems")
+    
+    def _save_state(self, state: SyncState, newest: Optional[Tuple[int, int]],
+                    written: List[Tuple[str, int]], result: SyncResult):
+        """
+        Persist the high-water mark and per-problem version counts
+        
+        The mark only advances when the whole history was walked and the run
+        had no errors, so skipped submissions and failed uploads are retried
+        by the next incremental run.
+        
+        Args:
+            state: State loaded at the start of the run
+            newest: (timestamp, submission ID) of the newest fetched submission
+            written: (problem slug, version) of each file written this run
+            result: Result of this run
+        """
+        if not result.history_complete:
+            logger.warning("Submission history is incomplete - keeping previous incremental sync mark")
+            return
+        if result.errors:
+            logger.warning("Sync had errors - keeping previous incremental sync mark")
+            return
+        
+        for slug, version in written:
+            state.problem_versions[slug] = max(state.problem_versions.get(slug, 0), version, 1)
+        
+        if newest:
+            state.advance(*newest)
+        
+        try:
+            state.save(self.settings.state_file)
+        except OSError as e:
+            logger.error(f"Failed to save sync state: {str(e)}")
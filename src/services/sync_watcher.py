@@ -0,0 +1,120 @@
+"""
+Sync watcher
+Re-runs a long-lived SyncService on an interval
+"""
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from src.config.constants import MAX_WATCH_JITTER, MIN_WATCH_INTERVAL
+from src.config.enums import StorageBackend, SyncMode
+from src.models.sync_result import SyncResult
+from src.services.sync_service import SyncService
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SyncWatcher:
+    """
+    Run syncs on an interval with one SyncService
+    
+    The service, its HTTP sessions, caches and manifest stay in memory
+    between runs, so a run that finds nothing new costs a request or two
+    instead of a process start. Intervals are measured from the start of
+    one sync to the start of the next and randomly stretched or shrunk by
+    the jitter fraction, so several watchers started together drift apart.
+    """
+    
+    def __init__(self, service: SyncService, interval: float, jitter: float = 0.0,
+                 days_back: Optional[int] = None, mode: Optional[SyncMode] = None,
+                 profile: Optional[bool] = None, on_result: Optional[Callable[[SyncResult], None]] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize watcher
+        
+        Args:
+            service: Service to run syncs with
+            interval: Seconds between the starts of two syncs
+            jitter: Fraction of the interval each wait may randomly deviate by
+            days_back: Window of each sync (None = use config)
+            mode: Mode of each sync (None = use config)
+            profile: Profile each sync (None = use config)
+            on_result: Called with the result of each sync
+            seed: Seed of the jitter (None = random)
+        
+        Raises:
+            ValueError: If the service writes an archive
+        """
+        if service.settings.storage_backend in (StorageBackend.TAR, StorageBackend.ZIP):
+            # Each run would replace the archive, only to write the same files again
+            raise ValueError(f"Watch mode is not supported by the "
+                             f"{service.settings.storage_backend.value} backend")
+        
+        self.service = service
+        self.interval = max(MIN_WATCH_INTERVAL, interval)
+        self.jitter = min(max(0.0, jitter), MAX_WATCH_JITTER)
+        self.days_back = days_back
+        self.mode = mode
+        self.profile = profile
+        self.on_result = on_result
+        self.runs = 0
+        self._random = random.Random(seed)
+        self._stop = threading.Event()
+        
+        if self.interval != interval:
+            logger.warning(f"Watch interval raised to the minimum of {MIN_WATCH_INTERVAL}s")
+    
+    def next_interval(self) -> float:
+        """Get the jittered seconds until the next sync starts"""
+        return self.interval * (1 + self._random.uniform(-self.jitter, self.jitter))
+    
+    def run(self, max_runs: int = 0) -> int:
+        """
+        Sync until stopped
+        
+        A sync that fails is logged and retried at the next interval.
+        
+        Args:
+            max_runs: Stop after this many syncs (0 = until stop() is called)
+        
+        Returns:
+            Number of syncs run
+        """
+        logger.info(f"Watching: syncing every {self.interval:.0f}s (±{self.jitter:.0%})")
+        
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                result = self.service.sync(days_back=self.days_back, mode=self.mode, profile=self.profile)
+            except Exception as e:
+                # sync() records its own failures, this only catches bugs around it
+                logger.error(f"Sync run failed: {str(e)}", exc_info=True)
+                result = None
+            self.runs += 1
+            
+            if result is not None and self.on_result is not None:
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    logger.error(f"Result handler failed: {str(e)}")
+            
+            if max_runs and self.runs >= max_runs:
+                break
+            
+            delay = max(0.0, self.next_interval() - (time.monotonic() - started))
+            logger.info(f"Next sync in {delay:.0f}s")
+            self._stop.wait(delay)
+        
+        logger.info(f"Watch stopped after {self.runs} sync(s)")
+        return self.runs
+    
+    @property
+    def stopping(self) -> bool:
+        """Whether stop() was called"""
+        return self._stop.is_set()
+    
+    def stop(self):
+        """Stop after the current sync (safe to call from signal handlers and other threads)"""
+        self._stop.set()
@@ -1,9 +1,11 @@
 """
 Helper utility functions
 """
+import hashlib
 import re
-from typing import List
-from src.config.constants import INVALID_FILENAME_CHARS, MAX_FILENAME_LENGTH
+from functools import lru_cache
+from typing import List, Optional
+from src.config.constants import FILENAME_CACHE_SIZE, INVALID_FILENAME_CHARS, MAX_FILENAME_LENGTH
 
 
 def sanitize_filename(filename: str) -> str:
@@ -33,10 +35,13 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+@lru_cache(maxsize=FILENAME_CACHE_SIZE)
 def slug_to_filename(slug: str, version: int = 0, extension: str = ".py") -> str:
     """
     Convert problem slug to filename
     
+    Results are cached, since every sync names the same problems again.
+    
     Args:
         slug: Problem slug (e.g., "two-sum")
         version: Version number (0 for single version)
@@ -123,3 +128,35 @@ def format_memory(memory: str) -> str:
     if not memory or memory == "N/A":
         return "N/A"
     return memory
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds
+    
+    Args:
+        value: Header value
+        
+    Returns:
+        Delay in seconds or None if missing or not numeric
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def git_blob_sha(content: str) -> str:
+    """
+    Compute the git blob SHA-1 of file content, as GitHub reports it
+    
+    Args:
+        content: File content (encoded as UTF-8)
+        
+    Returns:
+        40-character hex SHA
+    """
+    data = content.encode('utf-8')
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
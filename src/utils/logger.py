@@ -4,7 +4,9 @@ Logging utilities
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
+
+_console_stream: TextIO = sys.stdout  # Where console handlers write (see set_console_stream)
 
 
 def get_logger(name: str, log_file: Optional[str] = None, 
@@ -33,7 +35,7 @@ def get_logger(name: str, log_file: Optional[str] = None,
         )
         
         # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = logging.StreamHandler(_console_stream)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
         
@@ -62,7 +64,27 @@ def setup_logging(log_file: str = "logs/sync.log", level: str = "INFO"):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S',
         handlers=[
-            logging.StreamHandler(sys.stdout),
+            logging.StreamHandler(_console_stream),
             logging.FileHandler(log_file)
         ]
     )
+
+
+def set_console_stream(stream: TextIO):
+    """
+    Send console logging to another stream, e.g. stderr when stdout carries data
+    
+    Args:
+        stream: Stream for loggers configured so far and from now on
+    """
+    global _console_stream
+    _console_stream = stream
+    
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            # FileHandler is a StreamHandler too, but must keep its file
+            if type(handler) is logging.StreamHandler:
+                handler.setStream(stream)
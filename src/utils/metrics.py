@@ -0,0 +1,320 @@
+"""
+Sync metrics
+Per-stage timings, per-endpoint request counters and latency histograms
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.config.constants import METRICS_LATENCY_BUCKETS, METRICS_PREFIX, METRICS_QUANTILES
+
+
+class LatencyHistogram:
+    """
+    Cumulative latency histogram with fixed bucket bounds
+    
+    Memory is constant in the number of observations. Quantiles are
+    interpolated linearly inside the bucket they fall in, the way
+    Prometheus' histogram_quantile() does, with the largest observation
+    bounding the last bucket.
+    """
+    
+    def __init__(self, bounds: Tuple[float, ...] = METRICS_LATENCY_BUCKETS):
+        """
+        Initialize histogram
+        
+        Args:
+            bounds: Ascending upper bucket bounds in seconds (+Inf is implied)
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Per bucket, not cumulative
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds: float):
+        """Record one latency"""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+    
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram with the same bounds to this one"""
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile
+        
+        Args:
+            q: Quantile between 0 and 1
+        
+        Returns:
+            Latency in seconds (0.0 without observations)
+        """
+        if self.count == 0:
+            return 0.0
+        
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Bucket counts as Prometheus reports them: (le, observations <= le)"""
+        buckets = []
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            buckets.append((f"{bound:g}", total))
+        buckets.append(("+Inf", self.count))
+        return buckets
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary with quantiles, for JSON export"""
+        data: Dict[str, Any] = {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "max": round(self.max, 6)
+        }
+        for q in METRICS_QUANTILES:
+            data[f"p{int(q * 100)}"] = round(self.quantile(q), 6)
+        data["buckets"] = dict(self.cumulative())
+        return data
+
+
+class EndpointStats:
+    """Request counters and latencies of one endpoint"""
+    
+    __slots__ = ("requests", "retries", "throttled", "errors", "bytes_sent", "bytes_received", "latency")
+    
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0  # 429 responses
+        self.errors = 0  # Other failed responses and transport errors
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters and latency summary, for JSON export"""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.to_dict()
+        }
+
+
+class SyncMetrics:
+    """
+    Metrics of one sync run, shared by the service, its clients and their threads
+    
+    Stage times are exclusive: time spent in a stage nested inside another
+    one on the same thread (rendering during an upload, waiting for the
+    rate limiter during a fetch) is counted for the inner stage only, so the
+    stages of a single-threaded run add up to its wall time. Stages on
+    worker threads overlap, so their sum can exceed the wall time.
+    """
+    
+    def __init__(self):
+        self.stages: Dict[str, float] = {}  # stage -> seconds
+        self.endpoints: Dict[Tuple[str, str], EndpointStats] = {}  # (service, endpoint) -> stats
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a block as a sync stage
+        
+        Args:
+            name: Stage name
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        
+        frame = [0.0]  # Time spent in nested stages
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            self.add_stage_time(name, elapsed - frame[0])
+    
+    def add_stage_time(self, name: str, seconds: float):
+        """Add time to a stage"""
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+    
+    def _endpoint(self, service: str, endpoint: str) -> EndpointStats:
+        """Get the stats of an endpoint (caller holds the lock)"""
+        stats = self.endpoints.get((service, endpoint))
+        if stats is None:
+            stats = self.endpoints[(service, endpoint)] = EndpointStats()
+        return stats
+    
+    def record_request(self, service: str, endpoint: str, seconds: float,
+                       status: Optional[int] = None, bytes_sent: int = 0, bytes_received: int = 0):
+        """
+        Record one HTTP request
+        
+        Args:
+            service: "leetcode" or "github"
+            endpoint: Operation or API call name
+            seconds: Request latency
+            status: HTTP status (None if the request failed without a response)
+            bytes_sent: Request body size
+            bytes_received: Response body size
+        """
+        with self._lock:
+            stats = self._endpoint(service, endpoint)
+            stats.requests += 1
+            if status == 429:
+                stats.throttled += 1
+            elif status is None or status >= 400:
+                stats.errors += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.latency.observe(seconds)
+    
+    def record_retry(self, service: str, endpoint: str):
+        """Record that a request is being retried"""
+        with self._lock:
+            self._endpoint(service, endpoint).retries += 1
+    
+    @contextmanager
+    def timed_request(self, service: str, endpoint: str, bytes_sent: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Time a request made through a library that hides the HTTP exchange
+        
+        The block may set "status" and "bytes_received" in the yielded dict.
+        A block that raises is recorded with the exception's "status"
+        attribute, if it has one.
+        
+        Args:
+            service: "leetcode" or "github"
+            endpoint: Operation or API call name
+            bytes_sent: Request body size
+        """
+        outcome: Dict[str, Any] = {"status": 200, "bytes_received": 0}
+        started = time.perf_counter()
+        try:
+            yield outcome
+        except Exception as e:
+            outcome["status"] = getattr(e, "status", None)
+            raise
+        finally:
+            self.record_request(service, endpoint, time.perf_counter() - started,
+                                outcome["status"], bytes_sent, outcome["bytes_received"])
+    
+    def service_latency(self, service: str) -> LatencyHistogram:
+        """Latency histogram over every endpoint of a service"""
+        merged = LatencyHistogram()
+        with self._lock:
+            for (name, _), stats in self.endpoints.items():
+                if name == service:
+                    merged.merge(stats.latency)
+        return merged
+    
+    def services(self) -> List[str]:
+        """Services with recorded requests"""
+        with self._lock:
+            return sorted({service for service, _ in self.endpoints})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dictionary
+        
+        Returns:
+            Stage times, per-service latency summaries and per-endpoint stats
+        """
+        with self._lock:
+            stages = {name: round(seconds, 6) for name, seconds in sorted(self.stages.items())}
+            endpoints: Dict[str, Dict[str, Any]] = {}
+            for (service, endpoint), stats in sorted(self.endpoints.items()):
+                endpoints.setdefault(service, {})[endpoint] = stats.to_dict()
+        
+        return {
+            "stages": stages,
+            "latency": {service: self.service_latency(service).to_dict() for service in self.services()},
+            "endpoints": endpoints
+        }
+    
+    def prometheus_lines(self, prefix: str = METRICS_PREFIX) -> List[str]:
+        """
+        Render stage times, counters and histograms in Prometheus text format
+        
+        Args:
+            prefix: Metric name prefix
+        
+        Returns:
+            Lines of the exposition, without a trailing newline
+        """
+        with self._lock:
+            stages = sorted(self.stages.items())
+            endpoints = sorted(self.endpoints.items())
+        
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent in each sync stage during the last run",
+            f"# TYPE {prefix}_stage_seconds gauge"
+        ]
+        lines.extend(f'{prefix}_stage_seconds{{stage="{_escape(name)}"}} {seconds:.6f}'
+                     for name, seconds in stages)
+        
+        counters = [
+            ("requests_total", "HTTP requests issued", "requests"),
+            ("retries_total", "Requests retried", "retries"),
+            ("throttled_total", "429 responses received", "throttled"),
+            ("request_errors_total", "Failed requests other than 429", "errors"),
+            ("sent_bytes_total", "Request body bytes sent", "bytes_sent"),
+            ("received_bytes_total", "Response body bytes received", "bytes_received")
+        ]
+        for name, description, attribute in counters:
+            lines.append(f"# HELP {prefix}_{name} {description} during the last run")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for (service, endpoint), stats in endpoints:
+                lines.append(f"{prefix}_{name}{{{_labels(service, endpoint)}}} {getattr(stats, attribute)}")
+        
+        lines.append(f"# HELP {prefix}_request_duration_seconds HTTP request latency during the last run")
+        lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+        for (service, endpoint), stats in endpoints:
+            labels = _labels(service, endpoint)
+            for bound, count in stats.latency.cumulative():
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {stats.latency.sum:.6f}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {stats.latency.count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(service: str, endpoint: str) -> str:
+    """Service and endpoint labels"""
+    return f'service="{_escape(service)}",endpoint="{_escape(endpoint)}"'
@@ -0,0 +1,152 @@
+"""
+Run profiler
+CPU profile and allocation snapshot of a sync run
+"""
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from src.config.constants import PROFILE_TOP_ALLOCATIONS, PROFILE_TOP_FUNCTIONS, PROFILE_TRACEMALLOC_FRAMES
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Before 3.12 cProfile only sees the thread that enabled it, so every thread
+# started during the run gets a profiler of its own. From 3.12 on cProfile
+# is built on sys.monitoring, which sees all threads but allows one profiler.
+PER_THREAD_PROFILERS = sys.version_info < (3, 12)
+
+# Allocations made by the profilers themselves
+IGNORED_ALLOCATIONS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, pstats.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>")
+)
+
+
+class RunProfiler:
+    """
+    Profile CPU time and memory allocations between start() and stop()
+    
+    stop() writes three files to a timestamped folder under the output
+    directory:
+        hotspots.txt     Functions by cumulative and by own time, all threads merged
+        profile.pstats   Raw profile, for pstats, snakeviz or gprof2dot
+        allocations.txt  Peak traced memory and the allocation sites that grew the most
+    """
+    
+    def __init__(self, directory: str, top_functions: int = PROFILE_TOP_FUNCTIONS,
+                 top_allocations: int = PROFILE_TOP_ALLOCATIONS, frames: int = PROFILE_TRACEMALLOC_FRAMES):
+        """
+        Initialize profiler
+        
+        Args:
+            directory: Directory the run's report folder is created in
+            top_functions: Functions listed per ordering in the hotspot report
+            top_allocations: Allocation sites listed in the memory report
+            frames: Stack depth recorded per allocation
+        """
+        self.directory = directory
+        self.top_functions = top_functions
+        self.top_allocations = top_allocations
+        self.frames = frames
+        self.output_dir: Optional[str] = None
+        self._profilers: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._owns_tracemalloc = False
+        self._started = 0.0
+    
+    def start(self):
+        """Start profiling the calling thread and every thread started afterwards"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracemalloc = True
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.take_snapshot().filter_traces(IGNORED_ALLOCATIONS)
+        
+        profiler = cProfile.Profile()
+        self._profilers = [profiler]
+        if PER_THREAD_PROFILERS:
+            threading.setprofile(self._profile_thread)
+        self._started = time.perf_counter()
+        profiler.enable()
+    
+    def _profile_thread(self, frame, event, arg):
+        """Profile hook of new threads: replace itself with a profiler for the thread"""
+        profiler = cProfile.Profile()
+        with self._lock:
+            self._profilers.append(profiler)
+        profiler.enable()
+    
+    def stop(self) -> str:
+        """
+        Stop profiling and write the reports
+        
+        Returns:
+            Folder the reports were written to
+        """
+        self._profilers[0].disable()
+        wall = time.perf_counter() - self._started
+        if PER_THREAD_PROFILERS:
+            threading.setprofile(None)
+        
+        snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED_ALLOCATIONS)
+        current, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        
+        output_dir = Path(self.directory) / datetime.now().strftime("%Y%m%d-%H%M%S")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = str(output_dir)
+        
+        with self._lock:
+            profilers = list(self._profilers)
+        # Profilers of threads still running are snapshotted as they are
+        stats = pstats.Stats(profilers[0], stream=io.StringIO())
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+        stats.dump_stats(str(output_dir / "profile.pstats"))
+        
+        self._write_hotspots(output_dir / "hotspots.txt", stats, wall, len(profilers))
+        self._write_allocations(output_dir / "allocations.txt", snapshot, current, peak)
+        
+        logger.info(f"Profile written to {self.output_dir}")
+        return self.output_dir
+    
+    def _write_hotspots(self, path: Path, stats: pstats.Stats, wall: float, threads: int):
+        """Write the functions that took the most time, by cumulative and by own time"""
+        with open(path, 'w') as f:
+            f.write(f"Wall time: {wall:.3f}s, threads profiled: {threads}\n")
+            f.write("CPU times of all threads are merged, so they can exceed the wall time.\n")
+            for order, title in (("cumulative", "cumulative time (including callees)"),
+                                 ("tottime", "own time (excluding callees)")):
+                f.write(f"\n{'=' * 30} Top {self.top_functions} by {title} {'=' * 30}\n")
+                stats.stream = f
+                stats.sort_stats(order).print_stats(self.top_functions)
+    
+    def _write_allocations(self, path: Path, snapshot: tracemalloc.Snapshot, current: int, peak: int):
+        """Write peak memory and the allocation sites that grew the most during the run"""
+        growth = snapshot.compare_to(self._baseline, "lineno")
+        growth.sort(key=lambda stat: stat.size_diff, reverse=True)
+        
+        with open(path, 'w') as f:
+            f.write(f"Traced memory at exit: {current / 2**20:.1f} MiB, peak: {peak / 2**20:.1f} MiB\n")
+            f.write(f"\n{'=' * 30} Top {self.top_allocations} sites by growth {'=' * 30}\n")
+            for stat in growth[:self.top_allocations]:
+                f.write(f"{stat}\n")
+            
+            f.write(f"\n{'=' * 30} Largest live allocations by stack {'=' * 30}\n")
+            for stat in snapshot.statistics("traceback")[:5]:
+                f.write(f"\n{stat.size / 2**10:.1f} KiB in {stat.count} blocks\n")
+                for line in stat.traceback.format():
+                    f.write(f"{line}\n")
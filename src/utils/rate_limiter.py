@@ -0,0 +1,161 @@
+"""
+Rate limiting utilities
+Token bucket with adaptive (AIMD) pacing, shared by threads and async tasks
+"""
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from src.config.constants import (
+    RATE_LIMIT_REQUESTS,
+    RATE_LIMIT_PERIOD,
+    RATE_LIMIT_MIN_REQUESTS,
+    RATE_LIMIT_MAX_REQUESTS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_INCREASE_STEP,
+    RATE_LIMIT_DECREASE_FACTOR,
+    RATE_LIMIT_SLOW_RESPONSE
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with additive-increase/multiplicative-decrease
+    
+    Every request takes one token. Tokens refill at the current rate, which
+    grows by a fixed step after each healthy response and is cut by a factor
+    after a 429 or a slow response. Callers reserve a token under a lock and
+    then sleep outside it, so the same limiter can pace worker threads
+    (acquire) and asyncio tasks (acquire_async) at the same time.
+    """
+    
+    def __init__(self, requests: int = RATE_LIMIT_REQUESTS, period: float = RATE_LIMIT_PERIOD,
+                 min_requests: int = RATE_LIMIT_MIN_REQUESTS,
+                 max_requests: int = RATE_LIMIT_MAX_REQUESTS,
+                 burst: int = RATE_LIMIT_BURST,
+                 increase_step: float = RATE_LIMIT_INCREASE_STEP,
+                 decrease_factor: float = RATE_LIMIT_DECREASE_FACTOR,
+                 slow_response: float = RATE_LIMIT_SLOW_RESPONSE):
+        """
+        Initialize rate limiter
+        
+        Args:
+            requests: Starting request budget per period
+            period: Budget period in seconds
+            min_requests: Lowest budget per period the limiter backs off to
+            max_requests: Highest budget per period the limiter grows to
+            burst: Maximum number of tokens that can accumulate
+            increase_step: Requests per second added after each healthy response
+            decrease_factor: Multiplier applied to the rate on 429 or slow responses
+            slow_response: Latency in seconds treated as a congestion signal
+        """
+        self.min_rate = min_requests / period
+        self.max_rate = max_requests / period
+        self.rate = min(max(requests / period, self.min_rate), self.max_rate)
+        self.burst = max(1, burst)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_response = slow_response
+        
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._last_decrease = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        """Add tokens earned since the last refill (caller holds the lock)"""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+    
+    def _reserve(self) -> float:
+        """
+        Take one token, borrowing against future refills if necessary
+        
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+    
+    def acquire(self):
+        """Block the current thread until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def on_success(self, latency: float):
+        """
+        Record a completed request
+        
+        Args:
+            latency: Request latency in seconds
+        """
+        if latency >= self.slow_response:
+            self._decrease(f"slow response ({latency:.1f}s)")
+            return
+        
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+    
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """
+        Record a throttled (429) or timed-out request
+        
+        Args:
+            retry_after: Server-provided Retry-After delay in seconds, if any
+        """
+        self._decrease("rate limited", retry_after)
+    
+    def on_server_error(self, status: int, retry_after: Optional[float] = None):
+        """
+        Record a request that failed with a 5xx status
+        
+        An overloaded server is treated like a throttle rather than a success.
+        
+        Args:
+            status: HTTP status code
+            retry_after: Server-provided Retry-After delay in seconds, if any
+        """
+        self._decrease(f"server error ({status})", retry_after)
+    
+    def _decrease(self, reason: str, retry_after: Optional[float] = None):
+        """Cut the rate multiplicatively, at most once per refill interval"""
+        with self._lock:
+            now = time.monotonic()
+            
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            
+            # Responses to requests sent before the last cut carry no new information
+            if now - self._last_decrease < 1.0 / self.rate:
+                return
+            
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_decrease = now
+            rate = self.rate
+        
+        logger.warning(f"Backing off: {reason} - pacing at {rate * 60:.0f} requests/min")
+    
+    @property
+    def requests_per_minute(self) -> float:
+        """Current pacing rate in requests per minute"""
+        return self.rate * 60